@@ -0,0 +1,71 @@
+"""
+Compare the start up of pyexcel with and without lazy plugin discovery
+
+Run from the repository root::
+
+    python benchmarks/bench_import_time.py
+
+Each run is a new python process. It times ``import pyexcel`` and then
+the first call that needs a plugin, ``get_array`` of a csv string.
+"""
+
+import os
+import sys
+import json
+import tempfile
+import statistics
+import subprocess
+
+RUNS = 20
+
+SCRIPT = """
+import json, time
+started = time.perf_counter()
+import pyexcel
+imported = time.perf_counter()
+pyexcel.get_array(file_type="csv", file_content="1,2")
+used = time.perf_counter()
+print(json.dumps([imported - started, used - imported]))
+"""
+
+
+def run(environment):
+    imports, first_calls = [], []
+    for _ in range(RUNS):
+        output = subprocess.check_output(
+            [sys.executable, "-c", SCRIPT], env=environment
+        )
+        imported, first_call = json.loads(output)
+        imports.append(imported)
+        first_calls.append(first_call)
+    return statistics.median(imports), statistics.median(first_calls)
+
+
+def main():
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [os.getcwd(), environment.get("PYTHONPATH", "")]
+    )
+    environment.pop("PYEXCEL_LAZY_PLUGINS", None)
+    with tempfile.TemporaryDirectory() as folder:
+        lazy_environment = dict(
+            environment,
+            PYEXCEL_LAZY_PLUGINS="1",
+            PYEXCEL_PLUGIN_CACHE=os.path.join(folder, "plugins.json"),
+        )
+        # the first lazy run finds the plugins and writes the cache file
+        run(dict(lazy_environment))
+        for label, an_environment in (
+            ("eager", environment),
+            ("lazy", lazy_environment),
+        ):
+            imported, first_call = run(an_environment)
+            print(
+                f"{label:<6} import {imported * 1000:6.1f}ms"
+                f"  first get_array {first_call * 1000:6.1f}ms"
+                f"  total {(imported + first_call) * 1000:6.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
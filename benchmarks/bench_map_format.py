@@ -0,0 +1,87 @@
+"""
+Compare Sheet.map and Sheet.format with the cell by cell path
+
+Run from the repository root::
+
+    python benchmarks/bench_map_format.py
+
+The sheet has 100,000 rows and 10 columns, i.e. one million cells.
+"""
+
+import time
+from functools import partial
+
+import pyexcel as p
+from pyexcel.internal.sheets.formatters import to_format
+
+ROWS = 100000
+COLUMNS = 10
+
+
+def make_sheet(storage):
+    data = [
+        [row * COLUMNS + column for column in range(COLUMNS)]
+        for row in range(ROWS)
+    ]
+    return p.Sheet(data, storage=storage)
+
+
+def cell_by_cell_map(sheet, custom_function):
+    """How Sheet.map used to work"""
+    for row in sheet.row_range():
+        for column in sheet.column_range():
+            value = sheet.cell_value(row, column)
+            value = custom_function(value)
+            sheet.cell_value(row, column, value)
+
+
+def cell_by_cell_format(sheet, formatter):
+    """How Sheet.format used to work"""
+    cell_by_cell_map(sheet, partial(to_format, formatter))
+
+
+def timed(action, storage):
+    sheet = make_sheet(storage)
+    started = time.perf_counter()
+    action(sheet)
+    return time.perf_counter() - started
+
+
+def compare(label, old, new):
+    for storage in ("row", "columnar"):
+        before = timed(old, storage)
+        after = timed(new, storage)
+        print(
+            f"{label:<8} {storage:<9} cell by cell {before:7.3f}s"
+            f"  bulk {after:7.3f}s  x{before / after:.1f}"
+        )
+
+
+def main():
+    def increment(value):
+        return value + 1
+
+    compare(
+        "map",
+        lambda sheet: cell_by_cell_map(sheet, increment),
+        lambda sheet: sheet.map(increment),
+    )
+    compare(
+        "format",
+        lambda sheet: cell_by_cell_format(sheet, float),
+        lambda sheet: sheet.format(float),
+    )
+    try:
+        import numpy
+    except ImportError:
+        print("numpy is not installed, skipped the ufunc run")
+    else:
+        compare(
+            "ufunc",
+            lambda sheet: cell_by_cell_map(sheet, numpy.sqrt),
+            lambda sheet: sheet.map(numpy.sqrt),
+        )
+
+
+if __name__ == "__main__":
+    main()
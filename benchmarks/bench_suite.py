@@ -0,0 +1,333 @@
+"""
+Time the signature functions and the Sheet operations, and the peak
+memory they take
+
+Run from the repository root::
+
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --rows 100000 --save baseline.json
+    python benchmarks/bench_suite.py --rows 100000 --compare baseline.json
+
+The fixtures are generated: a sheet of --rows rows and --columns
+columns, a header row on top, of integers, floats and strings. Each
+benchmark is run --repeat times and the fastest run is reported. The
+peak memory is that of one more run, traced by tracemalloc, which is
+not timed as tracing slows python down.
+
+With --compare, a benchmark that got slower or took more memory than
+--tolerance allows is reported and the exit code is 1.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from itertools import cycle
+
+# the pyexcel of this checkout is timed, installed or not
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyexcel as p  # noqa: E402
+from pyexcel import cookbook  # noqa: E402
+from pyexcel.internal.sheets.matrix import uniform  # noqa: E402
+
+BENCHMARKS = []
+
+
+def benchmark(function):
+    """
+    Add a benchmark. It is called with the fixtures and returns the
+    callable to measure, so that preparing the data is not measured
+    """
+    BENCHMARKS.append(function)
+    return function
+
+
+class Fixtures:
+    """Generated data and the files made of it"""
+
+    def __init__(self, rows, columns, folder):
+        self.rows = rows
+        self.columns = columns
+        self.folder = folder
+        self.header = [f"Column {column}" for column in range(columns)]
+        self.csv_file = os.path.join(folder, "fixture.csv")
+        p.save_as(array=self.array(), dest_file_name=self.csv_file)
+        self.csv_files = []
+        for index in range(2):
+            file_name = os.path.join(folder, f"fixture{index}.csv")
+            p.save_as(array=self.array(), dest_file_name=file_name)
+            self.csv_files.append(file_name)
+        self.__outputs = 0
+
+    def array(self):
+        """A new two dimensional array, the header row first"""
+        kinds = cycle((int, float, str))
+        makers = [next(kinds) for _ in range(self.columns)]
+        data = [list(self.header)]
+        for row in range(self.rows):
+            data.append(
+                [
+                    make(row * self.columns + column)
+                    for column, make in enumerate(makers)
+                ]
+            )
+        return data
+
+    def ragged_array(self):
+        """A new array of which every other row is a cell short"""
+        data = self.array()
+        for row in data[1::2]:
+            row.pop()
+        return data
+
+    def records(self):
+        """The rows as dictionaries, keyed by the header"""
+        return [dict(zip(self.header, row)) for row in self.array()[1:]]
+
+    def sheet(self, **keywords):
+        return p.Sheet(self.array(), **keywords)
+
+    def output_file(self, file_type):
+        """A file name not used yet"""
+        self.__outputs += 1
+        return os.path.join(self.folder, f"output{self.__outputs}.{file_type}")
+
+
+@benchmark
+def get_sheet(fixtures):
+    return lambda: p.get_sheet(file_name=fixtures.csv_file)
+
+
+@benchmark
+def get_records(fixtures):
+    return lambda: p.get_records(file_name=fixtures.csv_file)
+
+
+@benchmark
+def iget_records(fixtures):
+    def read():
+        for _ in p.iget_records(file_name=fixtures.csv_file):
+            pass
+        p.free_resources()
+
+    return read
+
+
+@benchmark
+def save_as(fixtures):
+    array = fixtures.array()
+    return lambda: p.save_as(
+        array=array, dest_file_name=fixtures.output_file("csv")
+    )
+
+
+@benchmark
+def isave_as(fixtures):
+    records = fixtures.records()
+    return lambda: p.isave_as(
+        records=iter(records), dest_file_name=fixtures.output_file("csv")
+    )
+
+
+@benchmark
+def sheet_construction(fixtures):
+    array = fixtures.array()
+    return lambda: p.Sheet(array)
+
+
+@benchmark
+def sheet_uniform(fixtures):
+    array = fixtures.ragged_array()
+    return lambda: uniform(array)
+
+
+@benchmark
+def column_at(fixtures):
+    sheet = fixtures.sheet()
+
+    def read_columns():
+        for column in range(sheet.number_of_columns()):
+            sheet.column_at(column)
+
+    return read_columns
+
+
+@benchmark
+def sheet_format(fixtures):
+    sheet = fixtures.sheet(name_columns_by_row=0)
+    return lambda: sheet.format(str)
+
+
+@benchmark
+def sheet_map(fixtures):
+    sheet = fixtures.sheet(name_columns_by_row=0)
+    return lambda: sheet.map(str)
+
+
+@benchmark
+def transpose(fixtures):
+    sheet = fixtures.sheet()
+    # transpose only marks the sheet, the rows are laid out when read
+    return lambda: (sheet.transpose(), sheet.to_array())
+
+
+@benchmark
+def to_records(fixtures):
+    sheet = fixtures.sheet(name_columns_by_row=0)
+    return lambda: list(sheet.to_records())
+
+
+@benchmark
+def to_dict(fixtures):
+    sheet = fixtures.sheet(name_columns_by_row=0)
+    return sheet.to_dict
+
+
+@benchmark
+def project(fixtures):
+    sheet = fixtures.sheet(name_columns_by_row=0)
+    new_order = list(reversed(fixtures.header))
+    return lambda: sheet.project(new_order)
+
+
+@benchmark
+def book_add(fixtures):
+    book = p.Book({"first": fixtures.array()})
+    other = p.Book({"second": fixtures.array()})
+    return lambda: book + other
+
+
+@benchmark
+def merge_files(fixtures):
+    return lambda: cookbook.merge_files(
+        fixtures.csv_files, out_file_name=fixtures.output_file("csv")
+    )
+
+
+@benchmark
+def merge_csv_to_a_book(fixtures):
+    return lambda: cookbook.merge_csv_to_a_book(
+        fixtures.csv_files, out_file_name=fixtures.output_file("csvz")
+    )
+
+
+def measure(function, fixtures, repeat):
+    """Return the fastest of the runs and the peak memory of one run"""
+    fastest = None
+    for _ in range(repeat):
+        action = function(fixtures)
+        started = time.perf_counter()
+        action()
+        seconds = time.perf_counter() - started
+        if fastest is None or seconds < fastest:
+            fastest = seconds
+    action = function(fixtures)
+    tracemalloc.start()
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": fastest, "peak_bytes": peak}
+
+
+def run(options):
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        fixtures = Fixtures(options.rows, options.columns, folder)
+        for function in BENCHMARKS:
+            name = function.__name__
+            if options.only and not any(
+                part in name for part in options.only
+            ):
+                continue
+            results[name] = measure(function, fixtures, options.repeat)
+            print_result(name, results[name])
+    return {
+        "rows": options.rows,
+        "columns": options.columns,
+        "python": platform.python_version(),
+        "pyexcel": p.__version__,
+        "results": results,
+    }
+
+
+def print_result(name, result):
+    print(
+        f"{name:<22} {result['seconds'] * 1000:10.2f}ms"
+        f" {result['peak_bytes'] / 1024 / 1024:9.2f}MB"
+    )
+
+
+def compare(report, baseline, tolerance):
+    """Print the changes against the baseline and return the regressions"""
+    if (report["rows"], report["columns"]) != (
+        baseline["rows"],
+        baseline["columns"],
+    ):
+        print(
+            "warning: the baseline was run with"
+            f" {baseline['rows']} rows and {baseline['columns']} columns"
+        )
+    regressions = []
+    print(f"\n{'':<22} {'time':>9} {'memory':>9}  (now / baseline)")
+    for name, result in report["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratios = {
+            field: result[field] / max(before[field], 1e-9)
+            for field in ("seconds", "peak_bytes")
+        }
+        worse = [
+            field for field, ratio in ratios.items() if ratio > 1 + tolerance
+        ]
+        print(
+            f"{name:<22} {ratios['seconds']:9.2f} {ratios['peak_bytes']:9.2f}"
+            + ("  regressed" if worse else "")
+        )
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--only",
+        nargs="*",
+        help="run the benchmarks of which the name has any of these",
+    )
+    parser.add_argument("--save", help="write the results to a json file")
+    parser.add_argument("--compare", help="a json file written by --save")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="how much slower or bigger is a regression, 0.2 for 20%%",
+    )
+    options = parser.parse_args(arguments)
+    report = run(options)
+    if options.save:
+        with open(options.save, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+    if options.compare:
+        with open(options.compare, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, options.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regressed: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
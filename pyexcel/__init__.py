@@ -10,7 +10,9 @@ and xlsm. It does not support formulas, styles and charts.
 :license: New BSD License, see LICENSE for more details
 """
 
-from .book import Book
+from importlib import import_module
+
+from .book import Book, LazyBook
 from .core import (
     save_as,
     get_book,
@@ -29,23 +31,63 @@ from .core import (
 from .sheet import Sheet
 
 # flake8: noqa
-from .cookbook import (
-    split_a_book,
-    merge_all_to_a_book,
-    merge_csv_to_a_book,
-    extract_a_sheet_from_a_book,
+from .__version__ import __author__, __version__
+from .internal.cache import (
+    cache_info,
+    clear_cache,
+    enable_cache,
+    disable_cache,
 )
-from .deprecated import (
-    Reader,
-    BookReader,
-    SeriesReader,
-    ColumnSeriesReader,
-    load,
-    load_book,
-    load_from_dict,
-    load_from_memory,
-    load_from_records,
-    load_book_from_memory,
+from .internal.http_cache import (
+    clear_http_cache,
+    enable_http_cache,
+    disable_http_cache,
 )
-from .__version__ import __author__, __version__
+from .internal.discovery import is_lazy as _is_lazy
 from .internal.garbagecollector import free_resources
+from .internal.sheets.aggregation import aggregate_records
+from .internal.instrumentation import (
+    TimingCollector,
+    add_timing_listener,
+    enable_memory_tracking,
+    remove_timing_listener,
+    disable_memory_tracking,
+)
+
+# imported when first used in lazy mode, as most programs use neither
+LAZY_ATTRIBUTES = {
+    "split_a_book": "cookbook",
+    "merge_all_to_a_book": "cookbook",
+    "merge_csv_to_a_book": "cookbook",
+    "extract_a_sheet_from_a_book": "cookbook",
+    "Reader": "deprecated",
+    "BookReader": "deprecated",
+    "SeriesReader": "deprecated",
+    "ColumnSeriesReader": "deprecated",
+    "load": "deprecated",
+    "load_book": "deprecated",
+    "load_from_dict": "deprecated",
+    "load_from_memory": "deprecated",
+    "load_from_records": "deprecated",
+    "load_book_from_memory": "deprecated",
+}
+
+
+def __getattr__(name):
+    module_name = LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
+
+
+if not _is_lazy():
+    # so that "from pyexcel import *" brings them in, as it always did
+    for _name in LAZY_ATTRIBUTES:
+        __getattr__(_name)
+    del _name
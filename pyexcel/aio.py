@@ -0,0 +1,131 @@
+"""
+pyexcel.aio
+~~~~~~~~~~~~~~~~~~~
+
+The signature functions for asyncio
+
+The reads and writes, including url downloads, run in a thread pool so
+that the event loop is free meanwhile. aiget_records hands the records
+over in batches, so a big import gives way to other tasks between them.
+
+Example::
+
+    >>> import asyncio
+    >>> from pyexcel import aio
+    >>> sheet = asyncio.run(aio.aget_sheet(array=[[1, 2], [3, 4]]))
+    >>> sheet.row[1]
+    [3, 4]
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License
+"""
+
+import asyncio
+import functools
+import contextvars
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+
+from pyexcel import core, constants
+from pyexcel.internal.generators import chunked
+from pyexcel.internal.garbagecollector import free_resources
+
+EXECUTOR = None
+_EXECUTOR_LOCK = Lock()
+
+
+def set_executor(executor):
+    """Run the reads and writes in this executor from now on
+
+    :param executor: a :class:`concurrent.futures.ThreadPoolExecutor`,
+                     or None for a pool of pyexcel's own
+    """
+    global EXECUTOR
+    with _EXECUTOR_LOCK:
+        EXECUTOR = executor
+
+
+def _executor():
+    global EXECUTOR
+    with _EXECUTOR_LOCK:
+        if EXECUTOR is None:
+            EXECUTOR = ThreadPoolExecutor(thread_name_prefix="pyexcel-aio")
+        return EXECUTOR
+
+
+async def _run(function, *args, executor=None, **keywords):
+    """Call a function in the thread pool, in the current context"""
+    call = functools.partial(
+        contextvars.copy_context().run, function, *args, **keywords
+    )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or _executor(), call)
+
+
+async def aget_sheet(**keywords):
+    """Get a :class:`pyexcel.Sheet`, see :meth:`pyexcel.get_sheet`"""
+    return await _run(core.get_sheet, **keywords)
+
+
+async def aget_book(**keywords):
+    """Get a :class:`pyexcel.Book`, see :meth:`pyexcel.get_book`"""
+    return await _run(core.get_book, **keywords)
+
+
+async def aget_records(**keywords):
+    """Get a list of records, see :meth:`pyexcel.get_records`"""
+    return await _run(core.get_records, **keywords)
+
+
+async def asave_as(**keywords):
+    """Save a sheet to another source, see :meth:`pyexcel.save_as`"""
+    return await _run(core.save_as, **keywords)
+
+
+async def aiget_records(
+    batch_size=constants.DEFAULT_AIO_BATCH_SIZE, **keywords
+):
+    """Yield the records read on demand, see :meth:`pyexcel.iget_records`
+
+    The records are read batch_size at a time in a thread of their own,
+    which closes the file once the records run out or the generator is
+    closed. So there is no need to call free_resources.
+
+    Example::
+
+        >>> import asyncio
+        >>> from pyexcel import aio
+        >>> async def names():
+        ...     records = aio.aiget_records(array=[["name"], ["a"], ["b"]])
+        ...     return [record["name"] async for record in records]
+        >>> asyncio.run(names())
+        ['a', 'b']
+
+    :param int batch_size: the records taken from the thread at a time
+    """
+    batches = None
+    # the files opened by iget_records are kept per thread until freed
+    executor = ThreadPoolExecutor(1, thread_name_prefix="pyexcel-aio")
+    try:
+        batches = await _run(
+            _read_batches, batch_size, executor=executor, **keywords
+        )
+        while True:
+            batch = await _run(next, batches, None, executor=executor)
+            if batch is None:
+                return
+            for record in batch:
+                yield record
+    finally:
+        await _run(_close, batches, executor=executor)
+        executor.shutdown(wait=False)
+
+
+def _read_batches(batch_size, **keywords):
+    return chunked(core.iget_records(**keywords), batch_size)
+
+
+def _close(batches):
+    if batches is not None:
+        batches.close()
+    free_resources()
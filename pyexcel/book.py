@@ -10,8 +10,11 @@ Excel book
 
 from pyexcel.sheet import Sheet
 from pyexcel._compact import OrderedDict
+from pyexcel.internal import core as sources
+from pyexcel.internal import garbagecollector as gc
 from pyexcel.internal.meta import BookMeta
 from pyexcel.internal.common import SheetIterator
+from pyexcel.internal.parallel import run_in_workers
 
 LOCAL_UUID = 0
 
@@ -23,7 +26,13 @@ class Book(BookMeta):
     For csv file, there will be just one sheet
     """
 
-    def __init__(self, sheets=None, filename="memory", path=None):
+    def __init__(
+        self,
+        sheets=None,
+        filename="memory",
+        path=None,
+        workers=None,
+    ):
         """
         Book constructor
 
@@ -32,28 +41,45 @@ class Book(BookMeta):
         :param sheets: a dictionary of data
         :param filename: the physical file
         :param path: the relative path or absolute path
+        :param workers: the number of threads that build the sheets, see
+                        :meth:`load_from_sheets`
         :param keywords: additional parameters to be passed on
         """
         self.filename = None
         self.__path = None
         self.__sheets = OrderedDict()
-        self.init(sheets=sheets, filename=filename, path=path)
+        self.init(sheets=sheets, filename=filename, path=path, workers=workers)
 
-    def init(self, sheets=None, filename="memory", path=None):
+    def init(self, sheets=None, filename="memory", path=None, workers=None):
         """independent function so that it could be called multiple times"""
         self.__path = path
         self.filename = filename
-        self.load_from_sheets(sheets)
+        self.load_from_sheets(sheets, workers=workers)
 
-    def load_from_sheets(self, sheets):
+    def load_from_sheets(self, sheets, workers=None):
         """
         Load content from existing sheets
 
         :param dict sheets: a dictionary of sheets. Each sheet is
                             a list of lists
+        :param int workers: build the sheets from the lists in this many
+                            threads. By default, one after another. The
+                            GIL of a standard CPython runs the threads
+                            one at a time, so it is no faster there
         """
         if sheets is None:
             return
+        arrays = [
+            (name, value)
+            for name, value in sheets.items()
+            if not isinstance(value, Sheet)
+        ]
+        built = dict(
+            zip(
+                (name for name, _ in arrays),
+                run_in_workers(_make_sheet, arrays, workers),
+            )
+        )
         for name in sheets.keys():
             value = sheets[name]
             if isinstance(value, Sheet):
@@ -61,7 +87,7 @@ class Book(BookMeta):
                 sheet.name = name
             else:
                 # array
-                sheet = Sheet(value, name)
+                sheet = built[name]
             # this sheets keep sheet order
             self.__sheets.update({name: sheet})
             # this provide the convenience of access the sheet
@@ -152,24 +178,22 @@ class Book(BookMeta):
 
         """
         content = OrderedDict()
-        current_dict = self.to_dict()
-        if len(current_dict) == 1:
-            for single_key in current_dict.keys():
-                new_key = f"{self.filename}_{single_key}"
-                content[new_key] = current_dict[single_key]
-        else:
-            content.update(current_dict)
+        single = len(self) == 1
+        for sheet in self:
+            new_key = sheet.name
+            if single:
+                new_key = f"{self.filename}_{sheet.name}"
+            content[new_key] = copy_sheet(sheet, new_key)
         if isinstance(other, Book):
-            other_dict = other.to_dict()
-            for key in other_dict.keys():
-                preferred = (
-                    f"{other.filename}_{key}" if len(other_dict) == 1 else key
-                )
+            single = len(other) == 1
+            for sheet in other:
+                key = sheet.name
+                preferred = f"{other.filename}_{key}" if single else key
                 new_key = _unique_key(preferred, content, base=key)
-                content[new_key] = other_dict[key]
+                content[new_key] = copy_sheet(sheet, new_key)
         elif isinstance(other, Sheet):
             new_key = _unique_key(other.name, content)
-            content[new_key] = other.array
+            content[new_key] = copy_sheet(other, new_key)
         else:
             raise TypeError
         output = Book()
@@ -191,7 +215,7 @@ class Book(BookMeta):
             for name in names:
                 preferred = other.filename if len(names) == 1 else name
                 new_key = _unique_key(preferred, self.__sheets, base=name)
-                self.__sheets[new_key] = Sheet(other[name].array, new_key)
+                self.__sheets[new_key] = copy_sheet(other[name], new_key)
         elif isinstance(other, Sheet):
             self._add_a_sheet(other)
         else:
@@ -205,7 +229,7 @@ class Book(BookMeta):
         :param sheet: an instance of Sheet
         """
         new_key = _unique_key(sheet.name, self.__sheets)
-        self.__sheets[new_key] = Sheet(sheet.array, new_key)
+        self.__sheets[new_key] = copy_sheet(sheet, new_key)
 
     def to_dict(self):
         """Convert the book to a dictionary"""
@@ -214,8 +238,186 @@ class Book(BookMeta):
             the_dict.update({sheet.name: sheet.array})
         return the_dict
 
+    def memory_usage(self):
+        """Estimate the bytes taken by each sheet, see Sheet.memory_usage"""
+        usage = OrderedDict()
+        for sheet in self:
+            usage[sheet.name] = sum(sheet.memory_usage().values())
+        return usage
+
+
+class LazyBook(BookMeta):
+    """
+    A book of which each sheet is read when first asked for
+
+    The sheet names are known at once. A sheet is made, and its rows
+    made equally long, on its first access. Rows read on demand are then
+    released, and the file is closed once every sheet was read or
+    :meth:`close` is called. So taking one sheet out of many costs the
+    reading of that sheet only, though formats such as xlsx are parsed
+    as a whole when opened.
+
+    Example::
+
+        >>> import pyexcel as p
+        >>> book = p.LazyBook(bookdict={"A": [[1]], "B": [[2, 3], [4]]})
+        >>> book.sheet_names()
+        ['A', 'B']
+        >>> book["B"].row[1]
+        [4, '']
+    """
+
+    def __init__(self, max_sheets=None, **keywords):
+        """
+        :param int max_sheets: the number of sheets to keep once made,
+                               the least recently used going first. An
+                               evicted sheet is read again from the
+                               source when asked for, without the changes
+                               made to it. None keeps them all
+        :param keywords: the source, as for :meth:`pyexcel.get_book`
+        """
+        self.filename = None
+        self.__path = None
+        self.__keywords = None
+        self.__max_sheets = max_sheets
+        self.__names = []
+        self.__payloads = {}
+        self.__sheets = OrderedDict()
+        self.__resources = []
+        if keywords:
+            garbage = len(gc.GARBAGE)
+            book_stream = sources.get_book_stream(on_demand=True, **keywords)
+            self.init(
+                sheets=book_stream.to_dict(),
+                filename=book_stream.filename,
+                path=book_stream.path,
+            )
+            # files opened for this book are closed by this book
+            self.__resources = gc.GARBAGE.take_since(garbage)
+            self.__keywords = keywords
+
+    def init(self, sheets=None, filename="memory", path=None):
+        """Take new, yet unread sheets, e.g. when set by book.xls = ..."""
+        self.close()
+        self.__keywords = None
+        self.filename = filename
+        self.__path = path
+        self.__sheets.clear()
+        self.__payloads = OrderedDict(sheets or {})
+        self.__names = list(self.__payloads.keys())
+
+    def __iter__(self):
+        return SheetIterator(self)
+
+    def __len__(self):
+        return len(self.__names)
+
+    def number_of_sheets(self):
+        """Return the number of sheets"""
+        return len(self)
+
+    def sheet_names(self):
+        """Return all sheet names, read or not"""
+        return list(self.__names)
+
+    def loaded_sheet_names(self):
+        """Return the names of the sheets made and kept so far"""
+        return list(self.__sheets.keys())
 
-def to_book(bookstream):
+    def sheet_by_name(self, name):
+        """Get the sheet with the specified name, reading it if need be"""
+        sheet = self.__sheets.get(name)
+        if sheet is not None:
+            self.__sheets.move_to_end(name)
+            return sheet
+        if name not in self.__names:
+            raise KeyError(name)
+        sheet = Sheet(self.__read(name), name)
+        self.__sheets[name] = sheet
+        if self.__max_sheets is not None:
+            while len(self.__sheets) > max(self.__max_sheets, 1):
+                self.__sheets.popitem(last=False)
+        return sheet
+
+    def sheet_by_index(self, index):
+        """Get the sheet with the specified index
+
+        :raises IndexError: if there is no sheet at the index
+        """
+        return self.sheet_by_name(self.__names[index])
+
+    def __getitem__(self, key):
+        """Override operator[]"""
+        if isinstance(key, int):
+            return self.sheet_by_index(key)
+        return self.sheet_by_name(key)
+
+    def to_dict(self):
+        """Convert the book to a dictionary
+
+        The sheets not made yet are given as their rows, which are read
+        as they are written out.
+        """
+        the_dict = OrderedDict()
+        for name in self.__names:
+            sheet = self.__sheets.get(name)
+            if sheet is not None:
+                the_dict[name] = sheet.array
+            else:
+                the_dict[name] = self.__read(name)
+        return the_dict
+
+    def to_book(self):
+        """Make a :class:`Book` of all sheets"""
+        return Book(
+            OrderedDict((sheet.name, sheet) for sheet in self),
+            filename=self.filename,
+            path=self.__path,
+        )
+
+    def close(self):
+        """Release the unread sheets and close the files they read from"""
+        for name, payload in list(self.__payloads.items()):
+            if iter(payload) is payload:
+                del self.__payloads[name]
+        resources, self.__resources = self.__resources, []
+        for resource in resources:
+            resource.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __read(self, name):
+        """The rows of a sheet, from its payload or the source again"""
+        payload = self.__payloads.get(name)
+        if payload is None:
+            if self.__keywords is None:
+                raise KeyError(name)
+            return sources.get_sheet_stream(
+                sheet_name=name, **self.__keywords
+            ).payload
+        if iter(payload) is payload:
+            # rows read on demand can be read once
+            del self.__payloads[name]
+            return self.__read_once(payload)
+        # the sheet changes its rows, which have to stay as read
+        return [list(row) for row in payload]
+
+    def __read_once(self, rows):
+        """Pass the rows on, then close the files if all were read"""
+        try:
+            yield from rows
+        finally:
+            if not any(
+                iter(rest) is rest for rest in self.__payloads.values()
+            ):
+                self.close()
+
+
+def to_book(bookstream, workers=None):
     """Convert a bookstream to Book"""
     if isinstance(bookstream, Book):
         return bookstream
@@ -223,9 +425,28 @@ def to_book(bookstream):
         bookstream.to_dict(),
         filename=bookstream.filename,
         path=bookstream.path,
+        workers=workers,
     )
 
 
+def copy_sheet(sheet, name):
+    """Copy a sheet, with its column and row names as data, for a new book
+
+    The data is shared with the original sheet until either one changes.
+    Named columns and rows become part of the data again, so such sheets
+    are copied row by row instead. Cells are never copied.
+    """
+    if len(sheet.colnames) > 0 or len(sheet.rownames) > 0:
+        rows = [list(row) for row in sheet.array]
+        return Sheet(rows, name, storage=sheet.storage)
+    return Sheet(sheet, name, storage=sheet.storage)
+
+
+def _make_sheet(name_and_array):
+    name, array = name_and_array
+    return Sheet(array, name)
+
+
 def local_uuid():
     """create home made uuid"""
     global LOCAL_UUID
@@ -18,6 +18,9 @@ MESSAGE_WARNING = "We do not overwrite files"
 MESSAGE_WRITE_ERROR = "Cannot write sheet"
 MESSAGE_ERROR_02 = "No valid parameters found!"
 MESSAGE_DATA_ERROR_NO_SERIES = "No column names or row names found"
+MESSAGE_NO_COLUMN_NAMES = (
+    "Column %r is asked for by name but the columns have no names"
+)
 MESSAGE_DATA_ERROR_EMPTY_COLUMN_LIST = (
     "Column list is empty. Do not waste resource"
 )
@@ -99,8 +102,25 @@ VALID_SHEET_PARAMETERS = [
     "rownames",
     "transpose_before",
     "transpose_after",
+    "storage",
 ]
 
+# sheet storage layouts
+STORAGE_ROW = "row"
+STORAGE_COLUMNAR = "columnar"
+VALID_STORAGES = (STORAGE_ROW, STORAGE_COLUMNAR)
+MESSAGE_UNKNOWN_STORAGE = "Unknown storage '%s'. Please use one of %s"
+
+# record types of iget_records, besides OrderedDict, dict and tuple
+RECORD_NAMEDTUPLE = "namedtuple"
+RECORD_SLOTS = "slots"
+MESSAGE_UNKNOWN_RECORD_TYPE = "Unknown record type %r. Please use one of %s"
+MESSAGE_BAD_CHUNK_SIZE = "The chunk size should be a positive integer, not %r"
+# the rows sent to a worker process at a time by parallel_map
+DEFAULT_CHUNK_ROWS = 10000
+# the records pyexcel.aio.aiget_records hands to the event loop at a time
+DEFAULT_AIO_BATCH_SIZE = 1000
+
 
 # for sources
 # targets
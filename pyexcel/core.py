@@ -14,8 +14,11 @@ from pyexcel import constants
 from pyexcel import docstrings as docs
 from pyexcel.book import Book, to_book
 from pyexcel.sheet import Sheet
-from pyexcel._compact import OrderedDict, append_doc, zip_longest
+from pyexcel._compact import OrderedDict, append_doc
 from pyexcel.internal import core as sources
+from pyexcel.internal.records import record_maker
+from pyexcel.internal.generators import chunked, check_chunk_size
+from pyexcel.internal.instrumentation import instrumented
 
 from pyexcel_io import manager
 
@@ -30,6 +33,7 @@ DEST_PARAMETERS_MISSING = (
 
 
 @append_doc(docs.GET_SHEET)
+@instrumented
 def get_sheet(**keywords):
     """
     Get an instance of :class:`Sheet` from an excel source
@@ -38,13 +42,16 @@ def get_sheet(**keywords):
     for field in constants.VALID_SHEET_PARAMETERS:
         if field in keywords:
             sheet_params[field] = keywords.pop(field)
+    if sheet_params.get("name_columns_by_row") == 0:
+        _keep_header_from_where(keywords)
     named_content = sources.get_sheet_stream(**keywords)
     sheet = Sheet(named_content.payload, named_content.name, **sheet_params)
     return sheet
 
 
 @append_doc(docs.GET_BOOK)
-def get_book(**keywords):
+@instrumented
+def get_book(workers=None, **keywords):
     """
     Get an instance of :class:`Book` from an excel source
     """
@@ -53,11 +60,13 @@ def get_book(**keywords):
         book_stream.to_dict(),
         filename=book_stream.filename,
         path=book_stream.path,
+        workers=workers,
     )
     return book
 
 
 @append_doc(docs.IGET_BOOK)
+@instrumented
 def iget_book(**keywords):
     """
     Get an instance of :class:`BookStream` from an excel source
@@ -69,6 +78,7 @@ def iget_book(**keywords):
 
 
 @append_doc(docs.SAVE_AS)
+@instrumented
 def save_as(**keywords):
     """
     Save a sheet from a data source to another one
@@ -89,6 +99,7 @@ def save_as(**keywords):
 
 
 @append_doc(docs.ISAVE_AS)
+@instrumented
 def isave_as(**keywords):
     """
     Save a sheet from a data source to another one with less memory
@@ -110,6 +121,7 @@ def isave_as(**keywords):
 
 
 @append_doc(docs.SAVE_BOOK_AS)
+@instrumented
 def save_book_as(**keywords):
     """
     Save a book from a data source to another one
@@ -117,12 +129,14 @@ def save_book_as(**keywords):
     dest_keywords, source_keywords = _split_keywords(**keywords)
     if not dest_keywords:
         raise RuntimeError(DEST_PARAMETERS_MISSING)
+    workers = source_keywords.pop("workers", None)
     book = sources.get_book_stream(**source_keywords)
-    book = to_book(book)
+    book = to_book(book, workers=workers)
     return sources.save_book(book, **dest_keywords)
 
 
 @append_doc(docs.ISAVE_BOOK_AS)
+@instrumented
 def isave_book_as(**keywords):
     """
     Save a book from a data source to another one
@@ -139,6 +153,7 @@ def isave_book_as(**keywords):
 
 
 @append_doc(docs.GET_ARRAY)
+@instrumented
 def get_array(**keywords):
     """
     Obtain an array from an excel source
@@ -151,6 +166,7 @@ def get_array(**keywords):
 
 
 @append_doc(docs.GET_DICT)
+@instrumented
 def get_dict(name_columns_by_row=0, **keywords):
     """
     Obtain a dictionary from an excel source
@@ -172,6 +188,7 @@ def get_dict(name_columns_by_row=0, **keywords):
 
 
 @append_doc(docs.GET_RECORDS)
+@instrumented
 def get_records(name_columns_by_row=0, **keywords):
     """
     Obtain a list of records from an excel source
@@ -193,19 +210,28 @@ def get_records(name_columns_by_row=0, **keywords):
 
 
 @append_doc(docs.IGET_ARRAY)
-def iget_array(**keywords):
+@instrumented
+def iget_array(chunk_size=None, **keywords):
     """
     Obtain a generator of a two-dimensional array from an excel source
 
     It is similar to :meth:`pyexcel.get_array` but it has less memory
     footprint.
     """
+    if chunk_size is not None:
+        # before the source is opened, which would be left open
+        check_chunk_size(chunk_size)
     sheet_stream = sources.get_sheet_stream(on_demand=True, **keywords)
+    if chunk_size is not None:
+        return chunked(sheet_stream.payload, chunk_size)
     return sheet_stream.payload
 
 
 @append_doc(docs.IGET_RECORDS)
-def iget_records(custom_headers=None, **keywords):
+@instrumented
+def iget_records(
+    custom_headers=None, record_type=OrderedDict, chunk_size=None, **keywords
+):
     """
     Obtain a generator of a list of records from an excel source
 
@@ -214,38 +240,24 @@ def iget_records(custom_headers=None, **keywords):
     data matrix should be of equal length. It should consume less memory
     and should work well with large files.
     """
+    if chunk_size is not None:
+        check_chunk_size(chunk_size)
+    _keep_header_from_where(keywords)
     sheet_stream = sources.get_sheet_stream(on_demand=True, **keywords)
-    headers = None
-    for row_index, row in enumerate(sheet_stream.payload):
-        if row_index == 0:
-            headers = row
-        else:
-            if custom_headers:
-                # custom order
-                tmp_dict = dict(
-                    zip_longest(headers, row, fillvalue=constants.DEFAULT_NA),
-                )
-                # Release row before yielding so the generator frame does not
-                # hold the raw row data while the caller processes the record
-                # (reduces peak memory with wide rows).
-                del row
-                ordered_dict = OrderedDict()
-                for name in custom_headers:
-                    ordered_dict[name] = tmp_dict[name]
-                del tmp_dict
-                yield ordered_dict
-            else:
-                # default order
-                ordered_dict = OrderedDict(
-                    zip_longest(headers, row, fillvalue=constants.DEFAULT_NA),
-                )
-                # Release the raw row before yielding so the generator frame
-                # does not hold it while the caller processes the record.
-                del row
-                yield ordered_dict
+    rows = iter(sheet_stream.payload)
+    headers = next(rows, None)
+    if headers is None:
+        return
+    make_record = record_maker(headers, custom_headers, record_type)
+    records = map(make_record, rows)
+    if chunk_size is not None:
+        records = chunked(records, chunk_size)
+    # the generator frame holds no row while the caller has the record
+    yield from records
 
 
 @append_doc(docs.GET_BOOK_DICT)
+@instrumented
 def get_book_dict(**keywords):
     """
     Obtain a dictionary of two dimensional arrays
@@ -278,3 +290,12 @@ def _split_keywords(**keywords):
         else:
             source_keywords[key] = value
     return dest_keywords, source_keywords
+
+
+def _keep_header_from_where(keywords):
+    """Tell the source that the first row is the header row
+
+    where is not called with it, and names in columns are looked up in it.
+    """
+    if any(keywords.get(key) is not None for key in ("columns", "where")):
+        keywords["header"] = True
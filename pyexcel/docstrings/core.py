@@ -28,6 +28,13 @@ __GET_BOOK__ = (
     + keywords.SOURCE_BOOK_PARAMS
 )
 
+__WORKERS__ = """
+workers :
+    build the sheets in this many threads. Defaults to one after another.
+    The building is python code, which the GIL of a standard CPython runs
+    one thread at a time, so do not expect it to be faster there
+"""
+
 I_NOTE = (
     """
 When you use this function to work on physical files, this function
@@ -96,24 +103,49 @@ GET_SHEET = __GET_SHEET__
 
 GET_ARRAY = __GET_ARRAY__
 
-IGET_ARRAY = __GET_ARRAY__ + I_NOTE
+__CHUNK_SIZE__ = """
+chunk_size :
+    yield lists of this many rows, the last one shorter, instead of
+    one row at a time
+"""
+
+IGET_ARRAY = __GET_ARRAY__ + __CHUNK_SIZE__ + I_NOTE
 
 GET_DICT = __GET_SHEET__
 
 GET_RECORDS = __GET_SHEET__
 
-IGET_RECORDS = __GET_SHEET__ + I_NOTE
+IGET_RECORDS = (
+    __GET_SHEET__
+    + """
+record_type :
+    what each record is: OrderedDict, the default, dict, tuple,
+    "namedtuple" or "slots", a generated class with __slots__. The
+    fields of the last two are the headers, renamed as
+    :func:`collections.namedtuple` does if they are not identifiers
+"""
+    + __CHUNK_SIZE__
+    + I_NOTE
+)
 
 SAVE_AS = __SAVE_AS__
 
 ISAVE_AS = __SAVE_AS__ + I_NOTE
 
-GET_BOOK = __GET_BOOK__
+GET_BOOK = __GET_BOOK__ + __WORKERS__
 
 IGET_BOOK = __GET_BOOK__ + I_NOTE
 
-GET_BOOK_DICT = __GET_BOOK__
+GET_BOOK_DICT = __GET_BOOK__ + __WORKERS__
 
-SAVE_BOOK_AS = __SAVE_BOOK_AS__
+SAVE_BOOK_AS = (
+    __SAVE_BOOK_AS__
+    + __WORKERS__
+    + """
+dest_workers :
+    render the sheets of a text format, e.g. texttable, in this many
+    processes and write them out in order
+"""
+)
 
 ISAVE_BOOK_AS = __SAVE_BOOK_AS__ + I_NOTE
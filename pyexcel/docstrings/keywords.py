@@ -178,6 +178,17 @@ skip_empty_rows: bool
 row_renderer:
     You could choose to write a custom row renderer when the data is being
     read.
+
+columns: list
+    column indices or names to be read, in the order given. Names are
+    looked up in the first row, which is then kept as the header row.
+    Other columns are dropped while the data is read.
+
+where:
+    a function that receives a row, with only the wanted columns, and
+    returns False to leave the row out. The header row is not passed to
+    it: that of a database, a dict or records source, of named columns,
+    and the first row read by get_dict, get_records and iget_records.
 """
 )
 
@@ -197,7 +208,16 @@ adict:
     a dictionary of one dimensional arrays
 
 url :
-    a download http url for your excel file
+    a download http url for your excel file. csv and tsv downloads
+    are parsed as they arrive
+
+spool_size :
+    for an url of a zipped file type, e.g. xlsx, the bytes to keep in
+    memory before the download goes to a temporary file. 16MB by
+    default
+
+download_chunk_size :
+    for an url, the bytes to read at a time. 64KB by default
 
 with_keys :
     load with previous dictionary's keys, default is True
@@ -0,0 +1,251 @@
+"""
+pyexcel.internal.cache
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Keep parsed files in memory, so that reading a file again costs nothing
+
+The cache is off by default. Once it is on, reading a file by its
+name, not on demand, looks up the file's identity and the keywords
+of the call. A file that has changed since is parsed again.
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License
+"""
+
+import os
+import sys
+import hashlib
+from threading import Lock
+from collections import namedtuple
+
+from pyexcel._compact import OrderedDict
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "max_entries", "entries", "max_bytes", "nbytes"],
+)
+
+
+class ParsedDataCache:
+    """Least recently used parsed files, kept as matrices
+
+    Each caller gets new matrices that share the cached rows until
+    either side changes them.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None, content_hash=False):
+        """
+        :param int max_entries: the number of files to keep, None for
+                                no limit
+        :param int max_bytes: the estimated memory to use, None for no
+                              limit
+        :param bool content_hash: tell files apart by a hash of their
+                                  content instead of their size and
+                                  modification time
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.content_hash = content_hash
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key):
+        """Return new matrices sharing the cached ones, or None"""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+        return _borrow_all(entry[0])
+
+    def put(self, key, sheets):
+        """Keep parsed sheets and return new matrices sharing them
+
+        :param dict sheets: two dimensional arrays keyed by sheet name
+        """
+        from pyexcel.internal.sheets.matrix import Matrix
+
+        matrices = OrderedDict(
+            (name, Matrix(array)) for name, array in sheets.items()
+        )
+        nbytes = _nbytes(matrices)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return matrices
+        with self.__lock:
+            old = self.__entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self.__entries[key] = (matrices, nbytes)
+            self.nbytes += nbytes
+            self._evict()
+        return _borrow_all(matrices)
+
+    def clear(self):
+        """Forget all files and reset the statistics"""
+        with self.__lock:
+            self.__entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return a :class:`CacheInfo` of the statistics"""
+        with self.__lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.max_entries,
+                len(self.__entries),
+                self.max_bytes,
+                self.nbytes,
+            )
+
+    def key_of(self, kind, keywords):
+        """Identify a read of a file with the given keywords
+
+        :returns: None if the read cannot be cached
+        """
+        file_name = keywords.get("file_name")
+        if not isinstance(file_name, (str, os.PathLike)):
+            return None
+        if keywords.get("on_demand"):
+            return None
+        path = os.path.realpath(file_name)
+        try:
+            if self.content_hash:
+                identity = _hash_of(path)
+            else:
+                stat = os.stat(path)
+                identity = (stat.st_size, stat.st_mtime_ns)
+            others = _freeze(
+                {
+                    name: value
+                    for name, value in keywords.items()
+                    if name != "file_name"
+                }
+            )
+            key = (kind, path, identity, others)
+            hash(key)
+        except (OSError, TypeError):
+            return None
+        return key
+
+    def _evict(self):
+        while self.__entries and (
+            (
+                self.max_entries is not None
+                and len(self.__entries) > self.max_entries
+            )
+            or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            _, (_, nbytes) = self.__entries.popitem(last=False)
+            self.nbytes -= nbytes
+
+
+CACHE = None
+
+
+def enable_cache(max_entries=128, max_bytes=None, content_hash=False):
+    """
+    Keep parsed files in memory for the signature functions
+
+    get_sheet, get_book, get_array, get_records and the like parse a
+    file again only if it has changed. See :class:`ParsedDataCache`
+    for the parameters. Enabling the cache again starts a new one.
+    """
+    global CACHE
+    CACHE = ParsedDataCache(
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        content_hash=content_hash,
+    )
+
+
+def disable_cache():
+    """
+    Stop caching parsed files and drop the cached ones
+    """
+    global CACHE
+    CACHE = None
+
+
+def clear_cache():
+    """
+    Drop the cached files and reset the statistics
+    """
+    if CACHE is not None:
+        CACHE.clear()
+
+
+def cache_info():
+    """
+    Return the hits, misses, entries and bytes of the cache
+
+    :returns: a CacheInfo named tuple, or None if the cache is off
+    """
+    if CACHE is None:
+        return None
+    return CACHE.info()
+
+
+def get_data(kind, a_source, keywords):
+    """Get the data of a source, through the cache if it is on
+
+    :param str kind: "sheet" or "book", as the sources differ
+    """
+    cache = CACHE
+    key = None if cache is None else cache.key_of(kind, keywords)
+    if key is None:
+        return a_source.get_data()
+    sheets = cache.get(key)
+    if sheets is None:
+        sheets = cache.put(key, a_source.get_data())
+    return sheets
+
+
+def _borrow_all(matrices):
+    from pyexcel.internal.sheets.matrix import Matrix
+
+    return OrderedDict(
+        (name, Matrix(matrix)) for name, matrix in matrices.items()
+    )
+
+
+def _nbytes(matrices):
+    """Estimate the memory held by the lists and cells of matrices"""
+    total = 0
+    for matrix in matrices.values():
+        array = matrix.get_internal_array()
+        total += sys.getsizeof(array)
+        for row in array:
+            total += sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+    return total
+
+
+def _hash_of(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_handle:
+        for block in iter(lambda: file_handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _freeze(value):
+    """Turn lists and dictionaries into tuples, so that they hash
+
+    :raises TypeError: for functions, e.g. a lambda made anew per call,
+                       as a key holding one would hardly be hit again
+    """
+    if callable(value):
+        raise TypeError("a function is not a cacheable keyword")
+    if isinstance(value, dict):
+        items = ((key, _freeze(item)) for key, item in value.items())
+        return tuple(sorted(items))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
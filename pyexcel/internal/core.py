@@ -10,8 +10,9 @@ elementary functions to read and write generic excel content
 
 from io import UnsupportedOperation
 
-from pyexcel.internal import SOURCE
+from pyexcel.internal import SOURCE, cache
 from pyexcel.constants import DEFAULT_NO_DATA
+from pyexcel.internal.instrumentation import stage, size_of, count_sheets
 from pyexcel.internal.generators import BookStream, SheetStream
 
 
@@ -19,9 +20,12 @@ def get_sheet_stream(**keywords):
     """
     Get an instance of SheetStream from an excel source
     """
+    measured = stage("resolve")
     a_source = SOURCE.get_source(**keywords)
+    if measured:
+        measured.done()
     filename, path = a_source.get_source_info()
-    sheets = a_source.get_data()
+    sheets = _read(a_source, "sheet", keywords)
     if sheets:
         sheet_name, data = _one_sheet_tuple(sheets.items())
         return SheetStream(sheet_name, data)
@@ -35,9 +39,12 @@ def get_book_stream(**keywords):
     Where the dictionary should have text as keys and two dimensional
     array as values.
     """
+    measured = stage("resolve")
     a_source = SOURCE.get_book_source(**keywords)
+    if measured:
+        measured.done()
     filename, path = a_source.get_source_info()
-    sheets = a_source.get_data()
+    sheets = _read(a_source, "book", keywords)
     return BookStream(sheets, filename=filename, path=path)
 
 
@@ -45,26 +52,63 @@ def save_sheet(sheet, **keywords):
     """
     Save a sheet instance to any source
     """
+    measured = stage("resolve")
     a_source = SOURCE.get_writable_source(**keywords)
-    return _save_any(a_source, sheet)
+    if measured:
+        measured.done()
+    return _save_any(a_source, sheet, keywords)
 
 
 def save_book(book, **keywords):
     """
     Save a book instance to any source
     """
+    measured = stage("resolve")
     a_source = SOURCE.get_writable_book_source(**keywords)
-    return _save_any(a_source, book)
+    if measured:
+        measured.done()
+    return _save_any(a_source, book, keywords)
 
 
-def _save_any(a_source, instance):
+def _read(a_source, kind, keywords):
+    measured = stage("read")
+    sheets = cache.get_data(kind, a_source, keywords)
+    if measured:
+        rows, cells = count_sheets(sheets)
+        measured.done(rows, cells, size_of(keywords))
+    return sheets
+
+
+def _save_any(a_source, instance, keywords):
+    measured = stage("render")
     a_source.write_data(instance)
     try:
         content_stream = a_source.get_content()
         _seek_at_zero(content_stream)
-        return content_stream
     except AttributeError:
-        return None
+        content_stream = None
+    if measured:
+        measured.done(*_count_written(instance, content_stream, keywords))
+    return content_stream
+
+
+def _count_written(instance, content_stream, keywords):
+    """The rows, cells and bytes written, if known"""
+    rows = cells = None
+    sheets = [instance]
+    if hasattr(instance, "sheet_names"):
+        sheets = [instance[name] for name in instance.sheet_names()]
+    if all(hasattr(sheet, "number_of_rows") for sheet in sheets):
+        rows = sum(sheet.number_of_rows() for sheet in sheets)
+        cells = sum(
+            sheet.number_of_rows() * sheet.number_of_columns()
+            for sheet in sheets
+        )
+    if content_stream is not None and hasattr(content_stream, "getvalue"):
+        nbytes = len(content_stream.getvalue())
+    else:
+        nbytes = size_of(keywords)
+    return rows, cells, nbytes
 
 
 def _seek_at_zero(a_stream):
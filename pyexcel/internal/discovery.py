@@ -0,0 +1,183 @@
+"""
+pyexcel.internal.discovery
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Find the plugins, either now or when one is first looked up
+
+By default, the plugins are found when pyexcel is imported. If the
+environment variable PYEXCEL_LAZY_PLUGINS is set, e.g. to 1, they are
+found when a signature function or a file type attribute, such as
+sheet.xlsx, is first used. The plugin packages and the file type
+attributes found are kept in a file between runs: PYEXCEL_PLUGIN_CACHE,
+or plugins.json in the user's cache folder. The file is written again
+when the python path may hold other packages.
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License
+"""
+
+import os
+import re
+import sys
+import json
+import pkgutil
+from functools import partial
+
+from lml.utils import do_import
+from lml.loader import scan_plugins_regex, scan_from_pyinstaller
+from pyexcel import constants
+from pyexcel.__version__ import __version__
+from pyexcel.internal.plugins import PENDING_DISCOVERY
+from pyexcel.internal.attributes import (
+    ATTRIBUTE_REGISTRY,
+    register_book_attribute,
+    register_sheet_attribute,
+)
+
+PLUGIN_NAME_PATTERN = "^pyexcel_.+$"
+PYINSTALLER_PATH = "pyexcel"
+BLACK_LIST = [
+    "pyexcel_io",
+    "pyexcel_webio",
+    "pyexcel_xlsx",
+    "pyexcel_xls",
+    "pyexcel_ods3",
+    "pyexcel_ods",
+    "pyexcel_odsr",
+    "pyexcel_xlsxw",
+]
+WHITE_LIST = [
+    "pyexcel.plugins.parsers",
+    "pyexcel.plugins.renderers",
+    "pyexcel.plugins.sources",
+]
+LAZY_PLUGINS = "PYEXCEL_LAZY_PLUGINS"
+PLUGIN_CACHE = "PYEXCEL_PLUGIN_CACHE"
+REGISTER_ATTRIBUTE = {
+    constants.SHEET: register_sheet_attribute,
+    constants.BOOK: register_book_attribute,
+}
+
+
+def is_lazy():
+    """Whether the environment asks to put off finding the plugins"""
+    return os.environ.get(LAZY_PLUGINS, "0") not in ("", "0")
+
+
+def start():
+    """Find the plugins, or put it off if the environment asks to"""
+    if not is_lazy():
+        scan_plugins_regex(
+            plugin_name_patterns=PLUGIN_NAME_PATTERN,
+            pyinstaller_path=PYINSTALLER_PATH,
+            black_list=BLACK_LIST,
+            white_list=WHITE_LIST,
+        )
+        return
+    key = environment_key()
+    record = load_record(key)
+    if record is None:
+        modules = find_plugin_modules()
+        import_plugins(modules)
+        save_record(key, modules)
+    else:
+        register_attributes(record["attributes"])
+        PENDING_DISCOVERY.append(partial(import_plugins, record["modules"]))
+
+
+def find_plugin_modules():
+    """List the installed plugin packages, as lml would import them"""
+    modules = [
+        module_info.name
+        for module_info in pkgutil.iter_modules()
+        if module_info.ispkg
+        and re.match(PLUGIN_NAME_PATTERN, module_info.name)
+    ]
+    modules += scan_from_pyinstaller(PLUGIN_NAME_PATTERN, PYINSTALLER_PATH)
+    return modules
+
+
+def import_plugins(modules):
+    """Import the plugin packages and the built-in plugins"""
+    for module_name in modules + WHITE_LIST:
+        if module_name in BLACK_LIST:
+            continue
+        try:
+            do_import(module_name)
+        except ImportError:
+            continue
+
+
+def register_attributes(attributes):
+    """Add the file type attributes found in an earlier run"""
+    for target, actions in attributes.items():
+        register = REGISTER_ATTRIBUTE[target]
+        for action, names in actions.items():
+            for name in names:
+                if action == constants.RW_ACTION:
+                    register(target, constants.READ_ACTION, name)
+                    register(target, constants.WRITE_ACTION, name)
+                else:
+                    register(target, action, name)
+
+
+def environment_key():
+    """
+    What the plugins found depend on: the versions and the folders on
+    the python path, which change when packages are installed
+    """
+    folders = []
+    for folder in sys.path:
+        try:
+            modified = os.stat(folder or os.curdir).st_mtime_ns
+        except OSError:
+            modified = None
+        folders.append([folder, modified])
+    return [__version__, sys.version, folders]
+
+
+def cache_file():
+    """Where the plugins found are kept between runs"""
+    file_name = os.environ.get(PLUGIN_CACHE)
+    if file_name:
+        return file_name
+    return os.path.join(user_cache_folder(), "plugins.json")
+
+
+def user_cache_folder():
+    """pyexcel's folder in the user's cache folder"""
+    folder = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(folder, "pyexcel")
+
+
+def load_record(key):
+    """Return what an earlier run found, or None if it may be stale"""
+    try:
+        with open(cache_file(), "r") as record_file:
+            record = json.load(record_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(record, dict) or record.get("key") != key:
+        return None
+    return record
+
+
+def save_record(key, modules):
+    """Keep the plugin packages and file type attributes found"""
+    attributes = {
+        target: {action: sorted(names) for action, names in actions.items()}
+        for target, actions in ATTRIBUTE_REGISTRY.items()
+    }
+    record = {"key": key, "modules": modules, "attributes": attributes}
+    file_name = cache_file()
+    try:
+        os.makedirs(os.path.dirname(file_name) or os.curdir, exist_ok=True)
+        temporary_name = f"{file_name}.{os.getpid()}"
+        with open(temporary_name, "w") as record_file:
+            json.dump(record, record_file)
+        os.replace(temporary_name, file_name)
+    except OSError:
+        # e.g. a read only file system. Next run will look again
+        pass
@@ -37,6 +37,13 @@ class _ThreadLocalGarbage:
         self._storage.items = []
         return items
 
+    def take_since(self, count: int) -> List[Any]:
+        """Take out the items added after the first count items"""
+        items = self._items()
+        taken = items[count:]
+        del items[count:]
+        return taken
+
     def __len__(self) -> int:
         return len(self._items())
 
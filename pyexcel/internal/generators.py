@@ -8,7 +8,12 @@ Definition for the sheet and book generators.
 :license: New BSD License
 """
 
+from functools import partial
+from itertools import islice
+
+from pyexcel import constants
 from pyexcel._compact import OrderedDict
+from pyexcel.internal.parallel import imap_in_processes
 from pyexcel.internal.common import SheetIterator
 
 
@@ -26,12 +31,30 @@ class SheetStream:
     pass a row formatting/rendering function to the parameter
     "renderer" of pyexcel's signature functions.
 
+    The operators, e.g. :meth:`map`, :meth:`filter` and :meth:`head`,
+    return a new stream whose payload is a generator over the payload
+    of this one. Nothing is read until the last stream in the chain
+    is consumed, for example by :meth:`pyexcel.isave_as` with
+    `sheet_stream=...`. A stream can be consumed only once.
     """
 
     def __init__(self, name, payload):
         self.name = name
         self.payload = payload
-        self.colnames = []
+        # whether the first row of the payload is the column names
+        self.has_header = False
+        self.__colnames = []
+
+    @property
+    def colnames(self):
+        """The column names, read from the payload when first asked for"""
+        if callable(self.__colnames):
+            self.__colnames = self.__colnames()
+        return self.__colnames
+
+    @colnames.setter
+    def colnames(self, value):
+        self.__colnames = value
 
     def to_array(self):
         """
@@ -47,6 +70,227 @@ class SheetStream:
     def get_internal_array(self):
         return self.payload
 
+    def with_headers(self):
+        """Take the first row as column names
+
+        The column names stay the first row of the payload, so that
+        they are written out along with the rows.
+        """
+        header = _Header(self.payload)
+
+        def payload():
+            colnames = header.read()
+            if header.found:
+                yield colnames
+                yield from header.rows
+
+        stream = SheetStream(self.name, payload())
+        stream.colnames = header.read
+        stream.has_header = True
+        return stream
+
+    def map(self, custom_function=None, column_functions=None):
+        """Apply functions to the cells of each row
+
+        A None result leaves the cell as it was. The column names,
+        if any, are not passed to the functions.
+
+        :param custom_function: the function for all cells
+        :param dict column_functions: functions for individual columns,
+                                      keyed by column name or index
+        """
+
+        def mapped(rows):
+            functions = {
+                self._column_index(name): function
+                for name, function in (column_functions or {}).items()
+            }
+            for row in rows:
+                new_row = []
+                for index, cell in enumerate(row):
+                    function = functions.get(index, custom_function)
+                    value = None if function is None else function(cell)
+                    new_row.append(cell if value is None else value)
+                yield new_row
+
+        return self._derive(mapped)
+
+    def parallel_map(
+        self,
+        custom_function,
+        workers=None,
+        chunk_rows=constants.DEFAULT_CHUNK_ROWS,
+    ):
+        """Apply a function to the cells of each row, in worker processes
+
+        See :meth:`pyexcel.Sheet.parallel_map`. The rows are read
+        chunk_rows at a time and a few chunks per worker are in flight,
+        so the stream is not read all at once.
+        """
+        from pyexcel.internal.sheets.transform import map_chunk
+
+        check_chunk_size(chunk_rows)
+        mapper = partial(map_chunk, custom_function)
+
+        def mapped(rows):
+            chunks = chunked(map(list, rows), chunk_rows)
+            for chunk in imap_in_processes(mapper, chunks, workers):
+                yield from chunk
+
+        return self._derive(mapped)
+
+    def filter(self, predicate):
+        """Keep the rows for which predicate(row) is true"""
+        return self._derive(lambda rows: filter(predicate, rows))
+
+    def select_columns(self, columns):
+        """Keep the given columns, in the given order
+
+        :param list columns: column names or indices
+        """
+
+        def indices():
+            return [self._column_index(column) for column in columns]
+
+        def selected(rows):
+            picked = indices()
+            for row in rows:
+                width = len(row)
+                yield [
+                    row[index] if index < width else constants.DEFAULT_NA
+                    for index in picked
+                ]
+
+        def colnames():
+            names = self.colnames
+            return [names[index] for index in indices()] if names else []
+
+        return self._derive(selected, colnames)
+
+    def rename(self, mapping):
+        """Rename columns
+
+        :param dict mapping: new names keyed by the old ones
+        """
+        if not self.has_header and not self.colnames:
+            raise ValueError(constants.MESSAGE_DATA_ERROR_NO_SERIES)
+
+        def colnames():
+            if not self.colnames:
+                raise ValueError(constants.MESSAGE_DATA_ERROR_NO_SERIES)
+            return [mapping.get(name, name) for name in self.colnames]
+
+        return self._derive(iter, colnames)
+
+    def head(self, number):
+        """Keep the first n rows, not counting the column names"""
+        return self._derive(lambda rows: islice(rows, number))
+
+    def skip(self, number):
+        """Drop the first n rows, not counting the column names"""
+        return self._derive(lambda rows: islice(rows, number, None))
+
+    def aggregate(
+        self, by=None, sum=None, count=None, min=None, max=None, mean=None
+    ):
+        """Aggregate the rows as they are read, see Sheet.aggregate
+
+        The stream is consumed. Only the running totals of each group
+        are kept in memory.
+
+        :returns: a :class:`pyexcel.Sheet` of a row per group
+        """
+        from pyexcel.internal.sheets.aggregation import Aggregation
+
+        measures = dict(sum=sum, count=count, min=min, max=max, mean=mean)
+        aggregation = Aggregation(by, measures, colnames=self.colnames)
+        rows = iter(self.payload)
+        if self.has_header:
+            next(rows, None)
+        aggregation.add_rows(rows)
+        return aggregation.to_sheet(name=self.name)
+
+    def chunks(self, number):
+        """Consume the rows in lists of n rows, the last one shorter
+
+        The column names, if any, are left out; see :attr:`colnames`.
+        """
+        check_chunk_size(number)
+        rows = iter(self.payload)
+        if self.has_header:
+            next(rows, None)
+        return chunked(rows, number)
+
+    def _column_index(self, name):
+        if isinstance(name, str):
+            return self.colnames.index(name)
+        return name
+
+    def _derive(self, transform, colnames=None):
+        """Chain a transform of the rows, leaving the header row, if any
+
+        :param colnames: a function giving the new column names, which
+                         is called when they are first asked for
+        """
+        if colnames is None:
+
+            def colnames():
+                return self.colnames
+
+        def payload():
+            rows = iter(self.payload)
+            if self.has_header:
+                if next(rows, None) is None:
+                    # an empty stream has no header row either
+                    return
+                yield stream.colnames
+            yield from transform(rows)
+
+        stream = SheetStream(self.name, payload())
+        stream.colnames = colnames
+        stream.has_header = self.has_header
+        return stream
+
+
+class _Header:
+    """The first row of a payload, read when first asked for"""
+
+    def __init__(self, payload):
+        self.__payload = payload
+        self.__colnames = None
+        self.rows = None
+        # whether there was a first row
+        self.found = False
+
+    def read(self):
+        """Read the column names, leaving the other rows in rows"""
+        if self.rows is None:
+            self.rows = iter(self.__payload)
+            first = next(self.rows, None)
+            self.found = first is not None
+            self.__colnames = list(first or [])
+        return self.__colnames
+
+
+def chunked(items, size):
+    """Yield lists of size items, taken from the iterable in one go"""
+    check_chunk_size(size)
+    return _chunks(iter(items), size)
+
+
+def check_chunk_size(size):
+    """Raise ValueError unless size is a positive integer"""
+    if not isinstance(size, int) or size < 1:
+        raise ValueError(constants.MESSAGE_BAD_CHUNK_SIZE % (size,))
+
+
+def _chunks(items, size):
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class BookStream:
     """
@@ -0,0 +1,341 @@
+"""
+pyexcel.internal.http_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Keep downloads on disk and ask the server whether they have changed
+
+The cache is off by default. Once it is on, a url source sends the
+ETag and the Last-Modified date of its earlier download. If the server
+answers 304 Not Modified, the file on disk is read instead. Connections
+are kept open for the next call to the same host. The proxies that
+urllib would use, e.g. from http_proxy and https_proxy, are used too.
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License
+"""
+
+import io
+import os
+import json
+import base64
+import time
+import hashlib
+import http.client
+from functools import partial
+from email.message import Message
+from threading import Lock, local
+from urllib.error import HTTPError
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from pyexcel.internal.discovery import user_cache_folder
+
+REDIRECTS = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+CONNECTION_ERRORS = (http.client.HTTPException, ConnectionError)
+
+
+class CachedResponse(io.FileIO):
+    """A downloaded file, with the headers of its response"""
+
+    def __init__(self, file_name, content_type):
+        io.FileIO.__init__(self, file_name, "rb")
+        self.__headers = Message()
+        if content_type:
+            self.__headers["Content-Type"] = content_type
+
+    def info(self):
+        """the headers, as urllib's responses have them"""
+        return self.__headers
+
+
+class PooledResponse(http.client.HTTPResponse):
+    """A response that gives its connection back once read to the end"""
+
+    on_read = None
+
+    def close(self):
+        # the body was read to the end if the response let go of it
+        read = self.isclosed()
+        http.client.HTTPResponse.close(self)
+        if read and self.on_read is not None:
+            on_read, self.on_read = self.on_read, None
+            on_read()
+
+
+class HttpCache:
+    """Downloads kept in a folder, least recently used go first"""
+
+    def __init__(self, folder=None, max_bytes=256 * 1024 * 1024, ttl=None):
+        """
+        :param str folder: where to keep the downloads. By default,
+                           pyexcel/http in the user's cache folder
+        :param int max_bytes: the size of the downloads to keep, None for
+                              no limit
+        :param float ttl: the seconds to keep a download that is not
+                          used, None for no limit
+        """
+        self.folder = folder or os.path.join(user_cache_folder(), "http")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.__connections = local()
+        self.__lock = Lock()
+        os.makedirs(self.folder, exist_ok=True)
+
+    def open(self, url):
+        """Return the response for the url, from disk if unchanged"""
+        body_file, meta_file = self._files_of(url)
+        meta = _read_meta(meta_file)
+        if meta is not None and not self._usable(meta_file, body_file):
+            meta = None
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        response, url = self._request(url, headers)
+        if response.status == 304 and meta is not None:
+            response.read()
+            os.utime(meta_file)
+            return CachedResponse(body_file, meta.get("content_type"))
+        if response.status != 200:
+            response.read()
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        etag = response.getheader("ETag")
+        last_modified = response.getheader("Last-Modified")
+        if not etag and not last_modified:
+            # cannot be checked later, so there is nothing to keep
+            self._lend_connection(url, response)
+            return response
+        self._keep(response, body_file)
+        _write_meta(
+            meta_file,
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "content_type": response.getheader("Content-Type"),
+            },
+        )
+        cached = CachedResponse(body_file, response.getheader("Content-Type"))
+        self._evict()
+        return cached
+
+    def clear(self):
+        """Delete all downloads"""
+        with self.__lock:
+            for file_name in os.listdir(self.folder):
+                _remove(os.path.join(self.folder, file_name))
+
+    def _usable(self, meta_file, body_file):
+        try:
+            used = os.stat(meta_file).st_mtime
+        except OSError:
+            return False
+        if self.ttl is not None and time.time() - used > self.ttl:
+            return False
+        return os.path.exists(body_file)
+
+    def _files_of(self, url):
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        body_file = os.path.join(self.folder, name + ".body")
+        return body_file, os.path.join(self.folder, name + ".json")
+
+    def _request(self, url, headers):
+        """GET the url over a kept connection, following redirects"""
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send(url, headers)
+            if response.status not in REDIRECTS:
+                return response, url
+            response.read()
+            url = urljoin(url, response.getheader("Location"))
+        raise http.client.HTTPException(f"Too many redirects: {url}")
+
+    def _send(self, url, headers):
+        parts = urlsplit(url)
+        proxy = _proxy_of(parts)
+        if proxy is not None and parts.scheme == "http":
+            # the proxy is asked for the whole url
+            path = parts._replace(fragment="").geturl()
+            headers = dict(headers, **_proxy_headers(proxy))
+        else:
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+        connection = self._connection_of(parts, proxy)
+        try:
+            connection.request("GET", path, headers=headers)
+            return connection.getresponse()
+        except CONNECTION_ERRORS:
+            # the server may have closed a kept connection
+            connection.close()
+            connection.request("GET", path, headers=headers)
+            return connection.getresponse()
+
+    def _connection_of(self, parts, proxy):
+        connections = getattr(self.__connections, "pool", None)
+        if connections is None:
+            connections = self.__connections.pool = {}
+        key = (parts.scheme, parts.netloc, proxy)
+        connection = connections.get(key)
+        if connection is None:
+            connection = _connect(parts, proxy)
+            connections[key] = connection
+        return connection
+
+    def _lend_connection(self, url, response):
+        """Let the response use its connection until its body is read"""
+        parts = urlsplit(url)
+        connections = getattr(self.__connections, "pool", {})
+        key = (parts.scheme, parts.netloc, _proxy_of(parts))
+        connection = connections.pop(key, None)
+        if connection is not None:
+            response.on_read = partial(
+                _give_back, connections, key, connection
+            )
+
+    def _keep(self, response, body_file):
+        temporary_file = f"{body_file}.{os.getpid()}.part"
+        try:
+            with open(temporary_file, "wb") as body:
+                while True:
+                    chunk = response.read(64 * 1024)
+                    if not chunk:
+                        break
+                    body.write(chunk)
+            os.replace(temporary_file, body_file)
+        except BaseException:
+            _remove(temporary_file)
+            raise
+
+    def _evict(self):
+        """Drop the downloads not used within ttl, then the oldest used"""
+        with self.__lock:
+            entries = []
+            now = time.time()
+            for file_name in os.listdir(self.folder):
+                if not file_name.endswith(".json"):
+                    continue
+                meta_file = os.path.join(self.folder, file_name)
+                body_file = meta_file[: -len(".json")] + ".body"
+                try:
+                    used = os.stat(meta_file).st_mtime
+                    size = os.stat(body_file).st_size
+                except OSError:
+                    continue
+                if self.ttl is not None and now - used > self.ttl:
+                    _remove(meta_file)
+                    _remove(body_file)
+                    continue
+                entries.append((used, size, meta_file, body_file))
+            if self.max_bytes is None:
+                return
+            entries.sort()
+            total = sum(entry[1] for entry in entries)
+            for _, size, meta_file, body_file in entries:
+                if total <= self.max_bytes:
+                    break
+                _remove(meta_file)
+                _remove(body_file)
+                total -= size
+
+
+HTTP_CACHE = None
+
+
+def enable_http_cache(folder=None, max_bytes=256 * 1024 * 1024, ttl=None):
+    """
+    Keep downloads of url sources on disk
+
+    A later call with the same url downloads again only if the server
+    says the file has changed. See :class:`HttpCache` for the
+    parameters.
+    """
+    global HTTP_CACHE
+    HTTP_CACHE = HttpCache(folder=folder, max_bytes=max_bytes, ttl=ttl)
+
+
+def disable_http_cache():
+    """
+    Download url sources every time. The files on disk are kept
+    """
+    global HTTP_CACHE
+    HTTP_CACHE = None
+
+
+def clear_http_cache():
+    """
+    Delete the downloads kept on disk
+    """
+    if HTTP_CACHE is not None:
+        HTTP_CACHE.clear()
+
+
+def _read_meta(meta_file):
+    try:
+        with open(meta_file, "r") as meta:
+            return json.load(meta)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_file, meta):
+    temporary_file = f"{meta_file}.{os.getpid()}.part"
+    with open(temporary_file, "w") as meta_stream:
+        json.dump(meta, meta_stream)
+    os.replace(temporary_file, meta_file)
+
+
+def _remove(file_name):
+    try:
+        os.remove(file_name)
+    except OSError:
+        pass
+
+
+def _proxy_of(parts):
+    """The split url of the proxy urllib would use for the url, if any"""
+    proxy = getproxies().get(parts.scheme)
+    if not proxy or proxy_bypass(parts.hostname or ""):
+        return None
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    return urlsplit(proxy)
+
+
+def _proxy_headers(proxy):
+    if proxy.username is None:
+        return {}
+    user_pass = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    credentials = base64.b64encode(user_pass.encode("utf-8")).decode("ascii")
+    return {"Proxy-Authorization": "Basic " + credentials}
+
+
+def _connect(parts, proxy):
+    """A connection to the host of the url, through the proxy if any"""
+    if proxy is None:
+        if parts.scheme == "https":
+            connection = http.client.HTTPSConnection(parts.netloc)
+        else:
+            connection = http.client.HTTPConnection(parts.netloc)
+    else:
+        port = proxy.port or http.client.HTTP_PORT
+        if parts.scheme == "https":
+            # the proxy tunnels the encrypted connection to the host
+            connection = http.client.HTTPSConnection(proxy.hostname, port)
+            connection.set_tunnel(
+                parts.hostname, parts.port, headers=_proxy_headers(proxy)
+            )
+        else:
+            connection = http.client.HTTPConnection(proxy.hostname, port)
+    connection.response_class = PooledResponse
+    return connection
+
+
+def _give_back(connections, key, connection):
+    """Put a connection back in the pool, unless another took its place"""
+    if connections.setdefault(key, connection) is not connection:
+        connection.close()
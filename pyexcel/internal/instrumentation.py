@@ -0,0 +1,411 @@
+"""
+pyexcel.internal.instrumentation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Tell where the time goes when reading and writing
+
+Listeners are called with a :class:`Measurement` at the end of each
+stage of a signature function:
+
+resolve
+    finding the source plugin for the keywords
+read
+    parsing the file, or taking the data, into two dimensional arrays
+rows
+    pulling the rows of an on demand read, e.g. iget_array, once they
+    are exhausted or closed
+uniform
+    making a new sheet's rows equally long
+naming
+    naming a new sheet's columns and rows
+render
+    writing a sheet or a book to the destination
+total
+    the whole signature function call
+pickle
+    sending the cells to worker processes and their results back, per
+    chunk of rows of parallel_map
+memory
+    the peak bytes allocated during the call and the rows and cells it
+    returned, or pulled for an on demand read. Only after
+    enable_memory_tracking
+
+Nothing is measured while there are no listeners. Memory is traced by
+tracemalloc, which slows python down, and its peak is shared by the
+whole process: calls overlapping in threads, or rows pulled while
+other calls run, see each other's allocations.
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License
+"""
+
+import os
+import sys
+import types
+import inspect
+import functools
+import tracemalloc
+from time import perf_counter
+from threading import Lock
+from contextvars import ContextVar
+from itertools import chain
+from collections import namedtuple
+
+Measurement = namedtuple(
+    "Measurement", ["call", "stage", "seconds", "rows", "cells", "nbytes"]
+)
+
+LISTENERS = []
+CALL = ContextVar("pyexcel_call", default=None)
+STOP = object()
+TRACK_MEMORY = False
+STARTED_TRACING = False
+
+
+def add_timing_listener(listener):
+    """
+    Call a function with a Measurement after each stage of the signature
+    functions
+    """
+    LISTENERS.append(listener)
+
+
+def remove_timing_listener(listener):
+    """
+    Stop calling a function added by add_timing_listener
+    """
+    LISTENERS.remove(listener)
+
+
+def enable_memory_tracking():
+    """
+    Add a "memory" measurement to each signature function call: the
+    peak bytes allocated during the call and the cells it returned
+    """
+    global TRACK_MEMORY, STARTED_TRACING
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        STARTED_TRACING = True
+    TRACK_MEMORY = True
+
+
+def disable_memory_tracking():
+    """
+    Stop measuring memory, and tracing it if enable_memory_tracking
+    started to
+    """
+    global TRACK_MEMORY, STARTED_TRACING
+    TRACK_MEMORY = False
+    if STARTED_TRACING:
+        tracemalloc.stop()
+        STARTED_TRACING = False
+
+
+class Stage:
+    """A stage being timed"""
+
+    __slots__ = ("name", "call", "started")
+
+    def __init__(self, name):
+        self.name = name
+        self.call = CALL.get()
+        self.started = perf_counter()
+
+    def done(self, rows=None, cells=None, nbytes=None):
+        """Tell the listeners how long the stage took"""
+        seconds = perf_counter() - self.started
+        emit(Measurement(self.call, self.name, seconds, rows, cells, nbytes))
+
+
+class MemoryStage(Stage):
+    """The memory of a call being traced"""
+
+    __slots__ = ("baseline",)
+
+    def __init__(self):
+        Stage.__init__(self, "memory")
+        self.baseline = tracemalloc.get_traced_memory()[0]
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    def done(self, rows=None, cells=None, nbytes=None):
+        peak = tracemalloc.get_traced_memory()[1] - self.baseline
+        Stage.done(self, rows, cells, max(peak, 0))
+
+    def follow(self, rows):
+        """Trace until the rows of an on demand read are pulled"""
+        row_count = cell_count = 0
+        try:
+            for row in rows:
+                row_count += 1
+                cell_count += len(row)
+                yield row
+        finally:
+            self.done(row_count, cell_count)
+
+
+def stage(name):
+    """Start timing a stage, or return None if no one listens"""
+    if LISTENERS:
+        return Stage(name)
+    return None
+
+
+def emit(measurement):
+    for listener in list(LISTENERS):
+        listener(measurement)
+
+
+def instrumented(function):
+    """Measure a signature function as a whole, named as the call
+
+    A generator function is measured until its first item, as it reads
+    its source then.
+    """
+    if inspect.isgeneratorfunction(function):
+        return _instrumented_generator(function)
+
+    @functools.wraps(function)
+    def measured_function(*args, **keywords):
+        if not LISTENERS or CALL.get() is not None:
+            return function(*args, **keywords)
+        token = CALL.set(function.__name__)
+        try:
+            measured = Stage("total")
+            memory = MemoryStage() if TRACK_MEMORY else None
+            result = function(*args, **keywords)
+            measured.done()
+            if memory:
+                if isinstance(result, types.GeneratorType):
+                    return memory.follow(result)
+                memory.done(*count_cells(result))
+            return result
+        finally:
+            CALL.reset(token)
+
+    return measured_function
+
+
+def _instrumented_generator(function):
+    @functools.wraps(function)
+    def measured_generator(*args, **keywords):
+        items = function(*args, **keywords)
+        if not LISTENERS or CALL.get() is not None:
+            yield from items
+            return
+        token = CALL.set(function.__name__)
+        try:
+            measured = Stage("total")
+            memory = MemoryStage() if TRACK_MEMORY else None
+            first = next(items, STOP)
+            measured.done()
+        finally:
+            CALL.reset(token)
+        if first is STOP:
+            if memory:
+                memory.done(0, 0)
+            return
+        if memory:
+            items = memory.follow(chain((first,), items))
+            yield from items
+            return
+        yield first
+        yield from items
+
+    return measured_generator
+
+
+def count_rows(rows):
+    """Measure the pulling of rows, which happens after the call"""
+    return _count_rows(Stage("rows"), rows)
+
+
+def _count_rows(measured, rows):
+    seconds = 0.0
+    row_count = cell_count = 0
+    rows = iter(rows)
+    try:
+        while True:
+            started = perf_counter()
+            try:
+                row = next(rows)
+            except StopIteration:
+                break
+            finally:
+                seconds += perf_counter() - started
+            row_count += 1
+            cell_count += len(row)
+            yield row
+    finally:
+        emit(
+            Measurement(
+                measured.call,
+                measured.name,
+                seconds,
+                row_count,
+                cell_count,
+                None,
+            )
+        )
+
+
+def count_sheets(sheets):
+    """
+    Count the rows and cells read. Rows read on demand are counted as
+    they are pulled
+
+    :returns: the rows and the cells, None if they are read on demand
+    """
+    rows = cells = 0
+    for name, array in sheets.items():
+        if isinstance(array, list):
+            rows += len(array)
+            cells += sum(map(len, array))
+        elif hasattr(array, "number_of_rows"):
+            # a matrix from the cache of parsed files
+            rows += array.number_of_rows()
+            cells += array.number_of_rows() * array.number_of_columns()
+        else:
+            sheets[name] = count_rows(array)
+            rows = cells = None
+    return rows, cells
+
+
+def count_cells(result):
+    """The rows and cells of what a signature function returned"""
+    if hasattr(result, "number_of_rows"):
+        rows = result.number_of_rows()
+        return rows, rows * result.number_of_columns()
+    if hasattr(result, "number_of_sheets"):
+        return _add_up(count_cells(sheet) for sheet in result)
+    if isinstance(result, dict):
+        values = list(result.values())
+        if all(map(_is_table, values)):
+            # a dictionary of sheets
+            return _add_up(count_cells(array) for array in values)
+        if all(isinstance(value, list) for value in values):
+            # a dictionary of columns
+            return max(map(len, values), default=0), sum(map(len, values))
+    if _is_table(result):
+        return len(result), sum(map(len, result))
+    return None, None
+
+
+def _is_table(value):
+    return isinstance(value, list) and all(
+        isinstance(row, (list, tuple, dict)) for row in value
+    )
+
+
+def _add_up(counts):
+    rows = cells = 0
+    for row_count, cell_count in counts:
+        if row_count is None:
+            return None, None
+        rows += row_count
+        cells += cell_count
+    return rows, cells
+
+
+def size_of(keywords):
+    """The bytes of the file named, or the content given, if known"""
+    file_name = keywords.get("file_name")
+    if isinstance(file_name, (str, os.PathLike)):
+        try:
+            return os.path.getsize(file_name)
+        except OSError:
+            return None
+    content = keywords.get("file_content")
+    if isinstance(content, (str, bytes)):
+        return len(content)
+    return None
+
+
+class TimingCollector:
+    """
+    Add up the measurements per call and stage, and print a breakdown
+
+    The memory stage keeps the largest of its measurements instead.
+
+    Example::
+
+        >>> import pyexcel as p
+        >>> with p.TimingCollector() as timings:
+        ...     p.get_array(array=[[1, 2], [3, 4]])
+        [[1, 2], [3, 4]]
+        >>> timings.totals[("get_array", "uniform")]["rows"]
+        2
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.__lock = Lock()
+
+    def __call__(self, measurement):
+        key = (measurement.call, measurement.stage)
+        with self.__lock:
+            total = self.totals.get(key)
+            if total is None:
+                total = self.totals[key] = {
+                    "count": 0,
+                    "seconds": 0.0,
+                    "rows": 0,
+                    "cells": 0,
+                    "nbytes": 0,
+                }
+            total["count"] += 1
+            total["seconds"] += measurement.seconds
+            for field in ("rows", "cells", "nbytes"):
+                value = getattr(measurement, field)
+                if value is None:
+                    continue
+                if measurement.stage == "memory":
+                    # the largest of the peaks and of the live cells
+                    total[field] = max(total[field], value)
+                else:
+                    total[field] += value
+
+    def __enter__(self):
+        add_timing_listener(self)
+        return self
+
+    def __exit__(self, *_):
+        remove_timing_listener(self)
+
+    def clear(self):
+        """Forget the measurements so far"""
+        with self.__lock:
+            self.totals.clear()
+
+    def breakdown(self):
+        """Return a table of the totals, slowest stages first"""
+        lines = [
+            ("call", "stage", "count", "seconds", "rows", "cells", "bytes")
+        ]
+        totals = sorted(
+            self.totals.items(), key=lambda item: -item[1]["seconds"]
+        )
+        for (call, stage_name), total in totals:
+            lines.append(
+                (
+                    call or "-",
+                    stage_name,
+                    str(total["count"]),
+                    f"{total['seconds']:.6f}",
+                    str(total["rows"]),
+                    str(total["cells"]),
+                    str(total["nbytes"]),
+                )
+            )
+        widths = [max(map(len, column)) for column in zip(*lines)]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if index < 2 else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(line, widths))
+            ).rstrip()
+            for line in lines
+        )
+
+    def print_breakdown(self, file=None):
+        """Print the table of the totals"""
+        print(self.breakdown(), file=file or sys.stdout)
@@ -0,0 +1,107 @@
+"""
+pyexcel.internal.parallel
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Run independent jobs, e.g. one per sheet, in worker threads or processes
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License
+"""
+
+import os
+import pickle
+from time import perf_counter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from pyexcel.internal.instrumentation import Measurement, emit, stage
+
+
+def run_in_workers(function, items, workers=None, processes=False):
+    """Call a function on each item and return the results in order
+
+    :param int workers: the number of workers. None, 0 or 1 runs the
+                        calls one after another in this thread
+    :param bool processes: use worker processes instead of threads. The
+                           function, the items and the results are
+                           pickled, so the function has to be defined
+                           at module level
+    """
+    items = list(items)
+    if not workers or workers < 2 or len(items) < 2:
+        return [function(item) for item in items]
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor_class(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(function, items))
+
+
+def imap_in_processes(function, items, workers=None):
+    """Yield the results of a function on each item, in the item order
+
+    The calls run in worker processes. Two items per worker are taken
+    ahead, so items read on demand are not all read at once. While
+    someone listens, a "pickle" measurement is given per item: the
+    seconds and the bytes taken to pickle the item to its worker and
+    the result back.
+
+    :param int workers: the number of processes, by default one per
+                        cpu. Fewer than 2 calls the function in this
+                        process
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 2:
+        yield from map(function, items)
+        return
+    measured = stage("pickle")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(_submit(executor, function, item, measured))
+                if len(pending) >= 2 * workers:
+                    yield _receive(*pending.popleft())
+            while pending:
+                yield _receive(*pending.popleft())
+        finally:
+            for future, _ in pending:
+                future.cancel()
+
+
+def _submit(executor, function, item, measured):
+    """Send an item to a worker, pickling it here if it is measured"""
+    if measured is None:
+        return executor.submit(function, item), None
+    started = perf_counter()
+    payload = pickle.dumps((function, item), pickle.HIGHEST_PROTOCOL)
+    seconds = perf_counter() - started
+    future = executor.submit(_call_pickled, payload)
+    return future, (measured.call, seconds, len(payload))
+
+
+def _receive(future, measured):
+    """The result of a worker, and its pickle measurement if any"""
+    if measured is None:
+        return future.result()
+    call, seconds, nbytes = measured
+    payload, worker_seconds = future.result()
+    started = perf_counter()
+    result = pickle.loads(payload)
+    seconds += worker_seconds + perf_counter() - started
+    nbytes += len(payload)
+    emit(Measurement(call, "pickle", seconds, None, None, nbytes))
+    return result
+
+
+def _call_pickled(payload):
+    """Unpickle a function and its item, call it and pickle the result
+
+    :returns: the pickled result and the seconds spent pickling
+    """
+    started = perf_counter()
+    function, item = pickle.loads(payload)
+    seconds = perf_counter() - started
+    result = function(item)
+    started = perf_counter()
+    payload = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    return payload, seconds + perf_counter() - started
@@ -8,26 +8,98 @@ Renderer and parser plugin manager
 :license: New BSD License
 """
 
+from threading import RLock
+
 from lml.plugin import PluginManager
 
+# plugins found for the keywords of earlier calls. Any registration
+# may change the answers, so it empties the dictionary
+RESOLUTIONS = {}
+# plugin discovery that has been put off until a plugin is looked up
+PENDING_DISCOVERY = []
+DISCOVERY_LOCK = RLock()
+DISCOVERING = []
+
+
+def discover_plugins():
+    """Run the plugin discovery that has been put off, if any
+
+    Other threads wait until it is done. In this thread, the plugins
+    being imported may look up plugins themselves, and see the ones
+    registered so far.
+    """
+    if not PENDING_DISCOVERY:
+        return
+    with DISCOVERY_LOCK:
+        if DISCOVERING:
+            return
+        DISCOVERING.append(True)
+        try:
+            while PENDING_DISCOVERY:
+                PENDING_DISCOVERY[-1]()
+                PENDING_DISCOVERY.pop()
+        finally:
+            DISCOVERING.clear()
+
 
 class IOPluginManager(PluginManager):
     """Generic plugin manager for renderer and parser"""
 
+    def load_me_later(self, plugin_info):
+        PluginManager.load_me_later(self, plugin_info)
+        RESOLUTIONS.clear()
+
+    def register_a_plugin(self, plugin_cls, plugin_info):
+        PluginManager.register_a_plugin(self, plugin_cls, plugin_info)
+        RESOLUTIONS.clear()
+
     def get_a_plugin(self, key, library=None):
         """get a plugin to handle the file type"""
         file_type = None
         if key:
             file_type = key.lower()
-        plugin_cls = self.load_me_now(file_type, library=library)
+        resolution = (self.plugin_name, file_type, library)
+        plugin_cls = RESOLUTIONS.get(resolution)
+        if plugin_cls is None:
+            discover_plugins()
+            plugin_cls = self.load_me_now(file_type, library=library)
+            RESOLUTIONS[resolution] = plugin_cls
 
         return plugin_cls(file_type)
 
     def get_all_file_types(self):
         """get all supported file types"""
+        discover_plugins()
         file_types = list(self.registry.keys())
         return file_types
 
+    def supports(self, file_type):
+        """tell if a plugin is registered for the file type"""
+        discover_plugins()
+        return file_type in self.registry
+
 
 RENDERER = IOPluginManager("renderer")
 PARSER = IOPluginManager("parser")
+
+
+def file_suffix(file_name):
+    """
+    The end of a file name that decides its file type
+
+    A file type without a dot can only match the extension or the end
+    of it, so the extension is enough. Otherwise, it is as long as the
+    longest file type.
+    """
+    length = RESOLUTIONS.get("file suffix length")
+    if length is None:
+        file_types = PARSER.get_all_file_types()
+        file_types += RENDERER.get_all_file_types()
+        length = 0
+        if any("." in file_type for file_type in file_types):
+            length = max(map(len, file_types))
+        RESOLUTIONS["file suffix length"] = length
+    file_name = file_name.lower()
+    if length:
+        return file_name[-length:]
+    return file_name.rpartition(".")[2]
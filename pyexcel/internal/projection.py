@@ -0,0 +1,101 @@
+"""
+pyexcel.internal.projection
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Keep only the wanted columns and rows while a source is being read
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License
+"""
+
+from pyexcel.constants import DEFAULT_NA
+
+from pyexcel_io.constants import SKIP_DATA, TAKE_DATA, STOP_ITERATION
+
+# parameters of pyexcel-io that select columns on their own
+COLUMN_PARAMETERS = ("start_column", "column_limit", "skip_column_func")
+
+
+def project_rows(rows, columns=None, where=None, header=False):
+    """Pick columns from each row and drop the rows not wanted
+
+    :param list columns: column indices or names. Names are looked up
+                         in the first row, which is then the header row
+    :param where: a function that receives a row, with the picked
+                  columns only, and returns False to drop it
+    :param bool header: whether the first row is the header row. The
+                        header row is kept without calling where
+    """
+    rows = iter(rows)
+    indices = None
+    if columns is not None:
+        indices = list(columns)
+        if any(isinstance(column, str) for column in indices):
+            header = True
+    if header:
+        names = next(rows, None)
+        if names is None:
+            return
+        if indices is not None:
+            indices = [
+                names.index(column) if isinstance(column, str) else column
+                for column in indices
+            ]
+            names = pick(names, indices)
+        yield names
+    for row in rows:
+        if indices is not None:
+            row = pick(row, indices)
+        if where is None or where(row):
+            yield row
+
+
+def project_sheet(rows, columns=None, where=None, header=False):
+    """Project the rows of a sheet that is read at once, see project_rows
+
+    The rows are returned as they are if nothing is asked for.
+    """
+    if columns is None and where is None:
+        return rows
+    return list(project_rows(rows, columns, where, header))
+
+
+def pick(row, indices):
+    """Return the cells at the given indices, blank if out of range"""
+    width = len(row)
+    return [
+        row[index] if -width <= index < width else DEFAULT_NA
+        for index in indices
+    ]
+
+
+def push_down_columns(columns, keywords):
+    """Let pyexcel-io skip the columns that are not wanted
+
+    Only non-negative column indices can be skipped while reading, and only
+    if no other column selection is given in the keywords.
+
+    :returns: the columns to pick from the rows read with the keywords
+    """
+    if not columns or any(
+        keywords.get(parameter) is not None
+        for parameter in COLUMN_PARAMETERS
+    ):
+        return columns
+    if not all(isinstance(index, int) and index >= 0 for index in columns):
+        return columns
+    wanted = sorted(set(columns))
+    keywords["skip_column_func"] = _column_skipper(set(wanted), wanted[-1])
+    positions = {index: position for position, index in enumerate(wanted)}
+    return [positions[index] for index in columns]
+
+
+def _column_skipper(wanted, last):
+    def skip_column(index, start, limit):
+        if index > last:
+            return STOP_ITERATION
+        if index in wanted:
+            return TAKE_DATA
+        return SKIP_DATA
+
+    return skip_column
@@ -0,0 +1,135 @@
+"""
+pyexcel.internal.records
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Make records of the rows read by iget_records
+
+The position of each field in the row is found once, from the headers,
+so that making a record costs one allocation.
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License
+"""
+
+from operator import itemgetter
+from itertools import zip_longest
+from collections import namedtuple
+
+from pyexcel import constants
+from pyexcel._compact import OrderedDict
+
+RECORD_TYPES = (
+    OrderedDict,
+    dict,
+    tuple,
+    constants.RECORD_NAMEDTUPLE,
+    constants.RECORD_SLOTS,
+)
+
+
+def record_maker(headers, custom_headers=None, record_type=OrderedDict):
+    """Return a function that makes a record of a row
+
+    :param list headers: the first row
+    :param list custom_headers: the fields to take, in this order
+    :param record_type: one of RECORD_TYPES
+    """
+    if record_type not in RECORD_TYPES:
+        raise ValueError(
+            constants.MESSAGE_UNKNOWN_RECORD_TYPE % (record_type, RECORD_TYPES)
+        )
+    headers = list(headers)
+    if custom_headers:
+        # a repeated header names its last column, as in a dictionary
+        positions = {name: index for index, name in enumerate(headers)}
+        fields = list(custom_headers)
+        values = _values_at([positions[name] for name in fields])
+    elif record_type in (OrderedDict, dict):
+        # cells beyond the headers are kept, as they always were
+        def make_dictionary(row):
+            return record_type(
+                zip_longest(headers, row, fillvalue=constants.DEFAULT_NA)
+            )
+
+        return make_dictionary
+    else:
+        fields = headers
+        values = _values_of(len(headers))
+    if record_type is tuple:
+        return values
+    if record_type in (OrderedDict, dict):
+        return lambda row: record_type(zip(fields, values(row)))
+    fields = namedtuple("Record", map(str, fields), rename=True)._fields
+    if record_type == constants.RECORD_NAMEDTUPLE:
+        record_class = namedtuple("Record", fields)
+        return lambda row: record_class._make(values(row))
+    record_class = slots_record(fields)
+    return lambda row: record_class(*values(row))
+
+
+def slots_record(fields):
+    """Make a record class of the fields, which keeps them in slots
+
+    :param fields: names that are identifiers, as namedtuple checks
+    """
+    arguments = ", ".join(("self",) + tuple(fields))
+    assignments = "".join(f"\n    self.{name} = {name}" for name in fields)
+    namespace = {}
+    exec(f"def __init__({arguments}):{assignments or ' pass'}", namespace)
+
+    def __iter__(self):
+        return (getattr(self, name) for name in fields)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __repr__(self):
+        pairs = zip(fields, self)
+        return "Record(%s)" % ", ".join(f"{k}={v!r}" for k, v in pairs)
+
+    def _asdict(self):
+        return dict(zip(fields, self))
+
+    return type(
+        "Record",
+        (),
+        {
+            "__slots__": tuple(fields),
+            "_fields": tuple(fields),
+            "__init__": namespace["__init__"],
+            "__iter__": __iter__,
+            "__eq__": __eq__,
+            "__hash__": None,
+            "__repr__": __repr__,
+            "_asdict": _asdict,
+        },
+    )
+
+
+def _values_of(width):
+    """The cells of a row, cut or padded to the width"""
+
+    def values(row):
+        if len(row) == width:
+            return tuple(row)
+        row = tuple(row[:width])
+        return row + (constants.DEFAULT_NA,) * (width - len(row))
+
+    return values
+
+
+def _values_at(positions):
+    """The cells of a row at the positions, empty if the row is short"""
+    take = itemgetter(*positions)
+    reach = max(positions) + 1
+    single = len(positions) == 1
+
+    def values(row):
+        if len(row) < reach:
+            row = list(row) + [constants.DEFAULT_NA] * (reach - len(row))
+        picked = take(row)
+        return (picked,) if single else picked
+
+    return values
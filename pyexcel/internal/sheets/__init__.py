@@ -10,3 +10,4 @@ Core functionality of pyexcel, data model
 
 # flake8: noqa
 from .matrix import Row, Column, Matrix, transpose
+from .grouping import Groups, GroupView
@@ -0,0 +1,191 @@
+"""
+pyexcel.internal.sheets.aggregation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Sum, count, min, max and mean of columns, per group of rows
+
+The rows are read once. Only a key and a few running totals are kept
+per group, so rows read on demand are never held in memory.
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License, see LICENSE for more details
+"""
+
+from pyexcel import constants
+
+MEASURES = ("sum", "count", "min", "max", "mean")
+EMPTY = (constants.DEFAULT_NA, None)
+# the running totals of a new group, but mean, which keeps a sum and count
+_START = {"sum": 0, "count": 0, "min": None, "max": None}
+
+
+class Aggregation:
+    """The running totals of each group, fed a row at a time
+
+    Rows may be lists, whose columns are found by index or by the
+    column names given, or dictionaries such as records, whose columns
+    are found by key. Empty cells are left out of all measures.
+    """
+
+    def __init__(self, by=None, measures=None, colnames=None):
+        """
+        :param by: the key column, or a list of them. None puts all rows
+                   in one group
+        :param dict measures: the columns, or a list of them, keyed by
+                              "sum", "count", "min", "max" or "mean".
+                              count=True counts the rows
+        :param list colnames: the names of the columns of list rows,
+                              empty if they have none. None takes the
+                              rows for dictionaries
+        :raises ValueError: if a column is named but list rows have no
+                            column names
+        """
+        self.__rows_are_lists = colnames is not None
+        self.__colnames = list(colnames or [])
+        by = _as_list(by)
+        self.__by = [self.__locate(column) for column in by]
+        self.__header = [self.__name_of(column) for column in by]
+        self.__measures = []
+        measures = measures or {}
+        for kind in MEASURES:
+            columns = measures.get(kind)
+            if columns is None or columns is False:
+                continue
+            if kind == "count" and columns is True:
+                self.__measures.append((kind, None))
+                self.__header.append(kind)
+                continue
+            for column in _as_list(columns):
+                self.__measures.append((kind, self.__locate(column)))
+                self.__header.append(f"{kind}({self.__name_of(column)})")
+        self.__groups = {}
+
+    def add(self, row):
+        """Take a row into the totals of its group"""
+        self.add_rows((row,))
+
+    def add_rows(self, rows):
+        """Take the rows into the totals of their groups"""
+        by = self.__by
+        measures = self.__measures
+        groups = self.__groups
+        for row in rows:
+            try:
+                key = tuple([row[index] for index in by])
+            except (IndexError, KeyError):
+                key = tuple([_cell(row, index) for index in by])
+            state = groups.get(key)
+            if state is None:
+                state = groups[key] = [
+                    [0, 0] if kind == "mean" else _START[kind]
+                    for kind, _ in measures
+                ]
+            slot = -1
+            for kind, index in measures:
+                slot += 1
+                if index is None:
+                    state[slot] += 1
+                    continue
+                try:
+                    value = row[index]
+                except (IndexError, KeyError):
+                    continue
+                if value in EMPTY:
+                    continue
+                if kind == "sum":
+                    state[slot] += value
+                elif kind == "count":
+                    state[slot] += 1
+                elif kind == "min":
+                    if state[slot] is None or value < state[slot]:
+                        state[slot] = value
+                elif kind == "max":
+                    if state[slot] is None or value > state[slot]:
+                        state[slot] = value
+                else:
+                    totals = state[slot]
+                    totals[0] += value
+                    totals[1] += 1
+
+    def to_array(self):
+        """The header, then a row per group in the order first seen"""
+        array = [list(self.__header)]
+        for key, state in self.__groups.items():
+            row = list(key)
+            for (kind, _), value in zip(self.__measures, state):
+                if kind == "mean":
+                    total, count = value
+                    value = total / count if count else None
+                if value is None:
+                    value = constants.DEFAULT_NA
+                row.append(value)
+            array.append(row)
+        return array
+
+    def to_sheet(self, name=constants.DEFAULT_NAME):
+        """A sheet of the groups, its columns named by the header"""
+        from pyexcel.sheet import Sheet
+
+        return Sheet(self.to_array(), name=name, name_columns_by_row=0)
+
+    def __locate(self, column):
+        if isinstance(column, str) and self.__rows_are_lists:
+            if not self.__colnames:
+                raise ValueError(constants.MESSAGE_NO_COLUMN_NAMES % column)
+            return self.__colnames.index(column)
+        return column
+
+    def __name_of(self, column):
+        if self.__colnames and isinstance(column, int):
+            return self.__colnames[column]
+        return str(column)
+
+
+def aggregate_records(
+    records, by=None, sum=None, count=None, min=None, max=None, mean=None
+):
+    """Aggregate records, e.g. from iget_records, as they are read
+
+    Only the running totals of each group are kept in memory. See
+    :meth:`pyexcel.Sheet.aggregate` for the parameters, which are keys
+    of the records here.
+
+    Example::
+
+        >>> import pyexcel as p
+        >>> records = [
+        ...     {"customer": "ann", "quantity": 2},
+        ...     {"customer": "bob", "quantity": 1},
+        ...     {"customer": "ann", "quantity": 3},
+        ... ]
+        >>> p.aggregate_records(records, by="customer", sum="quantity")
+        pyexcel sheet:
+        +----------+---------------+
+        | customer | sum(quantity) |
+        +==========+===============+
+        | ann      | 5             |
+        +----------+---------------+
+        | bob      | 1             |
+        +----------+---------------+
+
+    :returns: a :class:`pyexcel.Sheet`
+    """
+    measures = dict(sum=sum, count=count, min=min, max=max, mean=mean)
+    aggregation = Aggregation(by, measures)
+    aggregation.add_rows(records)
+    return aggregation.to_sheet()
+
+
+def _as_list(columns):
+    if columns is None:
+        return []
+    if isinstance(columns, (list, tuple)):
+        return list(columns)
+    return [columns]
+
+
+def _cell(row, index):
+    try:
+        return row[index]
+    except (IndexError, KeyError):
+        return constants.DEFAULT_NA
@@ -8,7 +8,6 @@ Generic table column
 :license: New BSD License
 """
 
-import copy
 import types
 
 from pyexcel import _compact as compact
@@ -257,12 +256,12 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         :return: self
         """
         if isinstance(other, compact.OrderedDict):
-            self._ref.extend_columns(copy.deepcopy(other))
+            self._ref.extend_columns(other)
         elif isinstance(other, list):
-            self._ref.extend_columns(copy.deepcopy(other))
+            self._ref.extend_columns(other)
         elif hasattr(other, "get_internal_array"):
             self._ref.extend_columns_with_rows(
-                copy.deepcopy(other.get_internal_array()),
+                list(other.get_internal_array()),
             )
         else:
             raise TypeError
@@ -275,12 +274,12 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         """
         new_instance = self._ref.clone()
         if isinstance(other, compact.OrderedDict):
-            new_instance.extend_columns(copy.deepcopy(other))
+            new_instance.extend_columns(other)
         elif isinstance(other, list):
-            new_instance.extend_columns(copy.deepcopy(other))
+            new_instance.extend_columns(other)
         elif hasattr(other, "get_internal_array"):
             new_instance.extend_columns_with_rows(
-                copy.deepcopy(other.get_internal_array()),
+                list(other.get_internal_array()),
             )
         else:
             raise TypeError
@@ -291,6 +290,9 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         """
         Refer to sheet.column.name
         """
+        if attr == "_ref":
+            # not set yet while being unpickled
+            raise AttributeError(attr)
         the_attr = attr
         if attr not in self._ref.colnames:
             the_attr = the_attr.replace("_", " ")
@@ -311,19 +313,20 @@ class Column(utils.CommonPropertyAmongRowNColumn):
         new_indices = columns
         if len(self._ref.colnames) > 0:
             new_indices = utils.names_to_indices(columns, self._ref.colnames)
-        converter = utils.CommonPropertyAmongRowNColumn.get_converter(
-            theformatter,
-        )
+        if isinstance(theformatter, types.FunctionType):
+            converter = theformatter
+
+            def handle_one_column(index):
+                self._ref._map_column(index, converter)
+
+        else:
+
+            def handle_one_column(index):
+                self._ref._format_column(index, theformatter)
 
         if isinstance(new_indices, list):
             for rcolumn in self._ref.column_range():
                 if rcolumn in new_indices:
-                    for row in self._ref.row_range():
-                        value = self._ref.cell_value(row, rcolumn)
-                        value = converter(value)
-                        self._ref.cell_value(row, rcolumn, value)
+                    handle_one_column(rcolumn)
         else:
-            for row in self._ref.row_range():
-                value = self._ref.cell_value(row, new_indices)
-                value = converter(value)
-                self._ref.cell_value(row, new_indices, value)
+            handle_one_column(new_indices)
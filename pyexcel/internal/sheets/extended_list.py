@@ -9,3 +9,106 @@ class PyexcelList(list):
         sheet = get_sheet(adict=c)
         sheet.rownames = ["names", "counts"]
         return sheet
+
+
+class IndexedList(list):
+    """A list that finds the position of an item through a dictionary
+
+    It keeps column and row names, so that looking up a name takes the
+    same time however many names there are. The dictionary is built on
+    the first lookup, kept up to date by appends and dropped by any
+    other change to the list.
+    """
+
+    # unpickling extends the list before the instance dictionary is set
+    _positions = None
+
+    def __init__(self, iterable=()):
+        list.__init__(self, iterable)
+        self._positions = None
+
+    def __getstate__(self):
+        # so that a copy, or an unpickled list, builds its own dictionary
+        return None
+
+    def index(self, item, *args):
+        if args:
+            return list.index(self, item, *args)
+        try:
+            return self._lookup()[item]
+        except KeyError:
+            raise ValueError(f"{item!r} is not in list")
+        except TypeError:
+            # unhashable items can only be searched for
+            return list.index(self, item)
+
+    def __contains__(self, item):
+        try:
+            return item in self._lookup()
+        except TypeError:
+            return list.__contains__(self, item)
+
+    def append(self, item):
+        self._note(item, len(self))
+        list.append(self, item)
+
+    def extend(self, items):
+        items = list(items)
+        for position, item in enumerate(items, len(self)):
+            self._note(item, position)
+        list.extend(self, items)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def insert(self, position, item):
+        self._positions = None
+        list.insert(self, position, item)
+
+    def pop(self, *args):
+        self._positions = None
+        return list.pop(self, *args)
+
+    def remove(self, item):
+        self._positions = None
+        list.remove(self, item)
+
+    def clear(self):
+        self._positions = None
+        list.clear(self)
+
+    def sort(self, *args, **kwargs):
+        self._positions = None
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self):
+        self._positions = None
+        list.reverse(self)
+
+    def __setitem__(self, position, item):
+        self._positions = None
+        list.__setitem__(self, position, item)
+
+    def __delitem__(self, position):
+        self._positions = None
+        list.__delitem__(self, position)
+
+    def __imul__(self, times):
+        self._positions = None
+        return list.__imul__(self, times)
+
+    def _lookup(self):
+        if self._positions is None:
+            positions = {}
+            for position, item in enumerate(self):
+                positions.setdefault(item, position)
+            self._positions = positions
+        return self._positions
+
+    def _note(self, item, position):
+        if self._positions is not None:
+            try:
+                self._positions.setdefault(item, position)
+            except TypeError:
+                self._positions = None
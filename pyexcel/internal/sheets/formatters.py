@@ -113,6 +113,20 @@ def default_formatter(value, _):
     return json.dumps(value)
 
 
+def typed_formatter(from_type, to_type):
+    """Return a converter for values that are all of the same type
+
+    It does the conversion function lookup of :func:`to_format` once
+    instead of per value.
+    """
+    func = CONVERSION_FUNCTIONS.get(from_type, default_formatter)
+
+    def converter(value):
+        return func(value, to_type)
+
+    return converter
+
+
 def to_format(to_type, value):
     """Wrapper utility function for format different formats
 
@@ -0,0 +1,135 @@
+"""
+pyexcel.internal.sheets.grouping
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Group the rows of a matrix by the values of one or more columns
+
+A group keeps the indices of its rows in an array. The rows are read
+only when the group is iterated, made a sheet or printed.
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License, see LICENSE for more details
+"""
+
+from array import array
+from collections.abc import Mapping
+
+from pyexcel._compact import OrderedDict
+
+
+class Groups(Mapping):
+    """The groups of rows by key, in the order their keys first appear
+
+    A key is the cell of the key column, or a tuple of the cells of the
+    key columns.
+    """
+
+    def __init__(self, matrix, column_indices, colnames=None):
+        """
+        :param matrix: the rows to group, which must not change later
+        :param list column_indices: the key columns
+        :param list colnames: the column names of the rows, if any
+        """
+        self.__matrix = matrix
+        self.__colnames = colnames
+        self.__indices = {}
+        columns = [matrix.column_at(index) for index in column_indices]
+        if len(columns) == 1:
+            keys = columns[0]
+        else:
+            keys = zip(*columns)
+        groups = self.__indices
+        for row_index, key in enumerate(keys):
+            indices = groups.get(key)
+            if indices is None:
+                indices = groups[key] = array("q")
+            indices.append(row_index)
+
+    def __getitem__(self, key):
+        return GroupView(
+            self.__matrix, key, self.__indices[key], self.__colnames
+        )
+
+    def __iter__(self):
+        return iter(self.__indices)
+
+    def __len__(self):
+        return len(self.__indices)
+
+    def sizes(self):
+        """The number of rows of each group"""
+        return OrderedDict(
+            (key, len(indices)) for key, indices in self.__indices.items()
+        )
+
+    def to_book(self):
+        """Make a book of a sheet per group, named after its key"""
+        from pyexcel.book import Book
+
+        sheets = OrderedDict()
+        for key in self:
+            name = _sheet_name(key)
+            if name in sheets:
+                name = f"{name}_{len(sheets)}"
+            sheets[name] = self[key].to_array()
+        return Book(sheets)
+
+    def __repr__(self):
+        return repr(self.to_book())
+
+    def __str__(self):
+        return str(self.to_book())
+
+
+class GroupView:
+    """The rows sharing a key, read from the grouped rows when needed"""
+
+    def __init__(self, matrix, key, indices, colnames=None):
+        self.__matrix = matrix
+        self.key = key
+        self.indices = indices
+        self.__colnames = colnames
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        return self.rows()
+
+    def rows(self):
+        """Iterate the rows of the group"""
+        return iter(self.__read())
+
+    def to_array(self):
+        """The rows, after the column names if any"""
+        array = self.__read()
+        if self.__colnames:
+            array.insert(0, list(self.__colnames))
+        return array
+
+    def __read(self):
+        return self.__matrix._rows_at(self.indices)
+
+    def to_sheet(self):
+        """Make a sheet of the rows, with the column names if any"""
+        from pyexcel.sheet import Sheet
+
+        return Sheet(
+            self.__read(),
+            name=_sheet_name(self.key),
+            colnames=self.__colnames,
+        )
+
+    def __repr__(self):
+        return repr(self.to_sheet())
+
+    def __str__(self):
+        return str(self.to_sheet())
+
+
+def _sheet_name(key):
+    if isinstance(key, str):
+        return key
+    if isinstance(key, tuple):
+        return ", ".join(str(part) for part in key)
+    return str(key)
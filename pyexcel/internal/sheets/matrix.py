@@ -9,8 +9,9 @@ of lookup.
 :license: New BSD License, see LICENSE for more details
 """
 
-import copy
+import sys
 import types
+import weakref
 from typing import Tuple, Union
 from functools import partial
 from itertools import chain
@@ -18,9 +19,18 @@ from itertools import chain
 from pyexcel import _compact as compact
 from pyexcel import constants
 from pyexcel.internal.meta import SheetMeta
+from pyexcel.internal.parallel import imap_in_processes
+from pyexcel.internal.instrumentation import stage
 from pyexcel.internal.sheets.row import Row
 from pyexcel.internal.sheets.column import Column
-from pyexcel.internal.sheets.formatters import to_format
+from pyexcel.internal.sheets.formatters import to_format, typed_formatter
+from pyexcel.internal.sheets.transform import (
+    map_chunk,
+    map_line,
+    map_lines,
+    map_positions,
+)
+from pyexcel.internal.sheets.typed_column import TypedColumn, infer_dtype
 from pyexcel.internal.sheets.extended_list import PyexcelList
 
 from . import _shared as utils
@@ -31,12 +41,40 @@ MatrixIndex = Union[Tuple[int, int], str]
 class Matrix(SheetMeta):
     """The internal representation of a sheet data. Each element
     can be of any python types
+
+    By default, the data is kept as a list of rows. When `storage` is
+    "columnar", it is kept as a list of columns instead so that column
+    reads, column formatting and column deletion become plain list
+    operations. Columns whose cells are all int, float, bool or date are
+    further packed into arrays, see :class:`TypedColumn`.
+
+    A matrix made from another matrix shares the stored lines with it.
+    Whichever changes first takes its own copy of the lines, so clones
+    and sums cost nothing until they are modified.
     """
 
-    def __init__(self, array):
+    def __init__(self, array, storage=constants.STORAGE_ROW):
         """
-        :param list array: a list of arrays or a generator
+        :param list array: a list of arrays, a generator or a matrix
+        :param str storage: "row" or "columnar"
         """
+        if storage not in constants.VALID_STORAGES:
+            raise ValueError(
+                constants.MESSAGE_UNKNOWN_STORAGE
+                % (storage, constants.VALID_STORAGES),
+            )
+        self.__sharers = None
+        self.__release = None
+        self.__storage = storage
+        self.row = Row(self)
+        self.column = Column(self)
+        self.name = "matrix"
+        if isinstance(array, Matrix):
+            if array.storage == storage:
+                self._borrow(array)
+                return
+            array = array.get_internal_array()
+        measured = stage("uniform")
         tmp_array = array
         if isinstance(array, types.GeneratorType):
             tmp_array = list(array)
@@ -45,20 +83,94 @@ class Matrix(SheetMeta):
             self.__width, self.__array = uniform(tmp_array)
         except TypeError:
             raise TypeError("Invalid two dimensional array")
-        self.row = Row(self)
-        self.column = Column(self)
-        self.name = "matrix"
+        if measured:
+            rows = len(self.__array)
+            measured.done(rows, rows * self.__width)
+        self.__columnar = False
+        if storage == constants.STORAGE_COLUMNAR:
+            self.__columnar = True
+            self.__width = len(self.__array)
+            self.__array = _columns_of(self.__array)
+
+    @property
+    def dtypes(self):
+        """The python type shared by all cells of each column
+
+        object is given for a column of mixed types.
+        """
+        if self.__columnar:
+            return [_dtype_of(column) for column in self.__array]
+        return [infer_dtype(cross) for cross in compact.czip(*self.__array)]
+
+    def memory_usage(self):
+        """Estimate the bytes taken by each column
+
+        A column takes its cells and its share of the lists holding
+        them. A cell object found in several places is counted once.
+        Packed columns take the bytes of their arrays.
+
+        :returns: a list of bytes, one per column
+        """
+        ncolumns = self.number_of_columns()
+        usage = [0] * ncolumns
+        if ncolumns == 0:
+            return usage
+        seen = set()
+        shared = 0
+        for index, line in enumerate(self.__array):
+            packed = getattr(line, "packed_data", None)
+            if packed is not None:
+                cells = [packed.itemsize] * len(packed)
+                holder = sys.getsizeof(packed) - sum(cells)
+            else:
+                cells = [
+                    POINTER_SIZE + _size_once(cell, seen) for cell in line
+                ]
+                holder = EMPTY_LIST_SIZE
+            if self.__columnar:
+                # the line is a column
+                usage[index] += holder + sum(cells)
+            else:
+                shared += holder
+                for column, size in enumerate(cells):
+                    usage[column] += size
+        share, remainder = divmod(shared, ncolumns)
+        usage = [size + share for size in usage]
+        usage[0] += remainder
+        return usage
+
+    @property
+    def storage(self):
+        """The layout of the data: "row" or "columnar" """
+        return self.__storage
 
     def get_internal_array(self):
-        """present internal array"""
+        """present internal array
+
+        For columnar storage, a list of rows is assembled on the fly.
+        """
+        if self.__storage == constants.STORAGE_ROW:
+            self._materialise()
+        if self.__columnar:
+            return list(_crosses(self.__array, self.__width))
+        if self.__storage == constants.STORAGE_COLUMNAR:
+            # a transposed columnar matrix keeps its rows in columns
+            return [list(line) for line in self.__array]
+        self._own()
         return self.__array
 
     def number_of_rows(self):
         """The number of rows"""
+        if self.__columnar:
+            return self.__width
         return len(self.__array)
 
     def number_of_columns(self):
         """The number of columns"""
+        if self.__columnar:
+            if self.__width > 0:
+                return len(self.__array)
+            return 0
         if self.number_of_rows() > 0:
             return self.__width
         return 0
@@ -83,13 +195,15 @@ class Matrix(SheetMeta):
         :param any new_value: new value if this is to set the value
         """
         fit = row < self.number_of_rows() and column < self.number_of_columns()
+        if self.__columnar:
+            row, column = column, row
         if new_value is None:
             if fit:
                 return self.__array[row][column]
             raise IndexError("Index out of range")
+        self._own()
         if not fit:
-            width, array = uniform(self.__array, row + 1, column + 1)
-            self.__width, self.__array = width, array
+            self._grow(row + 1, column + 1)
 
         self.__array[row][column] = new_value
 
@@ -98,12 +212,10 @@ class Matrix(SheetMeta):
         Gets the data at the specified row
         """
         if index in self.row_range():
-            return PyexcelList(copy.deepcopy(self.__array[index]))
+            return PyexcelList(self._row(index))
 
         if index < 0 and utils.abs(index) in self.row_range():
-            return PyexcelList(
-                copy.deepcopy(self.__array[index + self.number_of_rows()]),
-            )
+            return PyexcelList(self._row(index + self.number_of_rows()))
 
         raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -111,9 +223,11 @@ class Matrix(SheetMeta):
         """Update a row data range"""
         nrows = self.number_of_rows()
         if row_index < nrows:
-            self.__array[row_index] = data_array
-            if len(data_array) != self.number_of_columns():
-                self.__width, self.__array = uniform(self.__array)
+            self._own()
+            if self.__columnar:
+                self._replace_cross(row_index, data_array)
+            else:
+                self._replace_line(row_index, data_array)
         else:
             raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -135,34 +249,35 @@ class Matrix(SheetMeta):
         :raises IndexError: if row_index exceeds row range or starting
                             exceeds column range
         """
-        nrows = self.number_of_rows()
-        ncolumns = self.number_of_columns()
-        if row_index < nrows and starting < ncolumns:
-            real_len = len(data_array) + starting
-            end = min(real_len, ncolumns)
-            for i in range(starting, end):
-                self.cell_value(row_index, i, data_array[i - starting])
-            if real_len > ncolumns:
-                left = ncolumns - starting
-                self.__array[row_index] = (
-                    self.__array[row_index] + data_array[left:]
-                )
-            self.__width, self.__array = uniform(self.__array)
+        self._own()
+        if self.__columnar:
+            self._set_cross_from(row_index, data_array, starting)
         else:
-            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+            self._set_line_from(row_index, data_array, starting)
 
     def _extend_row(self, row):
-        array = copy.deepcopy(row)
-        if compact.is_array_type(array, list):
-            self.__array += array
+        if compact.is_array_type(row, list):
+            array = [list(line) for line in row]
+        else:
+            array = [list(row)]
+        self._own()
+        if self.__columnar:
+            height = self.__width + len(array)
+            self._extend_crosses(transpose(array), height)
         else:
-            self.__array.append(array)
+            width = self._inner_length()
+            start = len(self.__array)
+            self.__array += array
+            self.__width = _refit(
+                self.__array,
+                range(start, len(self.__array)),
+                width,
+            )
 
     def extend_rows(self, rows):
         """Inserts two dimensional data after the bottom row"""
         if isinstance(rows, list):
             self._extend_row(rows)
-            self.__width, self.__array = uniform(self.__array)
         else:
             raise TypeError(f"Cannot use {type(rows)}")
 
@@ -173,27 +288,22 @@ class Matrix(SheetMeta):
         if len(row_indices) > 0:
             nrows = self.number_of_rows()
             row_indices = [i if i >= 0 else nrows + i for i in row_indices]
-            unique_list = _unique(row_indices)
-            sorted_list = sorted(unique_list, reverse=True)
-            for i in sorted_list:
-                if i < nrows and i >= 0:
-                    del self.__array[i]
+            self._own()
+            if self.__columnar:
+                self._delete_crosses(row_indices, nrows)
+            else:
+                self._delete_lines(row_indices, nrows)
 
     def column_at(self, index):
         """
         Gets the data at the specified column
         """
-        cell_array = PyexcelList()
         if index in self.column_range():
-            for i in self.row_range():
-                cell_array.append(self.cell_value(i, index))
-            return cell_array
+            return PyexcelList(self._column(index))
 
         if index < 0 and utils.abs(index) in self.column_range():
             reverse_index = self.number_of_columns() + index
-            for i in self.row_range():
-                cell_array.append(self.cell_value(i, reverse_index))
-            return cell_array
+            return PyexcelList(self._column(reverse_index))
 
         raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
 
@@ -217,20 +327,11 @@ class Matrix(SheetMeta):
         :raises IndexError: if column_index exceeds column range
                             or starting exceeds row range
         """
-        nrows = self.number_of_rows()
-        ncolumns = self.number_of_columns()
-        if column_index < ncolumns and starting < nrows:
-            real_len = len(data_array) + starting
-            end = min(real_len, nrows)
-            for i in range(starting, end):
-                self.cell_value(i, column_index, data_array[i - starting])
-            if real_len > nrows:
-                for i in range(nrows, real_len):
-                    new_row = [""] * column_index + [data_array[i - starting]]
-                    self.__array.append(new_row)
-            self.__width, self.__array = uniform(self.__array)
+        self._own()
+        if self.__columnar:
+            self._set_line_from(column_index, data_array, starting)
         else:
-            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+            self._set_cross_from(column_index, data_array, starting)
 
     def extend_columns(self, columns):
         """Inserts two dimensional data after the rightmost column
@@ -254,21 +355,17 @@ class Matrix(SheetMeta):
         self._extend_columns_with_rows(incoming_data)
 
     def _extend_columns_with_rows(self, rows):
-        current_nrows = self.number_of_rows()
-        current_ncols = self.number_of_columns()
-        insert_column_nrows = len(rows)
-        array_length = min(current_nrows, insert_column_nrows)
-        for i in range(0, array_length):
-            array = copy.deepcopy(rows[i])
-            self.__array[i] += array
-        if current_nrows < insert_column_nrows:
-            delta = insert_column_nrows - current_nrows
-            base = current_nrows
-            for i in range(0, delta):
-                new_array = [constants.DEFAULT_NA] * current_ncols
-                new_array += rows[base + i]
-                self.__array.append(new_array)
-        self.__width, self.__array = uniform(self.__array)
+        self._own()
+        if self.__columnar:
+            start = len(self.__array)
+            self.__array += transpose(rows)
+            self.__width = _refit(
+                self.__array,
+                range(start, len(self.__array)),
+                self.__width,
+            )
+        else:
+            self._extend_crosses(rows)
 
     def extend_columns_with_rows(self, rows):
         """Rows were appended to the rightmost side
@@ -401,6 +498,7 @@ class Matrix(SheetMeta):
             +----+----+----+----+----+----+----+----+----+----+----+----+
 
         """
+        self._own()
         if rows:
             self._paste_rows(topleft_corner, rows)
         elif columns:
@@ -428,7 +526,6 @@ class Matrix(SheetMeta):
             else:
                 real_row = [constants.DEFAULT_NA] * topleft_corner[1] + row
                 self._extend_row(real_row)
-        self.__width, self.__array = uniform(self.__array)
 
     def _paste_columns(self, topleft_corner, columns):
         starting_column = topleft_corner[1]
@@ -445,7 +542,6 @@ class Matrix(SheetMeta):
                 real_column = [constants.DEFAULT_NA] * topleft_corner[0]
                 real_column += column
                 self.extend_columns([real_column])
-        self.__width, self.__array = uniform(self.__array)
 
     def delete_columns(self, column_indices):
         """Delete columns by specified list of indices"""
@@ -456,13 +552,11 @@ class Matrix(SheetMeta):
             column_indices = [
                 j if j >= 0 else ncols + j for j in column_indices
             ]
-            unique_list = _unique(column_indices)
-            sorted_list = sorted(unique_list, reverse=True)
-            for i in self.row_range():
-                for j in sorted_list:
-                    if j < ncols and j >= 0:
-                        del self.__array[i][j]
-            self.__width = longest_row_number(self.__array)
+            self._own()
+            if self.__columnar:
+                self._delete_lines(column_indices, ncols)
+            else:
+                self._delete_crosses(column_indices, ncols)
 
     def __setitem__(self, index: MatrixIndex, cell_value):
         """Override the operator to set items"""
@@ -498,14 +592,36 @@ class Matrix(SheetMeta):
     def transpose(self):
         """Rotate the data table by 90 degrees
 
-        Reference :func:`transpose`
+        Nothing is copied: the stored rows are read as columns from now
+        on, and vice versa. A row storage matrix lays its rows out again
+        only when the whole array is asked for, e.g. by
+        :meth:`get_internal_array`. Reference :func:`transpose`
         """
+        self.__columnar = not self.__columnar
+        if len(self.__array) == 0:
+            self.__width = 0
+
+    def _materialise(self):
+        """Lay the lines out as the storage says, after a transpose"""
+        columnar = self.__storage == constants.STORAGE_COLUMNAR
+        if self.__columnar == columnar:
+            return
+        nlines = len(self.__array)
+        # transpose builds new lines, so there is nothing to copy
+        self._unshare()
         self.__array = transpose(self.__array)
-        self.__width, self.__array = uniform(self.__array)
+        self.__columnar = columnar
+        # each new line has a cell from every old line
+        if columnar or len(self.__array) > 0:
+            self.__width = nlines
+        else:
+            self.__width = 0
+        if columnar:
+            self.__array = [TypedColumn(column) for column in self.__array]
 
     def to_array(self):
         """Get an array out"""
-        return self.__array
+        return self.get_internal_array()
 
     def __iter__(self):
         """
@@ -532,6 +648,8 @@ class Matrix(SheetMeta):
 
         More details see :class:`HTLBRIterator`
         """
+        if self.__columnar:
+            return chain(*compact.czip(*self.__array))
         return chain(*self.__array)
 
     def reverse(self):
@@ -553,7 +671,7 @@ class Matrix(SheetMeta):
 
         More details see :class:`HBRTLIterator`
         """
-        for row in reversed(self.__array):
+        for row in self.rrows():
             for cell in reversed(row):
                 yield cell
 
@@ -578,6 +696,8 @@ class Matrix(SheetMeta):
 
         More details see :class:`VTLBRIterator`
         """
+        if self.__columnar:
+            return chain(*self.__array)
         return chain(*compact.czip(*self.__array))
 
     def rvertical(self):
@@ -601,7 +721,7 @@ class Matrix(SheetMeta):
 
         More details see :class:`VBRTLIterator`
         """
-        for column in compact.czip(*(reversed(row) for row in self.__array)):
+        for column in self.rcolumns():
             for cell in reversed(column):
                 yield cell
 
@@ -626,8 +746,19 @@ class Matrix(SheetMeta):
 
         More details see :class:`RowIterator`
         """
-        for row in self.__array:
-            yield row
+        if self.__storage == constants.STORAGE_ROW:
+            # the rows yielded are the stored ones, even after a transpose
+            self._materialise()
+        if self.__columnar:
+            for row in _crosses(self.__array, self.__width):
+                yield row
+        elif self.__storage == constants.STORAGE_COLUMNAR:
+            for row in self.__array:
+                yield list(row)
+        else:
+            self._own()
+            for row in self.__array:
+                yield row
 
     def rrows(self):
         """
@@ -650,8 +781,19 @@ class Matrix(SheetMeta):
 
         More details see :class:`RowReverseIterator`
         """
-        for row in reversed(self.__array):
-            yield row
+        if self.__storage == constants.STORAGE_ROW:
+            # the rows yielded are the stored ones, even after a transpose
+            self._materialise()
+        if self.__columnar:
+            for index in reversed(self.row_range()):
+                yield self._row(index)
+        elif self.__storage == constants.STORAGE_COLUMNAR:
+            for row in reversed(self.__array):
+                yield list(row)
+        else:
+            self._own()
+            for row in reversed(self.__array):
+                yield row
 
     def columns(self):
         """
@@ -674,8 +816,12 @@ class Matrix(SheetMeta):
 
         More details see :class:`ColumnIterator`
         """
-        for row in compact.czip(*self.__array):
-            yield list(row)
+        if self.__columnar:
+            for column in self.__array:
+                yield list(column)
+        else:
+            for column in compact.czip(*self.__array):
+                yield list(column)
 
     def rcolumns(self):
         """
@@ -698,8 +844,13 @@ class Matrix(SheetMeta):
 
         More details see :class:`ColumnReverseIterator`
         """
-        for column in compact.czip(*(reversed(row) for row in self.__array)):
-            yield list(column)
+        if self.__columnar:
+            for column in reversed(self.__array):
+                yield list(column)
+        else:
+            reversed_rows = (reversed(row) for row in self.__array)
+            for column in compact.czip(*reversed_rows):
+                yield list(column)
 
     def filter(self, column_indices=None, row_indices=None):
         """Apply the filter with immediate effect"""
@@ -732,12 +883,27 @@ class Matrix(SheetMeta):
             [1, 1, 2, 1]
 
         """
-        custom_function = partial(to_format, formatter)
-        self.map(custom_function)
+        if self.__columnar:
+            for index in self.column_range():
+                self._format_column(index, formatter)
+        else:
+            converters = [
+                _converter_of(dtype, formatter) for dtype in self.dtypes
+            ]
+            self._own()
+            map_positions(self.__array, converters)
 
-    def map(self, custom_function):
+    def map(self, custom_function=None, column_functions=None):
         """Execute a function across all cells of the sheet
 
+        The functions are applied a row, or a column in columnar storage,
+        at a time. When a function returns None, the cell is unchanged.
+
+        :param custom_function: the function for all cells
+        :param dict column_functions: functions for individual columns,
+                                      keyed by column index. They are used
+                                      instead of custom_function
+
         Example::
 
             >>> import pyexcel as p
@@ -755,26 +921,318 @@ class Matrix(SheetMeta):
             >>> sheet.map(inc)
             >>> sheet.row[1]
             [2.0, 2.25, 3.0, 2.0]
+            >>> sheet.map(column_functions={0: str})
+            >>> sheet.row[1]
+            ['2.0', 2.25, 3.0, 2.0]
 
         """
-        for row in self.row_range():
-            for column in self.column_range():
-                value = self.cell_value(row, column)
-                value = custom_function(value)
-                self.cell_value(row, column, value)
+        self._own()
+        if not column_functions:
+            if custom_function is not None:
+                map_lines(self.__array, custom_function)
+            return
+        functions = [
+            column_functions.get(index, custom_function)
+            for index in self.column_range()
+        ]
+        if self.__columnar:
+            for line, function in zip(self.__array, functions):
+                if function is not None:
+                    map_line(line, function)
+        else:
+            map_positions(self.__array, functions)
+
+    def parallel_map(
+        self,
+        custom_function,
+        workers=None,
+        chunk_rows=constants.DEFAULT_CHUNK_ROWS,
+    ):
+        """Execute a function across all cells, in worker processes
+
+        The rows are sent to the workers chunk_rows at a time and the
+        results are put back in order. When the function returns None,
+        the cell is unchanged. The function, the cells and the results
+        are pickled, so the function has to be defined at module level
+        and is worth it only if it is slow for a cell. The time and the
+        bytes spent pickling are given as "pickle" measurements to the
+        timing listeners.
+
+        :param custom_function: the function for all cells
+        :param int workers: the number of processes, by default one per
+                            cpu. Fewer than 2 maps in this process
+        :param int chunk_rows: the rows sent to a worker at a time
+        """
+        if not isinstance(chunk_rows, int) or chunk_rows < 1:
+            raise ValueError(constants.MESSAGE_BAD_CHUNK_SIZE % (chunk_rows,))
+        self._own()
+        lines = self.__array
+        columnar = self.__columnar
+        spans = [
+            (start, start + chunk_rows)
+            for start in range(0, self.number_of_rows(), chunk_rows)
+        ]
+        if columnar:
+            chunks = (
+                [line[start:end] for line in lines] for start, end in spans
+            )
+        else:
+            chunks = (lines[start:end] for start, end in spans)
+        mapped_chunks = imap_in_processes(
+            partial(map_chunk, custom_function), chunks, workers
+        )
+        for chunk, (start, end) in zip(mapped_chunks, spans):
+            if columnar:
+                for line, piece in zip(lines, chunk):
+                    line[start:end] = piece
+            else:
+                lines[start:end] = chunk
 
     def __iadd__(self, other):
-        return _add(self.name, self.__array, other)
+        return _add(self.name, self, other)
 
     def __add__(self, other):
         """Overload the + sign
 
         :returns: a new book
         """
-        return _add(self.name, copy.deepcopy(self.__array), other)
+        return _add(self.name, self, other)
 
     def clone(self):
-        return Matrix(copy.deepcopy(self.__array))
+        return Matrix(self, storage=self.storage)
+
+    def _borrow(self, other):
+        """Share the stored lines of another matrix of the same storage"""
+        if other.__sharers is None:
+            other._hold([0])
+        self._hold(other.__sharers)
+        self.__storage = other.__storage
+        self.__columnar = other.__columnar
+        self.__width = other.__width
+        self.__array = other.__array
+
+    def _hold(self, sharers):
+        """Count this matrix among the sharers of its lines
+
+        A matrix that is garbage collected is no longer counted.
+        """
+        sharers[0] += 1
+        self.__sharers = sharers
+        self.__release = weakref.finalize(self, _let_go, sharers)
+
+    def _own(self):
+        """Copy the stored lines if they are shared, before a change
+
+        Cells are not copied. The last matrix holding the lines keeps
+        them as they are.
+        """
+        if self._unshare():
+            self.__array = [line.copy() for line in self.__array]
+
+    def _unshare(self):
+        """Stop sharing the stored lines
+
+        :returns: True if other matrices still hold the lines
+        """
+        if self.__sharers is None:
+            return False
+        self.__release()
+        others = self.__sharers[0] > 0
+        self.__sharers = None
+        self.__release = None
+        return others
+
+    def __getstate__(self):
+        """Pickle the lines as the matrix' own"""
+        state = self.__dict__.copy()
+        state["_Matrix__sharers"] = None
+        state["_Matrix__release"] = None
+        return state
+
+    def _row(self, index):
+        if self.__columnar:
+            return [column[index] for column in self.__array]
+        return self.__array[index]
+
+    def _rows_at(self, indices):
+        """Copies of the rows at the indices, in their order"""
+        if self.__columnar:
+            picked = [[column[i] for i in indices] for column in self.__array]
+            return [list(row) for row in zip(*picked)]
+        return list(map(list, map(self.__array.__getitem__, indices)))
+
+    def _column(self, index):
+        if self.__columnar:
+            return list(self.__array[index])
+        return [row[index] for row in self.__array]
+
+    def _map_row(self, index, custom_function):
+        """Apply a function to all cells of a row"""
+        if self.number_of_columns() == 0:
+            # a row of no cells
+            return
+        self._own()
+        if self.__columnar:
+            self._map_cross(index, custom_function)
+        else:
+            self._map_line(index, custom_function)
+
+    def _map_column(self, index, custom_function):
+        """Apply a function to all cells of a column"""
+        if self.number_of_rows() == 0:
+            # a column of no cells
+            return
+        self._own()
+        if self.__columnar:
+            self._map_line(index, custom_function)
+        else:
+            self._map_cross(index, custom_function)
+
+    def _format_column(self, index, formatter):
+        """Convert all cells of a column to the type of formatter
+
+        A packed column knows its cell type, so the conversion function
+        is looked up once rather than per cell.
+        """
+        dtype = object
+        if self.__columnar and self.number_of_rows() > 0:
+            dtype = getattr(self.__array[index], "dtype", object)
+        self._map_column(index, _converter_of(dtype, formatter))
+
+    def _pack_columns(self):
+        """Pack columns whose cells turned out to share a type
+
+        e.g. after the header row of a columnar sheet was taken away
+        """
+        if self.__columnar and self.__storage == constants.STORAGE_COLUMNAR:
+            for index, column in enumerate(self.__array):
+                if getattr(column, "is_packed", False):
+                    continue
+                dtype = infer_dtype(column)
+                if dtype is not object:
+                    self._own()
+                    self.__array[index] = TypedColumn(column, dtype)
+
+    # The helpers below work on the physical layout: a "line" is one of
+    # the stored lists, i.e. a row in row storage and a column in columnar
+    # storage, and a "cross" cuts through all lines at the same position.
+    # All lines are kept as long as the inner length and free of None, so
+    # each helper only needs to tidy up the lines it has touched.
+
+    def _inner_length(self):
+        if self.__columnar or len(self.__array) > 0:
+            return self.__width
+        return 0
+
+    def _grow(self, nlines, inner):
+        """Make room for at least nlines lines of inner length"""
+        current = self._inner_length()
+        if inner > current:
+            _pad(self.__array, inner)
+        else:
+            inner = current
+        for _ in range(len(self.__array), nlines):
+            self.__array.append([constants.DEFAULT_NA] * inner)
+        self.__width = inner
+
+    def _replace_line(self, index, data_array):
+        self.__array[index] = data_array
+        self.__width = _refit(self.__array, [index], self._inner_length())
+
+    def _replace_cross(self, index, data_array):
+        nlines = len(self.__array)
+        for _ in range(nlines, len(data_array)):
+            self.__array.append([constants.DEFAULT_NA] * self.__width)
+        for position, line in enumerate(self.__array):
+            value = constants.DEFAULT_NA
+            if position < len(data_array):
+                value = data_array[position]
+            if value is None:
+                value = constants.DEFAULT_NA
+            line[index] = value
+
+    def _set_line_from(self, index, data_array, starting):
+        nlines = len(self.__array)
+        inner = self._inner_length()
+        if index < nlines and starting < inner:
+            real_len = len(data_array) + starting
+            end = min(real_len, inner)
+            line = self.__array[index]
+            for i in range(starting, end):
+                value = data_array[i - starting]
+                if value is not None:
+                    line[i] = value
+            if real_len > inner:
+                left = inner - starting
+                self.__array[index] = line + list(data_array[left:])
+            self.__width = _refit(self.__array, [index], inner)
+        else:
+            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+
+    def _set_cross_from(self, index, data_array, starting):
+        nlines = len(self.__array)
+        inner = self._inner_length()
+        if index < inner and starting < nlines:
+            real_len = len(data_array) + starting
+            end = min(real_len, nlines)
+            for i in range(starting, end):
+                value = data_array[i - starting]
+                if value is not None:
+                    self.__array[i][index] = value
+            for i in range(nlines, real_len):
+                new_line = [constants.DEFAULT_NA] * index
+                new_line.append(data_array[i - starting])
+                self.__array.append(new_line)
+            self.__width = _refit(
+                self.__array,
+                range(nlines, len(self.__array)),
+                inner,
+            )
+        else:
+            raise IndexError(constants.MESSAGE_INDEX_OUT_OF_RANGE)
+
+    def _extend_crosses(self, lines, height=0):
+        current_nlines = len(self.__array)
+        inner = self._inner_length()
+        for i, line in enumerate(lines):
+            values = _without_none(line)
+            if i < current_nlines:
+                self.__array[i] += values
+            else:
+                new_line = [constants.DEFAULT_NA] * inner
+                new_line += values
+                self.__array.append(new_line)
+        width = max(height, longest_row_number(self.__array))
+        _pad(self.__array, width)
+        self.__width = width
+
+    def _delete_lines(self, indices, count):
+        deleted = {i for i in indices if 0 <= i < count}
+        if deleted:
+            self.__array[:] = [
+                line
+                for i, line in enumerate(self.__array)
+                if i not in deleted
+            ]
+
+    def _delete_crosses(self, indices, count):
+        valid = [
+            j for j in sorted(_unique(indices), reverse=True) if 0 <= j < count
+        ]
+        for line in self.__array:
+            for j in valid:
+                del line[j]
+        self.__width -= len(valid)
+        if self.__columnar and self.__width == 0:
+            # no rows are left, so the columns go with them
+            self.__array[:] = []
+
+    def _map_line(self, index, custom_function):
+        map_line(self.__array[index], custom_function)
+
+    def _map_cross(self, index, custom_function):
+        functions = [None] * index + [custom_function]
+        map_positions(self.__array, functions)
 
 
 def _unique(seq):
@@ -789,6 +1247,55 @@ def _unique(seq):
     return [x for x in seq if not (x in seen or seen_add(x))]
 
 
+POINTER_SIZE = sys.getsizeof([None]) - sys.getsizeof([])
+EMPTY_LIST_SIZE = sys.getsizeof([])
+
+
+def _size_once(value, seen):
+    """The size of an object not counted yet"""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    return sys.getsizeof(value)
+
+
+def _let_go(sharers):
+    """Stop counting a matrix among the sharers of its lines"""
+    sharers[0] -= 1
+
+
+def _columns_of(rows):
+    """Turn a uniform list of rows into a list of typed columns"""
+    return [TypedColumn(column) for column in compact.czip(*rows)]
+
+
+def _converter_of(dtype, formatter):
+    """The per cell conversion function of a column to formatter
+
+    For a column of one known type, the conversion function is looked up
+    once rather than for each cell.
+    """
+    if dtype is object:
+        return partial(to_format, formatter)
+    return typed_formatter(dtype, formatter)
+
+
+def _dtype_of(column):
+    if isinstance(column, TypedColumn) and column.is_packed:
+        return column.dtype
+    return infer_dtype(column)
+
+
+def _crosses(lines, length):
+    """Iterate through uniform lines position by position"""
+    if len(lines) > 0:
+        for cross in compact.czip(*lines):
+            yield list(cross)
+    else:
+        for _ in range(length):
+            yield []
+
+
 def longest_row_number(array):
     """Find the length of the longest row in the array
 
@@ -815,9 +1322,11 @@ def uniform(array, min_rows=0, min_columns=0):
         return 0, array
     for row in array:
         row_length = len(row)
-        for index in range(0, row_length):
-            if row[index] is None:
-                row[index] = constants.DEFAULT_NA
+        # packed columns cannot hold None
+        if not getattr(row, "is_packed", False):
+            for index in range(0, row_length):
+                if row[index] is None:
+                    row[index] = constants.DEFAULT_NA
         if row_length < width:
             row += [constants.DEFAULT_NA] * (width - row_length)
     for _ in range(array_length, height):
@@ -826,6 +1335,50 @@ def uniform(array, min_rows=0, min_columns=0):
     return width, array
 
 
+def _refit(array, touched, width):
+    """Bring the touched lines in line with the others
+
+    Only the touched lines are scanned for None. The others are taken to
+    be `width` long already and are padded only if a touched line turned
+    out to be longer.
+
+    :param list array: a list of arrays
+    :param touched: indices of the lines that changed
+    :param int width: the length of the untouched lines
+    :returns: the new length of all lines
+    """
+    lines = [array[index] for index in touched]
+    for line in lines:
+        _fill_none(line)
+    new_width = max([width] + [len(line) for line in lines])
+    if new_width > width:
+        lines = array
+    _pad(lines, new_width)
+    return new_width
+
+
+def _pad(lines, width):
+    """Pad the lines shorter than width with empty cells"""
+    for line in lines:
+        line_length = len(line)
+        if line_length < width:
+            line += [constants.DEFAULT_NA] * (width - line_length)
+
+
+def _fill_none(line):
+    # packed columns cannot hold None
+    if not getattr(line, "is_packed", False):
+        for index, value in enumerate(line):
+            if value is None:
+                line[index] = constants.DEFAULT_NA
+
+
+def _without_none(values):
+    return [
+        constants.DEFAULT_NA if value is None else value for value in values
+    ]
+
+
 def transpose(in_array):
     """Rotate clockwise by 90 degrees and flip horizontally
 
@@ -853,26 +1406,27 @@ def transpose(in_array):
 
 
 def _add(name, left, right):
-    from pyexcel.book import Book, local_uuid
+    from pyexcel.book import Book, local_uuid, copy_sheet
+    from pyexcel.sheet import Sheet
 
     content = {}
-    content[name] = left
+    content[name] = Sheet(left, name, storage=left.storage)
     if isinstance(right, Book):
-        right_in_dict = copy.deepcopy(right.to_dict())
-        for key in right_in_dict.keys():
-            new_key = key
-            if len(right_in_dict.keys()) == 1:
+        single = right.number_of_sheets() == 1
+        for sheet in right:
+            new_key = sheet.name
+            if single:
                 new_key = right.filename
             if new_key in content:
                 uid = local_uuid()
-                new_key = f"{key}_{uid}"
-            content[new_key] = right_in_dict[key]
+                new_key = f"{sheet.name}_{uid}"
+            content[new_key] = copy_sheet(sheet, new_key)
     elif isinstance(right, Matrix):
         new_key = right.name
         if new_key in content:
             uid = local_uuid()
             new_key = f"{right.name}_{uid}"
-        content[new_key] = copy.deepcopy(right.get_internal_array())
+        content[new_key] = Sheet(right, new_key, storage=right.storage)
     else:
         raise TypeError
     new_book = Book()
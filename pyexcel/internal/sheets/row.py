@@ -8,7 +8,6 @@ Generic table row
 :license: New BSD License
 """
 
-import copy
 import types
 
 from pyexcel import _compact as compact
@@ -161,6 +160,9 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         """
         Refer to sheet.row.name
         """
+        if attr == "_ref":
+            # not set yet while being unpickled
+            raise AttributeError(attr)
         the_attr = attr
         if attr not in self._ref.rownames:
             the_attr = the_attr.replace("_", " ")
@@ -211,11 +213,11 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         :return: self
         """
         if isinstance(other, compact.OrderedDict):
-            self._ref.extend_rows(copy.deepcopy(other))
+            self._ref.extend_rows(other)
         elif isinstance(other, list):
-            self._ref.extend_rows(copy.deepcopy(other))
+            self._ref.extend_rows(other)
         elif hasattr(other, "get_internal_array"):
-            self._ref.extend_rows(copy.deepcopy(other.get_internal_array()))
+            self._ref.extend_rows(list(other.get_internal_array()))
         else:
             raise TypeError
         return self
@@ -227,11 +229,11 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         """
         new_instance = self._ref.clone()
         if isinstance(other, compact.OrderedDict):
-            new_instance.extend_rows(copy.deepcopy(other))
+            new_instance.extend_rows(other)
         elif isinstance(other, list):
-            new_instance.extend_rows(copy.deepcopy(other))
+            new_instance.extend_rows(other)
         elif hasattr(other, "get_internal_array"):
-            new_instance.extend_rows(copy.deepcopy(other.get_internal_array()))
+            new_instance.extend_rows(list(other.get_internal_array()))
         else:
             raise TypeError
         return new_instance
@@ -255,12 +257,6 @@ class Row(utils.CommonPropertyAmongRowNColumn):
         if isinstance(new_indices, list):
             for rindex in self._ref.row_range():
                 if rindex in new_indices:
-                    for column in self._ref.column_range():
-                        value = self._ref.cell_value(rindex, column)
-                        value = converter(value)
-                        self._ref.cell_value(rindex, column, value)
+                    self._ref._map_row(rindex, converter)
         else:
-            for column in self._ref.column_range():
-                value = self._ref.cell_value(new_indices, column)
-                value = converter(value)
-                self._ref.cell_value(new_indices, column, value)
+            self._ref._map_row(new_indices, converter)
@@ -0,0 +1,89 @@
+"""
+pyexcel.internal.sheets.transform
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Apply functions to many cells at once, a stored line at a time
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License, see LICENSE for more details
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# array type codes of packed columns that numpy can take as they are
+NUMPY_TYPE_CODES = ("q", "d")
+
+
+def map_lines(lines, function):
+    """Apply a function to every cell of every line"""
+    for line in lines:
+        map_line(line, function)
+
+
+def map_chunk(function, lines):
+    """Apply a function to every cell of the lines and return them
+
+    Made for worker processes, which send the lines back.
+    """
+    map_lines(lines, function)
+    return lines
+
+
+def map_line(line, function):
+    """Apply a function to every cell of one line, in place
+
+    A None result leaves the cell as it was. A numpy ufunc, e.g.
+    numpy.sqrt, is applied to a packed numeric column in one call.
+    """
+    if map_with_numpy(line, function):
+        return
+    line[:] = [
+        old if new is None else new
+        for old, new in zip(line, map(function, line))
+    ]
+
+
+def map_positions(lines, functions):
+    """Apply the n-th function to the n-th cell of every line
+
+    :param list functions: a function or None per position. None
+                           leaves the cells at that position as they are
+    """
+    if None not in functions:
+        for line in lines:
+            values = [function(old) for function, old in zip(functions, line)]
+            line[: len(values)] = [
+                old if new is None else new for old, new in zip(line, values)
+            ]
+        return
+    positions = [
+        (position, function)
+        for position, function in enumerate(functions)
+        if function is not None
+    ]
+    for line in lines:
+        for position, function in positions:
+            value = function(line[position])
+            if value is not None:
+                line[position] = value
+
+
+def map_with_numpy(line, function):
+    """Run a numpy ufunc over a packed int or float column
+
+    :returns: False if numpy is not installed, the function is not a
+              unary ufunc or the line is not a packed numeric column
+    """
+    if numpy is None or not isinstance(function, numpy.ufunc):
+        return False
+    if function.nin != 1 or function.nout != 1:
+        return False
+    packed = getattr(line, "packed_data", None)
+    if packed is None or packed.typecode not in NUMPY_TYPE_CODES:
+        return False
+    values = numpy.frombuffer(packed, dtype=packed.typecode)
+    line[:] = function(values).tolist()
+    return True
@@ -0,0 +1,206 @@
+"""
+pyexcel.internal.sheets.typed_column
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Compact column storage for columnar sheets
+
+:copyright: (c) 2014-2026 by C Wang
+:license: New BSD License, see LICENSE for more details
+"""
+
+import datetime
+from array import array
+from collections.abc import MutableSequence
+
+# python type -> array type code. date is kept as its proleptic ordinal
+TYPE_CODES = {
+    int: "q",
+    float: "d",
+    bool: "b",
+    datetime.date: "i",
+}
+
+
+def infer_dtype(values):
+    """Return the python type shared by all values, otherwise object
+
+    Only exact types count, so that datetime does not pass as date
+    and bool does not pass as int.
+    """
+    iterator = iter(values)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return object
+    dtype = type(first)
+    if dtype not in TYPE_CODES:
+        return object
+    for value in iterator:
+        if type(value) is not dtype:
+            return object
+    return dtype
+
+
+class TypedColumn(MutableSequence):
+    """A column of cells backed by :class:`array.array`
+
+    Homogeneous int, float, bool and date columns are packed into an
+    array. Anything else, or any later value of a different type, falls
+    back to a plain list of python objects.
+    """
+
+    def __init__(self, values=(), dtype=None):
+        self.dtype = object
+        self._data = []
+        self._reset(values, dtype)
+
+    @property
+    def is_packed(self):
+        """True when values are kept in an array"""
+        return self.dtype is not object
+
+    @property
+    def nbytes(self):
+        """Bytes taken by packed values. None for object columns"""
+        if self.is_packed:
+            return self._data.itemsize * len(self._data)
+        return None
+
+    @property
+    def packed_data(self):
+        """The array holding the values of a packed column, otherwise None"""
+        if self.is_packed:
+            return self._data
+        return None
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return _unpack(self.dtype, self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(_unpack(self.dtype, self._data[index]))
+        value = self._data[index]
+        if self.dtype is bool:
+            return bool(value)
+        if self.dtype is datetime.date:
+            return datetime.date.fromordinal(value)
+        return value
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            if index == slice(None, None, None):
+                self._reset(value)
+                return
+            value = list(value)
+            if not self._accepts(value):
+                self._unpack_all()
+            try:
+                self._data[index] = _pack(self.dtype, value)
+            except OverflowError:
+                self._unpack_all()
+                self._data[index] = value
+            return
+        if self._accepts((value,)):
+            try:
+                self._data[index] = _encode(self.dtype, value)
+                return
+            except OverflowError:
+                pass
+        self._unpack_all()
+        self._data[index] = value
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def insert(self, index, value):
+        if not self._accepts((value,)):
+            self._unpack_all()
+        try:
+            self._data.insert(index, _encode(self.dtype, value))
+        except OverflowError:
+            self._unpack_all()
+            self._data.insert(index, value)
+
+    def extend(self, values):
+        values = list(values)
+        if not self._accepts(values):
+            self._unpack_all()
+        try:
+            self._data.extend(_pack(self.dtype, values))
+        except OverflowError:
+            self._unpack_all()
+            self._data.extend(values)
+
+    def copy(self):
+        """A new column holding a copy of the same values"""
+        column = TypedColumn()
+        column.dtype = self.dtype
+        column._data = self._data[:]
+        return column
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, TypedColumn)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TypedColumn({list(self)!r}, dtype={self.dtype.__name__})"
+
+    def _reset(self, values, dtype=None):
+        values = list(values)
+        if dtype is None:
+            dtype = infer_dtype(values)
+        try:
+            self._data = _pack(dtype, values)
+        except OverflowError:
+            dtype = object
+            self._data = values
+        self.dtype = dtype
+
+    def _accepts(self, values):
+        if self.dtype is object:
+            return True
+        dtype = self.dtype
+        return all(type(value) is dtype for value in values)
+
+    def _unpack_all(self):
+        if self.dtype is not object:
+            self._data = list(_unpack(self.dtype, self._data))
+            self.dtype = object
+
+
+def _encode(dtype, value):
+    if dtype is datetime.date:
+        return value.toordinal()
+    return value
+
+
+def _pack(dtype, values):
+    if dtype is object:
+        return list(values)
+    if dtype is datetime.date:
+        values = [value.toordinal() for value in values]
+    return array(TYPE_CODES[dtype], values)
+
+
+def _unpack(dtype, data):
+    if dtype is bool:
+        return map(bool, data)
+    if dtype is datetime.date:
+        return map(datetime.date.fromordinal, data)
+    return iter(data)
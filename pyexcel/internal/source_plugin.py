@@ -10,6 +10,12 @@ Second level abstraction
 
 from pyexcel import constants, exceptions
 from lml.plugin import PluginManager
+from pyexcel._compact import is_string, get_string_file_name
+from pyexcel.internal.plugins import (
+    RESOLUTIONS,
+    file_suffix,
+    discover_plugins,
+)
 from pyexcel.internal.attributes import (
     register_book_attribute,
     register_sheet_attribute,
@@ -32,9 +38,23 @@ class SourcePluginManager(PluginManager):
     def load_me_later(self, plugin_info):
         PluginManager.load_me_later(self, plugin_info)
         self._register_a_plugin_info(plugin_info)
+        RESOLUTIONS.clear()
 
     def load_me_now(self, key, action=None, library=None, **keywords):
-        """get source module into memory for use"""
+        """get source module into memory for use
+
+        The answer is remembered for keywords that look the same,
+        i.e. that have the same fields and the same file type.
+        """
+        resolution = (key, action, library) + _look_of(keywords)
+        plugin = RESOLUTIONS.get(resolution)
+        if plugin is None:
+            discover_plugins()
+            plugin = self._find_a_plugin(key, action, library, **keywords)
+            RESOLUTIONS[resolution] = plugin
+        return plugin
+
+    def _find_a_plugin(self, key, action, library, **keywords):
         self._logger.debug("load me now:" + key)
         plugin = None
         for source in self.registry[key]:
@@ -54,6 +74,7 @@ class SourcePluginManager(PluginManager):
         """for dynamically loaded plugin"""
         PluginManager.register_a_plugin(self, plugin_cls, plugin_info)
         self._register_a_plugin_info(plugin_info)
+        RESOLUTIONS.clear()
 
     def get_a_plugin(
         self,
@@ -113,6 +134,7 @@ class SourcePluginManager(PluginManager):
 
     def get_keyword_for_parameter(self, key):
         """custom keyword for an attribute"""
+        discover_plugins()
         return self.keywords.get(key, None)
 
     def _register_a_plugin_info(self, plugin_info):
@@ -144,6 +166,27 @@ class SourcePluginManager(PluginManager):
             self._logger.debug(debug_registry)
 
 
+def _look_of(keywords):
+    """What the sources look at in the keywords to take a call
+
+    They check which fields are given and, for files, the file type.
+    """
+    fields = frozenset(
+        name for name, value in keywords.items() if value is not None
+    )
+    file_name = get_string_file_name(keywords.get("file_name"))
+    if is_string(type(file_name)):
+        file_name = file_suffix(file_name)
+    elif file_name is not None:
+        file_name = type(file_name)
+    return (
+        fields,
+        file_name,
+        keywords.get("file_type"),
+        keywords.get("force_file_type"),
+    )
+
+
 def _error_handler(action, **keywords):
     if keywords:
         file_type = keywords.get("file_type", None)
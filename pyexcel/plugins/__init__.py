@@ -15,7 +15,12 @@ from pyexcel import constants
 from lml.plugin import PluginInfo, PluginInfoChain
 from pyexcel._compact import is_string, get_string_file_name
 from pyexcel.exceptions import FileTypeNotSupported
-from pyexcel.internal.plugins import PARSER, RENDERER
+from pyexcel.internal.plugins import (
+    PARSER,
+    RENDERER,
+    RESOLUTIONS,
+    file_suffix,
+)
 
 
 class SourceInfo(PluginInfo):
@@ -76,7 +81,7 @@ class InputSourceInfo(FileSourceInfo):
         if file_type:
             __file_type = file_type.lower()
         if action == constants.READ_ACTION:
-            status = __file_type in PARSER.get_all_file_types()
+            status = PARSER.supports(__file_type)
         else:
             status = False
         return status
@@ -87,7 +92,7 @@ class OutputSourceInfo(FileSourceInfo):
 
     def can_i_handle(self, action, file_type):
         if action == constants.WRITE_ACTION:
-            status = file_type.lower() in tuple(RENDERER.get_all_file_types())
+            status = RENDERER.supports(file_type.lower())
         else:
             status = False
         return status
@@ -101,6 +106,15 @@ def find_file_type_from_file_name(file_name, action):
     """
     Extract file type from file name
     """
+    resolution = ("file type", action, file_suffix(file_name))
+    file_type = RESOLUTIONS.get(resolution)
+    if file_type is None:
+        file_type = _find_file_type(file_name, action)
+        RESOLUTIONS[resolution] = file_type
+    return file_type
+
+
+def _find_file_type(file_name, action):
     if action == "read":
         list_of_file_types = PARSER.get_all_file_types()
     else:
@@ -9,6 +9,8 @@ Parsing excel sources
 """
 
 from pyexcel.parser import AbstractParser
+from pyexcel._compact import OrderedDict
+from pyexcel.internal.projection import project_rows, push_down_columns
 
 from pyexcel_io import get_data, iget_data
 
@@ -38,8 +40,21 @@ class ExcelParser(AbstractParser):
         anything,
         on_demand=False,
         file_type=None,
+        columns=None,
+        where=None,
+        header=False,
         **keywords,
     ):
+        if columns is not None or where is not None:
+            return self._parse_projected(
+                anything,
+                on_demand,
+                file_type,
+                columns,
+                where,
+                header,
+                **keywords,
+            )
         if on_demand:
             sheets, reader = iget_data(
                 anything,
@@ -50,3 +65,30 @@ class ExcelParser(AbstractParser):
         else:
             sheets = get_data(anything, file_type=file_type, **keywords)
         return sheets
+
+    def _parse_projected(
+        self,
+        anything,
+        on_demand,
+        file_type,
+        columns,
+        where,
+        header,
+        **keywords,
+    ):
+        """Read row by row, so that unwanted cells are dropped at once"""
+        columns = push_down_columns(columns, keywords)
+        sheets, reader = iget_data(anything, file_type=file_type, **keywords)
+        projected = OrderedDict(
+            (name, project_rows(rows, columns, where, header))
+            for name, rows in sheets.items()
+        )
+        if on_demand:
+            self._free_me_up_later(reader)
+            return projected
+        try:
+            return OrderedDict(
+                (name, list(rows)) for name, rows in projected.items()
+            )
+        finally:
+            reader.close()
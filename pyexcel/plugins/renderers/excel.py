@@ -29,7 +29,9 @@ class ExcelRenderer(AbstractRenderer):
         data = {sheet_name: sheet.to_array()}
         save_data(file_name, data, **keywords)
 
-    def render_book_to_file(self, file_name, book, **keywords):
+    def render_book_to_file(self, file_name, book, workers=None, **keywords):
+        # all sheets go into one file through one writer, so the
+        # number of workers does not apply
         file_name = get_string_file_name(file_name)
         save_data(file_name, book.to_dict(), **keywords)
 
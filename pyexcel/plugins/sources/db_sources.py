@@ -10,6 +10,7 @@ Generic database sources
 
 from pyexcel.source import AbstractSource
 from pyexcel.internal import PARSER, RENDERER
+from pyexcel.internal.projection import project_rows
 
 from . import params
 
@@ -28,10 +29,19 @@ class SheetDbSource(AbstractSource):
         sheet_name=None,
         parser_library=None,
         renderer_library=None,
+        columns=None,
+        where=None,
+        # the column names always come first, so where never sees them
+        header=None,
         **keywords,
     ):
         self._db_type = db_type
+        if export_columns is None and _are_names(columns):
+            # the columns become the select list of the query
+            export_columns, columns = columns, None
         self.__export_columns = export_columns
+        self.__columns = columns
+        self.__where = where
         self.__sheet_name = sheet_name
         self.__parser_library = parser_library
         self.__renderer_library = renderer_library
@@ -45,6 +55,8 @@ class SheetDbSource(AbstractSource):
             export_columns_list=[self.__export_columns],
             **self._keywords,
         )
+        if self.__columns is not None or self.__where is not None:
+            _project(data, self.__columns, self.__where, self._keywords)
         if self.__sheet_name is not None:
             _set_dictionary_key(data, self.__sheet_name)
         return data
@@ -117,6 +129,18 @@ class BookDbSource(AbstractSource):
         )
 
 
+def _are_names(columns):
+    return bool(columns) and all(isinstance(name, str) for name in columns)
+
+
+def _project(data, columns, where, keywords):
+    for name, rows in data.items():
+        rows = project_rows(rows, columns, where, header=True)
+        if not keywords.get("on_demand"):
+            rows = list(rows)
+        data[name] = rows
+
+
 def _set_dictionary_key(adict, sheet_name):
     (old_sheet_name, array) = list(adict.items())[0]
     adict[sheet_name] = array
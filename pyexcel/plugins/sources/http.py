@@ -8,10 +8,16 @@ Representation of http sources
 :license: New BSD License
 """
 
+import io
+import shutil
+from tempfile import SpooledTemporaryFile
+
 from pyexcel import constants
 from pyexcel.source import AbstractSource
 from pyexcel._compact import request
 from pyexcel.internal import PARSER
+from pyexcel.internal import http_cache
+from pyexcel.internal import garbagecollector as gc
 
 from . import params
 
@@ -26,6 +32,12 @@ FILE_TYPE_MIME_TABLE = {
     "application/vnd.ms-excel.sheet.macroenabled.12": "xlsm",
     "text/html": "html",
 }
+# parsed line by line as they are downloaded
+STREAMED_FILE_TYPES = ("csv", "tsv")
+# zip files are read from the end, so they are downloaded first
+SPOOLED_FILE_TYPES = ("xlsx", "xlsm", "ods", "csvz", "tsvz")
+DEFAULT_SPOOL_SIZE = 16 * 1024 * 1024
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 # pylint: disable=W0223
@@ -40,12 +52,26 @@ class HttpSource(AbstractSource):
     attributes = [params.URL]
     key = params.URL
 
-    def __init__(self, url=None, **keywords):
+    def __init__(
+        self,
+        url=None,
+        spool_size=DEFAULT_SPOOL_SIZE,
+        download_chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        **keywords,
+    ):
+        """
+        :param int spool_size: the bytes of a zipped download, e.g. xlsx,
+                               to keep in memory. The rest goes to a
+                               temporary file
+        :param int download_chunk_size: the bytes to read at a time
+        """
         self.__url = url
+        self.__spool_size = spool_size
+        self.__download_chunk_size = download_chunk_size
         AbstractSource.__init__(self, **keywords)
 
     def get_data(self):
-        connection = request.urlopen(self.__url)
+        connection = _open(self.__url)
         info = connection.info()
         mime_type = info.get_content_type()
         file_type = FILE_TYPE_MIME_TABLE.get(mime_type, None)
@@ -53,13 +79,85 @@ class HttpSource(AbstractSource):
             file_type = _get_file_type_from_url(self.__url)
         parser_library = self._keywords.get("parser_library", None)
         aparser = PARSER.get_a_plugin(file_type, parser_library)
-        content = connection.read()
+        if file_type in STREAMED_FILE_TYPES and not self._keywords.get(
+            "multiple_sheets"
+        ):
+            stream = DownloadedText(
+                connection,
+                self._keywords.get("encoding", "utf-8"),
+                self.__download_chunk_size,
+            )
+            return self.__parse_stream(aparser, stream)
+        if file_type in SPOOLED_FILE_TYPES:
+            if isinstance(connection, http_cache.CachedResponse):
+                # already on disk
+                stream = io.BufferedReader(connection)
+            else:
+                stream = self.__spool(connection)
+            return self.__parse_stream(aparser, stream)
+        try:
+            content = connection.read()
+        finally:
+            connection.close()
         sheets = aparser.parse_file_content(content, **self._keywords)
         return sheets
 
     def get_source_info(self):
         return self.__url, None
 
+    def __spool(self, connection):
+        spool = SpooledTemporaryFile(max_size=self.__spool_size)
+        try:
+            shutil.copyfileobj(connection, spool, self.__download_chunk_size)
+        except BaseException:
+            spool.close()
+            raise
+        finally:
+            connection.close()
+        spool.seek(0)
+        return spool
+
+    def __parse_stream(self, aparser, stream):
+        """Parse the stream, which stays open for on demand reading"""
+        if self._keywords.get("on_demand"):
+            gc.append(stream)
+            return aparser.parse_file_stream(stream, **self._keywords)
+        try:
+            return aparser.parse_file_stream(stream, **self._keywords)
+        finally:
+            stream.close()
+
+
+class DownloadedText:
+    """
+    Decode a download as it is read
+
+    It cannot go back, so it has no seek. pyexcel-io would otherwise
+    seek to the start.
+    """
+
+    def __init__(self, connection, encoding, chunk_size):
+        self.__text = io.TextIOWrapper(
+            io.BufferedReader(connection, buffer_size=chunk_size),
+            encoding=encoding,
+            newline="",
+        )
+
+    def read(self, size=-1):
+        return self.__text.read(size)
+
+    def __iter__(self):
+        return iter(self.__text)
+
+    def close(self):
+        self.__text.close()
+
+
+def _open(url):
+    if http_cache.HTTP_CACHE is None:
+        return request.urlopen(url)
+    return http_cache.HTTP_CACHE.open(url)
+
 
 def _get_file_type_from_url(url):
     extension = url.split(".")
@@ -11,6 +11,7 @@ Representation of array source
 from pyexcel.source import AbstractSource, MemorySourceMixin
 from pyexcel.constants import DEFAULT_SHEET_NAME
 from pyexcel.plugins.sources import params
+from pyexcel.internal.projection import project_sheet
 
 from .common import ArrayReader, _FakeIO
 
@@ -20,15 +21,25 @@ class ArraySource(AbstractSource, MemorySourceMixin):
     A two dimensional array as sheet source
     """
 
-    def __init__(self, array, sheet_name=DEFAULT_SHEET_NAME, **keywords):
+    def __init__(
+        self,
+        array,
+        sheet_name=DEFAULT_SHEET_NAME,
+        columns=None,
+        where=None,
+        header=False,
+        **keywords,
+    ):
         self.__array = array
+        self.__projection = (columns, where, header)
         self._content = _FakeIO()
         self.__sheet_name = sheet_name
         AbstractSource.__init__(self, **keywords)
 
     def get_data(self):
         array_reader = ArrayReader(self.__array, **self._keywords)
-        return {self.__sheet_name: array_reader.to_array()}
+        rows = project_sheet(array_reader.to_array(), *self.__projection)
+        return {self.__sheet_name: rows}
 
     def get_source_info(self):
         return params.ARRAY, None
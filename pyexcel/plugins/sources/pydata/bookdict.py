@@ -11,6 +11,7 @@ Representation of book dict source
 from pyexcel.source import AbstractSource, MemorySourceMixin
 from pyexcel._compact import OrderedDict
 from pyexcel.plugins.sources import params
+from pyexcel.internal.projection import project_sheet
 
 from .common import _FakeIO
 
@@ -20,8 +21,13 @@ class BookDictSource(AbstractSource, MemorySourceMixin):
     Multiple sheet data source via a dictionary of two dimensional arrays
     """
 
-    def __init__(self, bookdict, **keywords):
+    def __init__(
+        self, bookdict, columns=None, where=None, header=False, **keywords
+    ):
         self.__bookdict = bookdict
+        self.__projection = None
+        if columns is not None or where is not None:
+            self.__projection = (columns, where, header)
         self._content = _FakeIO()
         AbstractSource.__init__(self, **keywords)
 
@@ -29,6 +35,11 @@ class BookDictSource(AbstractSource, MemorySourceMixin):
         the_dict = self.__bookdict
         if not isinstance(self.__bookdict, OrderedDict):
             the_dict = _convert_dict_to_ordered_dict(self.__bookdict)
+        if self.__projection is not None:
+            the_dict = OrderedDict(
+                (name, project_sheet(rows, *self.__projection))
+                for name, rows in the_dict.items()
+            )
         return the_dict
 
     def get_source_info(self):
@@ -11,6 +11,7 @@ Representation of dict sources
 from pyexcel.source import AbstractSource, MemorySourceMixin
 from pyexcel.constants import DEFAULT_SHEET_NAME
 from pyexcel.plugins.sources import params
+from pyexcel.internal.projection import project_sheet
 
 from .common import DictReader, _FakeIO
 
@@ -25,9 +26,14 @@ class DictSource(AbstractSource, MemorySourceMixin):
         adict,
         with_keys=True,
         sheet_name=DEFAULT_SHEET_NAME,
+        columns=None,
+        where=None,
+        header=None,
         **keywords,
     ):
         self.__adict = adict
+        # the keys, if given, are the header row
+        self.__projection = (columns, where, with_keys)
         self.__with_keys = with_keys
         self._content = _FakeIO()
         self.__sheet_name = sheet_name
@@ -39,7 +45,8 @@ class DictSource(AbstractSource, MemorySourceMixin):
             with_keys=self.__with_keys,
             **self._keywords,
         )
-        return {self.__sheet_name: dict_reader.to_array()}
+        rows = project_sheet(dict_reader.to_array(), *self.__projection)
+        return {self.__sheet_name: rows}
 
     def get_source_info(self):
         return params.ADICT, None
@@ -11,6 +11,7 @@ Representation of records source
 from pyexcel.source import AbstractSource, MemorySourceMixin
 from pyexcel.constants import DEFAULT_SHEET_NAME
 from pyexcel.plugins.sources import params
+from pyexcel.internal.projection import project_sheet
 
 from .common import RecordsReader, _FakeIO
 
@@ -22,15 +23,26 @@ class RecordsSource(AbstractSource, MemorySourceMixin):
     The dictionaries should have identical fields.
     """
 
-    def __init__(self, records, sheet_name=DEFAULT_SHEET_NAME, **keywords):
+    def __init__(
+        self,
+        records,
+        sheet_name=DEFAULT_SHEET_NAME,
+        columns=None,
+        where=None,
+        header=None,
+        **keywords,
+    ):
         self.__records = records
+        # the keys are the header row
+        self.__projection = (columns, where, True)
         self._content = _FakeIO()
         self.__sheet_name = sheet_name
         AbstractSource.__init__(self, **keywords)
 
     def get_data(self):
         records_reader = RecordsReader(self.__records, **self._keywords)
-        return {self.__sheet_name: records_reader.to_array()}
+        rows = project_sheet(records_reader.to_array(), *self.__projection)
+        return {self.__sheet_name: rows}
 
     def get_source_info(self):
         return params.RECORDS, None
@@ -10,6 +10,7 @@ Representation of querysets
 
 from pyexcel import constants
 from pyexcel.source import AbstractSource
+from pyexcel.internal.projection import project_rows
 
 from pyexcel_io import get_data
 from pyexcel_io.constants import DB_QUERYSET
@@ -41,12 +42,23 @@ class SheetQuerySetSource(AbstractSource):
         column_limit=None,
         skip_row_func=None,
         skip_column_func=None,
+        columns=None,
+        where=None,
+        # the column names always come first, so where never sees them
+        header=None,
         **keywords,
     ):
         self.__sheet_name = sheet_name
         if self.__sheet_name is None:
             self.__sheet_name = constants.DEFAULT_SHEET_NAME
+        if columns is not None:
+            # only the attributes of the wanted columns are read
+            column_names = [
+                column_names[column] if isinstance(column, int) else column
+                for column in columns
+            ]
         self.__column_names = column_names
+        self.__where = where
         self.__query_sets = query_sets
         self.__row_renderer = row_renderer
         self.__start_row = start_row
@@ -76,4 +88,9 @@ class SheetQuerySetSource(AbstractSource):
             column_names=self.__column_names,
             **local_params,
         )
+        if self.__where is not None:
+            for name, rows in data.items():
+                data[name] = list(
+                    project_rows(rows, where=self.__where, header=True)
+                )
         return data
@@ -8,7 +8,10 @@ Renders pyexcel.Book and pyexcel.Sheet to any format
 :license: New BSD License
 """
 
+from functools import partial
+
 from pyexcel import _compact as compact
+from pyexcel.internal.parallel import run_in_workers
 
 
 class AbstractRenderer:
@@ -136,13 +139,27 @@ class Renderer(AbstractRenderer):
         """
         raise NotImplementedError("Please render sheet")
 
-    def render_book(self, book, **keywords):
+    def render_book(self, book, workers=None, **keywords):
         """
         Implementation of book rendering
 
         :param book: pyexcel book instance to be rendered
+        :param workers: render the sheets in this many processes
         :param keywords: any other keywords to the renderer
         """
+        if workers:
+            render = partial(
+                _render_sheet,
+                type(self),
+                self._file_type,
+                self._write_title,
+            )
+            rendered = run_in_workers(render, book, workers, processes=True)
+            for index, content in enumerate(rendered):
+                if index > 0:
+                    self._stream.write("\n")
+                self._stream.write(content)
+            return
         number_of_sheets = book.number_of_sheets() - 1
         for index, sheet in enumerate(book):
             self.render_sheet(sheet)
@@ -184,3 +201,12 @@ class DbRenderer(AbstractRenderer):
 
     def render_book_to_file(self, file_name, book, **keywords):
         raise Exception("We are not writing to file")
+
+
+def _render_sheet(renderer_class, file_type, write_title, sheet):
+    renderer = renderer_class(file_type)
+    stream = renderer.get_io()
+    renderer.set_output_stream(stream)
+    renderer.set_write_title(write_title)
+    renderer.render_sheet(sheet)
+    return stream.getvalue()
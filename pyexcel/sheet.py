@@ -8,15 +8,16 @@ Building on top of matrix, adding named columns and rows support
 :license: New BSD License, see LICENSE for more details
 """
 
-import copy
-from collections import defaultdict
-
 from pyexcel import _compact as compact
 from pyexcel import constants
 from pyexcel._compact import OrderedDict
 from pyexcel.internal.sheets.row import Row as NamedRow
 from pyexcel.internal.sheets.column import Column as NamedColumn
 from pyexcel.internal.sheets.matrix import Matrix
+from pyexcel.internal.sheets.grouping import Groups
+from pyexcel.internal.sheets.aggregation import Aggregation
+from pyexcel.internal.instrumentation import stage
+from pyexcel.internal.sheets.extended_list import IndexedList
 
 
 class Sheet(Matrix):
@@ -72,6 +73,7 @@ class Sheet(Matrix):
         rownames=None,
         transpose_before=False,
         transpose_after=False,
+        storage=constants.STORAGE_ROW,
     ):
         """Constructor
 
@@ -81,9 +83,11 @@ class Sheet(Matrix):
         :param name_rows_by_column: use a column to name all rows
         :param colnames: use an external list of strings to name the columns
         :param rownames: use an external list of strings to name the rows
+        :param storage: "row" keeps a list of rows, "columnar" keeps a
+                        list of columns, which speeds up column access
         """
-        self.__column_names = []
-        self.__row_names = []
+        self.__column_names = IndexedList()
+        self.__row_names = IndexedList()
         self.__row_index = -1
         self.__column_index = -1
         self.init(
@@ -95,6 +99,7 @@ class Sheet(Matrix):
             rownames=rownames,
             transpose_before=transpose_before,
             transpose_after=transpose_after,
+            storage=storage,
         )
 
     def init(
@@ -107,6 +112,7 @@ class Sheet(Matrix):
         rownames=None,
         transpose_before=False,
         transpose_after=False,
+        storage=constants.STORAGE_ROW,
     ):
         """custom initialization functions
 
@@ -140,36 +146,41 @@ class Sheet(Matrix):
         # this get rid of phatom data by not specifying sheet
         if sheet is None:
             sheet = []
-        Matrix.__init__(self, sheet)
+        Matrix.__init__(self, sheet, storage=storage)
         self.name = name
-        self.__column_names = []
-        self.__row_names = []
+        self.__column_names = IndexedList()
+        self.__row_names = IndexedList()
         if transpose_before:
             self.transpose()
         self.row = NamedRow(self)
         self.column = NamedColumn(self)
+        measured = stage("naming")
         if name_columns_by_row != -1:
             if colnames:
                 raise NotImplementedError(constants.MESSAGE_NOT_IMPLEMENTED_02)
             self.name_columns_by_row(name_columns_by_row)
         else:
             if colnames:
-                self.__column_names = colnames
+                self.__column_names = IndexedList(colnames)
         if name_rows_by_column != -1:
             if rownames:
                 raise NotImplementedError(constants.MESSAGE_NOT_IMPLEMENTED_02)
             self.name_rows_by_column(name_rows_by_column)
         else:
             if rownames:
-                self.__row_names = rownames
+                self.__row_names = IndexedList(rownames)
+        if measured:
+            measured.done()
         if transpose_after:
             self.transpose()
+        self._pack_columns()
 
     def clone(self):
         new_sheet = Sheet(
-            copy.deepcopy(self.get_internal_array()),
+            self,
             name_columns_by_row=self.__row_index,
             name_rows_by_column=self.__column_index,
+            storage=self.storage,
         )
         return new_sheet
 
@@ -232,22 +243,104 @@ class Sheet(Matrix):
 
         :returns: an instance of a Book
         """
-        from pyexcel import Book
+        if isinstance(column_index_or_name, int):
+            if len(self.colnames) == 0 and len(self.rownames) == 0:
+                return self.group_by(column_index_or_name).to_book()
+            # the names are grouped as part of the data
+            array = Matrix(self.to_array())
+            return Groups(array, [column_index_or_name]).to_book()
+        if len(self.colnames) == 0:
+            self.name_columns_by_row(0)
+        return self.group_by(column_index_or_name).to_book()
+
+    def group_by(self, column, *columns):
+        """Group rows by the values of one or more columns
+
+        The rows are not copied. Each group keeps the indices of its
+        rows and reads them when it is iterated, made a sheet or
+        printed. Later changes to this sheet do not show in the groups.
 
-        groups = defaultdict(list)
+        Example::
 
-        if isinstance(column_index_or_name, int):
-            for row in self.to_array():
-                groups[row[column_index_or_name]].append(row)
-        else:
-            if len(self.colnames) == 0:
-                self.name_columns_by_row(0)
-            column_index = self.colnames.index(column_index_or_name)
-            for row in self.rows():
-                if len(groups[row[column_index]]) == 0:
-                    groups[row[column_index]].append(self.colnames)
-                groups[row[column_index]].append(row)
-        return Book(groups)
+            >>> import pyexcel as p
+            >>> sheet = p.Sheet(
+            ...     [
+            ...         ["customer", "item", "quantity"],
+            ...         ["ann", "pen", 2],
+            ...         ["bob", "pen", 1],
+            ...         ["ann", "ink", 3],
+            ...     ],
+            ...     name_columns_by_row=0,
+            ... )
+            >>> groups = sheet.group_by("customer")
+            >>> list(groups.keys())
+            ['ann', 'bob']
+            >>> list(groups["ann"])
+            [['ann', 'pen', 2], ['ann', 'ink', 3]]
+            >>> list(sheet.group_by("customer", "item").sizes().items())
+            [(('ann', 'pen'), 1), (('bob', 'pen'), 1), (('ann', 'ink'), 1)]
+
+        :param column: a column index, or a column name
+        :param columns: more columns, whose cells make a tuple key
+        :returns: a mapping of keys to groups, see
+                  :class:`~pyexcel.internal.sheets.grouping.Groups`
+        """
+        indices = []
+        for name in (column,) + columns:
+            if compact.is_string(type(name)):
+                name = self.colnames.index(name)
+            indices.append(name)
+        return Groups(
+            Matrix(self, storage=self.storage),
+            indices,
+            colnames=list(self.colnames) or None,
+        )
+
+    def aggregate(
+        self, by=None, sum=None, count=None, min=None, max=None, mean=None
+    ):
+        """Sum, count, min, max or average columns per group of rows
+
+        The rows are read once and only the running totals of each
+        group are kept. Empty cells are left out.
+
+        Example::
+
+            >>> import pyexcel as p
+            >>> sheet = p.Sheet(
+            ...     [
+            ...         ["customer", "item", "quantity"],
+            ...         ["ann", "pen", 2],
+            ...         ["bob", "pen", 1],
+            ...         ["ann", "ink", 3],
+            ...     ],
+            ...     name_columns_by_row=0,
+            ... )
+            >>> sheet.aggregate(by="customer", sum="quantity", count=True)
+            pyexcel sheet:
+            +----------+---------------+-------+
+            | customer | sum(quantity) | count |
+            +==========+===============+=======+
+            | ann      | 5             | 2     |
+            +----------+---------------+-------+
+            | bob      | 1             | 1     |
+            +----------+---------------+-------+
+
+        :param by: the key column, or a list of them, by name or index.
+                   None aggregates all rows together
+        :param sum: the columns to add up
+        :param count: the columns whose cells to count, or True to count
+                      the rows
+        :param min: the columns to find the smallest cell of
+        :param max: the columns to find the largest cell of
+        :param mean: the columns to average
+        :returns: a new sheet of a row per group, its columns named
+                  after the key columns and the measures
+        """
+        measures = dict(sum=sum, count=count, min=min, max=max, mean=mean)
+        aggregation = Aggregation(by, measures, colnames=self.colnames)
+        aggregation.add_rows(self.rows())
+        return aggregation.to_sheet(name=self.name)
 
     def top(self, lines=5):
         """
@@ -294,12 +387,14 @@ class Sheet(Matrix):
 
     def named_column_at(self, name):
         """Get a column by its name"""
-        index = name
-        if isinstance(index, str):
-            index = self.colnames.index(name)
-        column_array = self.column_at(index)
+        column_array = self.column_at(self._column_index(name))
         return column_array
 
+    def _column_index(self, name):
+        if isinstance(name, str):
+            return self.colnames.index(name)
+        return name
+
     def set_named_column_at(self, name, column_array):
         """
         Take the first row as column names
@@ -307,10 +402,21 @@ class Sheet(Matrix):
         Given name to identify the column index, set the column to
         the given array except the column name.
         """
-        index = name
-        if isinstance(index, str):
-            index = self.colnames.index(name)
-        self.set_column_at(index, column_array)
+        self.set_column_at(self._column_index(name), column_array)
+
+    def map(self, custom_function=None, column_functions=None):
+        """Execute functions across the cells of the sheet
+
+        :param custom_function: the function for all cells
+        :param dict column_functions: functions for individual columns,
+                                      keyed by column name or index
+        """
+        if column_functions:
+            column_functions = {
+                self._column_index(name): function
+                for name, function in column_functions.items()
+            }
+        Matrix.map(self, custom_function, column_functions=column_functions)
 
     def delete_columns(self, column_indices):
         """Delete one or more columns
@@ -325,12 +431,12 @@ class Sheet(Matrix):
         column_indices = [i if i >= 0 else ncols + i for i in column_indices]
         Matrix.delete_columns(self, column_indices)
         if len(self.__column_names) > 0:
-            new_series = [
-                self.__column_names[i]
-                for i in range(0, len(self.__column_names))
-                if i not in column_indices
-            ]
-            self.__column_names = new_series
+            deleted = set(column_indices)
+            self.__column_names = IndexedList(
+                name
+                for i, name in enumerate(self.__column_names)
+                if i not in deleted
+            )
 
     def delete_rows(self, row_indices):
         """Delete one or more rows
@@ -345,12 +451,12 @@ class Sheet(Matrix):
         row_indices = [i if i >= 0 else nrows + i for i in row_indices]
         Matrix.delete_rows(self, row_indices)
         if len(self.__row_names) > 0:
-            new_series = [
-                self.__row_names[i]
-                for i in range(0, len(self.__row_names))
-                if i not in row_indices
-            ]
-            self.__row_names = new_series
+            deleted = set(row_indices)
+            self.__row_names = IndexedList(
+                name
+                for i, name in enumerate(self.__row_names)
+                if i not in deleted
+            )
 
     def delete_named_column_at(self, name):
         """Works only after you named columns by a row
@@ -565,6 +671,27 @@ class Sheet(Matrix):
             raise NotImplementedError("Not implemented")
         return the_dict
 
+    def memory_usage(self):
+        """Estimate the bytes taken by each column
+
+        A column takes its cells and its share of the lists holding
+        them; packed columns of columnar sheets take their arrays.
+        Columns are keyed by their names, or by their indices if they
+        are not named. The row and column names are not counted.
+
+        Example::
+
+            >>> import pyexcel as p
+            >>> sheet = p.Sheet([["a", "b"], [1, 2.5]], storage="columnar")
+            >>> sheet.name_columns_by_row(0)
+            >>> list(sheet.memory_usage().keys())
+            ['a', 'b']
+        """
+        usage = Matrix.memory_usage(self)
+        if len(self.colnames) > 0:
+            return OrderedDict(zip(self.colnames, usage))
+        return OrderedDict(enumerate(usage))
+
     def named_rows(self):
         """iterate rows using row names"""
         for row_name in self.__row_names:
@@ -640,7 +767,7 @@ class _RepresentedString:
 def make_names_unique(alist):
     """Append the number of occurrences to duplicated names"""
     duplicates = {}
-    new_names = []
+    new_names = IndexedList()
     for item in alist:
         if not compact.is_string(type(item)):
             item = str(item)
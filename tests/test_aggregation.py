@@ -0,0 +1,102 @@
+import pyexcel as pe
+
+from .nose_tools import eq_, raises
+
+ORDERS = [
+    ["customer", "item", "quantity", "price"],
+    ["ann", "pen", 2, 1.5],
+    ["bob", "pen", 1, 1.5],
+    ["ann", "ink", 3, ""],
+    ["ann", "pen", 4, 2.5],
+]
+
+
+def orders():
+    return [list(row) for row in ORDERS]
+
+
+def test_aggregate_by_name():
+    sheet = pe.Sheet(orders(), name_columns_by_row=0)
+    result = sheet.aggregate(
+        by="customer",
+        sum="quantity",
+        count=True,
+        min="price",
+        max=["quantity", "price"],
+        mean="price",
+    )
+    eq_(
+        result.colnames,
+        [
+            "customer",
+            "sum(quantity)",
+            "count",
+            "min(price)",
+            "max(quantity)",
+            "max(price)",
+            "mean(price)",
+        ],
+    )
+    eq_(
+        list(result.rows()),
+        [["ann", 9, 3, 1.5, 4, 2.5, 2.0], ["bob", 1, 1, 1.5, 1, 1.5, 1.5]],
+    )
+
+
+def test_aggregate_by_several_columns():
+    sheet = pe.Sheet(orders(), name_columns_by_row=0, storage="columnar")
+    result = sheet.aggregate(by=["customer", 1], sum=2, count="price")
+    eq_(result.colnames, ["customer", "item", "sum(quantity)", "count(price)"])
+    eq_(
+        list(result.rows()),
+        [["ann", "pen", 6, 2], ["bob", "pen", 1, 1], ["ann", "ink", 3, 0]],
+    )
+
+
+def test_aggregate_all_rows():
+    sheet = pe.Sheet(orders()[1:])
+    result = sheet.aggregate(sum=2, mean=3)
+    eq_(result.colnames, ["sum(2)", "mean(3)"])
+    eq_(list(result.rows()), [[10, 11 / 6]])
+
+
+def test_empty_group_measures():
+    sheet = pe.Sheet([["a", "b"], ["x", ""]], name_columns_by_row=0)
+    result = sheet.aggregate(by="a", min="b", mean="b", sum="b")
+    eq_(result.colnames, ["a", "sum(b)", "min(b)", "mean(b)"])
+    eq_(list(result.rows()), [["x", 0, "", ""]])
+
+
+def test_stream_aggregate():
+    stream = pe.iget_book(array=orders())[0].with_headers()
+    result = stream.aggregate(by="item", sum="quantity")
+    eq_(list(result.rows()), [["pen", 7], ["ink", 3]])
+    pe.free_resources()
+
+
+def test_stream_of_ragged_rows():
+    stream = pe.iget_book(array=[["a", 1], ["b"], ["a", 2]])[0]
+    result = stream.aggregate(by=0, sum=1, count=True)
+    eq_(list(result.rows()), [["a", 3, 2], ["b", 0, 1]])
+    pe.free_resources()
+
+
+@raises(ValueError)
+def test_named_column_of_a_sheet_without_names():
+    pe.Sheet(orders()).aggregate(by="customer", sum=2)
+
+
+@raises(ValueError)
+def test_named_measure_of_a_stream_without_names():
+    stream = pe.iget_book(array=orders())[0]
+    try:
+        stream.aggregate(by=0, sum="quantity")
+    finally:
+        pe.free_resources()
+
+
+def test_aggregate_records():
+    records = pe.iget_records(array=orders())
+    result = pe.aggregate_records(records, by="customer", max="price")
+    eq_(list(result.rows()), [["ann", 2.5], ["bob", 1.5]])
+    pe.free_resources()
@@ -0,0 +1,100 @@
+import os
+import asyncio
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pyexcel as pe
+from pyexcel import aio
+
+from .nose_tools import eq_, raises
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+class TestAio:
+    def setup_method(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.folder.name, "data.csv")
+        self.array = [["a", "b"], [1, 2], [3, 4], [5, 6]]
+        pe.save_as(array=self.array, dest_file_name=self.file_name)
+
+    def teardown_method(self):
+        self.folder.cleanup()
+
+    def test_aget_sheet(self):
+        sheet = run(aio.aget_sheet(file_name=self.file_name))
+        eq_(sheet.to_array(), self.array)
+
+    def test_aget_book(self):
+        book = run(aio.aget_book(file_name=self.file_name))
+        eq_(book.to_dict(), {"data.csv": self.array})
+
+    def test_aget_records(self):
+        records = run(aio.aget_records(file_name=self.file_name))
+        eq_([record["b"] for record in records], [2, 4, 6])
+
+    def test_asave_as(self):
+        content = run(
+            aio.asave_as(file_name=self.file_name, dest_file_type="csv")
+        )
+        array = pe.get_array(file_type="csv", file_content=content.getvalue())
+        eq_(array, self.array)
+
+    def test_aiget_records_in_batches(self):
+        records = run(
+            collect(aio.aiget_records(file_name=self.file_name, batch_size=2))
+        )
+        eq_([record["a"] for record in records], [1, 3, 5])
+
+    def test_aiget_records_closed_early(self):
+        async def first():
+            records = aio.aiget_records(file_name=self.file_name)
+            async for record in records:
+                await records.aclose()
+                return record
+
+        eq_(run(first())["a"], 1)
+
+    def test_aiget_records_chunks(self):
+        chunks = run(
+            collect(aio.aiget_records(array=self.array, chunk_size=2))
+        )
+        eq_([len(chunk) for chunk in chunks], [2, 1])
+
+    @raises(ValueError)
+    def test_bad_batch_size(self):
+        run(collect(aio.aiget_records(array=self.array, batch_size=0)))
+
+    def test_set_executor(self):
+        with ThreadPoolExecutor(1) as executor:
+            aio.set_executor(executor)
+            try:
+                sheet = run(aio.aget_sheet(array=self.array))
+            finally:
+                aio.set_executor(None)
+        eq_(sheet.number_of_rows(), 4)
+
+    def test_event_loop_runs_meanwhile(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def read():
+            ticker = asyncio.ensure_future(tick())
+            records = await collect(
+                aio.aiget_records(file_name=self.file_name, batch_size=1)
+            )
+            ticker.cancel()
+            return records
+
+        eq_(len(run(read())), 3)
+        assert len(ticks) >= 3
@@ -0,0 +1,100 @@
+import os
+
+import pyexcel as pe
+from pyexcel.internal.cache import ParsedDataCache
+
+from .nose_tools import eq_
+
+
+class TestParsedDataCache:
+    def setup_method(self):
+        self.file_name = "test_cache.csv"
+        pe.save_as(
+            array=[["a", "b"], [1, 2], [3, 4]],
+            dest_file_name=self.file_name,
+        )
+        pe.enable_cache()
+
+    def teardown_method(self):
+        pe.disable_cache()
+        os.unlink(self.file_name)
+
+    def test_hit_and_miss(self):
+        pe.get_sheet(file_name=self.file_name)
+        pe.get_sheet(file_name=self.file_name)
+        info = pe.cache_info()
+        eq_((info.hits, info.misses, info.entries), (1, 1, 1))
+        pe.get_book(file_name=self.file_name)
+        pe.get_sheet(file_name=self.file_name, start_row=1)
+        eq_(pe.cache_info().misses, 3)
+
+    def test_sheets_are_independent(self):
+        sheet = pe.get_sheet(file_name=self.file_name)
+        sheet[1, 1] = "changed"
+        sheet.row += [[5, 6]]
+        records = pe.get_records(file_name=self.file_name)
+        eq_(records, [{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+        book = pe.get_book(file_name=self.file_name)
+        book[0].column += [["c", 0, 0]]
+        eq_(pe.get_book(file_name=self.file_name)[0].number_of_columns(), 2)
+        eq_(pe.cache_info().hits, 2)
+
+    def test_changed_file_is_read_again(self):
+        pe.get_array(file_name=self.file_name)
+        pe.save_as(array=[[1]], dest_file_name=self.file_name)
+        os.utime(self.file_name, ns=(0, 0))
+        eq_(pe.get_array(file_name=self.file_name), [[1]])
+        eq_(pe.cache_info().misses, 2)
+
+    def test_on_demand_is_not_cached(self):
+        list(pe.iget_array(file_name=self.file_name))
+        pe.free_resources()
+        eq_(pe.cache_info().misses, 0)
+
+    def test_functions_are_not_cached(self):
+        for _ in range(2):
+            array = pe.get_array(
+                file_name=self.file_name, where=lambda row: row[0] != 1
+            )
+            eq_(array, [["a", "b"], [3, 4]])
+        eq_(pe.cache_info()[:2], (0, 0))
+        eq_(pe.cache_info().entries, 0)
+
+    def test_clear(self):
+        pe.get_array(file_name=self.file_name)
+        pe.clear_cache()
+        eq_(pe.cache_info()[:2], (0, 0))
+        eq_(pe.cache_info().entries, 0)
+
+
+def test_eviction():
+    cache = ParsedDataCache(max_entries=2)
+    for key in "abc":
+        cache.put(key, {"sheet": [[key]]})
+    eq_(cache.get("a"), None)
+    eq_(cache.get("b")["sheet"].get_internal_array(), [["b"]])
+    cache.put("d", {"sheet": [[1]]})
+    eq_(cache.get("c"), None)
+    eq_(cache.info().entries, 2)
+
+
+def test_byte_size_limit():
+    cache = ParsedDataCache(max_entries=None, max_bytes=1000)
+    cache.put("big", {"sheet": [[index] for index in range(100)]})
+    eq_(cache.info().entries, 0)
+    cache.put("a", {"sheet": [[1]]})
+    cache.put("b", {"sheet": [[2]]})
+    eq_(cache.info().entries, 2)
+    assert cache.info().nbytes <= 1000
+
+
+def test_content_hash():
+    cache = ParsedDataCache(content_hash=True)
+    file_name = "test_cache_hash.csv"
+    pe.save_as(array=[[1]], dest_file_name=file_name)
+    try:
+        key = cache.key_of("sheet", {"file_name": file_name})
+        os.utime(file_name, ns=(0, 0))
+        eq_(cache.key_of("sheet", {"file_name": file_name}), key)
+    finally:
+        os.unlink(file_name)
@@ -0,0 +1,129 @@
+import gc
+import pickle
+import unittest
+
+import pyexcel as pe
+from pyexcel import Book, Sheet
+
+from .nose_tools import eq_
+
+
+class TestCopyOnWrite(unittest.TestCase):
+    def setUp(self):
+        self.data = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+    def test_clone_shares_until_changed(self):
+        sheet = Sheet(self.data)
+        clone = sheet.clone()
+        assert clone._Matrix__array is sheet._Matrix__array
+        clone[0, 0] = "x"
+        assert clone._Matrix__array is not sheet._Matrix__array
+        eq_(sheet[0, 0], 1)
+        eq_(clone[0, 0], "x")
+
+    def test_original_changes_after_clone(self):
+        sheet = Sheet(self.data)
+        clone = sheet.clone()
+        sheet.row += [[10, 11, 12]]
+        del sheet.column[0]
+        eq_(clone.array, [[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        eq_(sheet.array, [[2, 3], [5, 6], [8, 9], [11, 12]])
+
+    def test_last_holder_does_not_copy(self):
+        sheet = Sheet(self.data)
+        clone = sheet.clone()
+        lines = sheet._Matrix__array
+        clone.row[0] = ["a", "b", "c"]
+        sheet.row[0] = ["d", "e", "f"]
+        assert sheet._Matrix__array is lines
+        eq_(clone.row[0], ["a", "b", "c"])
+
+    def test_dropped_clone_is_not_counted(self):
+        sheet = Sheet(self.data)
+        clone = sheet.clone()
+        del clone
+        gc.collect()
+        lines = sheet._Matrix__array
+        sheet[0, 0] = "x"
+        assert sheet._Matrix__array is lines
+
+    def test_pickled_clone_is_its_own(self):
+        sheet = Sheet(self.data)
+        copied = pickle.loads(pickle.dumps(sheet.clone()))
+        lines = copied._Matrix__array
+        copied[0, 0] = "x"
+        assert copied._Matrix__array is lines
+        eq_(sheet[0, 0], 1)
+
+    def test_array_of_clone_is_its_own(self):
+        sheet = Sheet(self.data)
+        clone = sheet.clone()
+        clone.array[1][1] = "x"
+        eq_(sheet[1, 1], 5)
+        eq_(clone[1, 1], "x")
+
+    def test_columnar_clone(self):
+        sheet = Sheet(self.data, storage="columnar")
+        clone = sheet.clone()
+        clone.column.format(0, str)
+        eq_(sheet.column[0], [1, 4, 7])
+        eq_(clone.column[0], ["1", "4", "7"])
+        eq_(sheet.dtypes[0], int)
+
+    def test_transpose_clone(self):
+        sheet = Sheet(self.data)
+        clone = sheet.clone()
+        clone.transpose()
+        clone[0, 1] = "x"
+        eq_(sheet.array, self.data)
+        eq_(clone.row[0], [1, "x", 7])
+
+    def test_rows_of_transposed_sheet_are_stored(self):
+        sheet = Sheet(self.data)
+        sheet.transpose()
+        for row in sheet.rows():
+            row[0] = "x"
+        for row in sheet.rrows():
+            row[1] = "y"
+        eq_(sheet.array, [["x", "y", 7], ["x", "y", 8], ["x", "y", 9]])
+
+    def test_row_is_a_copy(self):
+        sheet = Sheet(self.data)
+        row = sheet.row[0]
+        row[0] = "x"
+        eq_(sheet[0, 0], 1)
+
+    def test_extend_rows_keeps_caller_rows(self):
+        rows = [[10, 11]]
+        sheet = Sheet(self.data)
+        sheet.row += rows
+        eq_(rows, [[10, 11]])
+        sheet[3, 0] = "x"
+        eq_(rows, [[10, 11]])
+
+    def test_sheet_plus_sheet(self):
+        sheet1 = Sheet(self.data, name="a")
+        sheet2 = Sheet([[0]], name="b")
+        book = sheet1 + sheet2
+        book["a"][0, 0] = "x"
+        book["b"][0, 0] = "y"
+        eq_(sheet1[0, 0], 1)
+        eq_(sheet2[0, 0], 0)
+
+    def test_book_plus_book(self):
+        book1 = Book({"a": [[1, 2]], "b": [[3, 4]]})
+        book2 = pe.get_book(bookdict={"c": [["h"], [5]], "d": [[6]]})
+        book2["c"].name_columns_by_row(0)
+        book3 = book1 + book2
+        book3["a"][0, 0] = "x"
+        book3["c"][1, 0] = "y"
+        eq_(book1["a"].array, [[1, 2]])
+        eq_(book2["c"].array, [["h"], [5]])
+        eq_(book3["c"].array, [["h"], ["y"]])
+
+    def test_book_iadd(self):
+        book1 = Book({"a": [[1, 2]]})
+        sheet = Sheet([[3]], name="b")
+        book1 += sheet
+        book1["b"][0, 0] = "x"
+        eq_(sheet[0, 0], 3)
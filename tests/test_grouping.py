@@ -0,0 +1,79 @@
+import pyexcel as pe
+
+from .nose_tools import eq_
+
+ORDERS = [
+    ["customer", "item", "quantity"],
+    ["ann", "pen", 2],
+    ["bob", "pen", 1],
+    ["ann", "ink", 3],
+    ["ann", "pen", 4],
+]
+
+
+def orders():
+    return [list(row) for row in ORDERS]
+
+
+def test_group_rows_by_column_name():
+    sheet = pe.Sheet(orders())
+    book = sheet.group_rows_by_column("customer")
+    eq_(book.sheet_names(), ["ann", "bob"])
+    eq_(
+        book["ann"].to_array(),
+        [ORDERS[0], ORDERS[1], ORDERS[3], ORDERS[4]],
+    )
+    eq_(book["bob"].to_array(), [ORDERS[0], ORDERS[2]])
+
+
+def test_group_rows_by_column_index():
+    book = pe.Sheet(orders()[1:]).group_rows_by_column(1)
+    eq_(book["pen"].to_array(), [ORDERS[1], ORDERS[2], ORDERS[4]])
+    eq_(book["ink"].to_array(), [ORDERS[3]])
+
+
+def test_group_rows_by_column_index_of_named_sheet():
+    sheet = pe.Sheet(orders(), name_columns_by_row=0)
+    book = sheet.group_rows_by_column(0)
+    eq_(book.sheet_names(), ["customer", "ann", "bob"])
+
+
+def test_numbers_name_the_sheets_of_the_book():
+    book = pe.Sheet([[1, "a"], [2, "b"], [1, "c"]]).group_rows_by_column(0)
+    eq_(book.sheet_names(), ["1", "2"])
+
+
+def test_group_by_several_columns():
+    for storage in ("row", "columnar"):
+        sheet = pe.Sheet(orders(), name_columns_by_row=0, storage=storage)
+        groups = sheet.group_by("customer", 1)
+        eq_(list(groups), [("ann", "pen"), ("bob", "pen"), ("ann", "ink")])
+        eq_(list(groups.sizes().values()), [2, 1, 1])
+        group = groups[("ann", "pen")]
+        eq_(len(group), 2)
+        eq_(list(group), [ORDERS[1], ORDERS[4]])
+        eq_(group.to_sheet().colnames, ORDERS[0])
+        eq_(group.to_sheet().name, "ann, pen")
+
+
+def test_groups_keep_indices_not_rows():
+    sheet = pe.Sheet(orders(), name_columns_by_row=0)
+    group = sheet.group_by("customer")["bob"]
+    eq_(list(group.indices), [1])
+
+
+def test_groups_do_not_see_later_changes():
+    sheet = pe.Sheet(orders(), name_columns_by_row=0)
+    groups = sheet.group_by("customer")
+    sheet[0, 2] = 100
+    eq_(list(groups["ann"])[0], ["ann", "pen", 2])
+    rows = list(groups["ann"])
+    rows[0][2] = 200
+    eq_(sheet[0, 2], 100)
+    eq_(list(groups["ann"])[0], ["ann", "pen", 2])
+
+
+def test_unknown_key():
+    groups = pe.Sheet(orders()[1:]).group_by(0)
+    eq_("carl" in groups, False)
+    eq_(len(groups), 2)
@@ -0,0 +1,168 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase, mock
+from urllib.parse import urlsplit
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pyexcel as pe
+from pyexcel.internal import http_cache
+
+from .nose_tools import eq_
+
+FILES = {}
+
+
+class ValidatingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    downloads = 0
+    not_modified = 0
+    proxied = 0
+
+    def log_message(self, *_):
+        pass
+
+    def setup(self):
+        ValidatingHandler.connections += 1
+        BaseHTTPRequestHandler.setup(self)
+
+    def do_GET(self):
+        if self.path.startswith("http://"):
+            ValidatingHandler.proxied += 1
+            self.path = urlsplit(self.path).path
+        if self.path == "/moved.csv":
+            self.send_response(302)
+            self.send_header("Location", "/data.csv")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body, etag, content_type = FILES[self.path]
+        if etag and self.headers.get("If-None-Match") == etag:
+            ValidatingHandler.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        ValidatingHandler.downloads += 1
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestHttpCache(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ValidatingHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+        cls.url = "http://127.0.0.1:%d/" % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        pe.enable_http_cache(folder=self.folder.name)
+        FILES.clear()
+        FILES["/data.csv"] = (b"1,2\r\n3,4\r\n", '"v1"', "text/csv")
+        ValidatingHandler.connections = 0
+        ValidatingHandler.downloads = 0
+        ValidatingHandler.not_modified = 0
+        ValidatingHandler.proxied = 0
+
+    def tearDown(self):
+        pe.disable_http_cache()
+        self.folder.cleanup()
+
+    def test_unchanged_file_is_read_from_disk(self):
+        for _ in range(3):
+            eq_(pe.get_array(url=self.url + "data.csv"), [[1, 2], [3, 4]])
+        eq_(ValidatingHandler.downloads, 1)
+        eq_(ValidatingHandler.not_modified, 2)
+
+    def test_changed_file_is_downloaded_again(self):
+        pe.get_array(url=self.url + "data.csv")
+        FILES["/data.csv"] = (b"5,6\r\n", '"v2"', "text/csv")
+        eq_(pe.get_array(url=self.url + "data.csv"), [[5, 6]])
+        eq_(ValidatingHandler.downloads, 2)
+
+    def test_connection_is_kept_open(self):
+        for _ in range(3):
+            pe.get_sheet(url=self.url + "data.csv")
+        eq_(ValidatingHandler.connections, 1)
+
+    def test_redirect_is_followed(self):
+        eq_(pe.get_array(url=self.url + "moved.csv"), [[1, 2], [3, 4]])
+        pe.get_array(url=self.url + "moved.csv")
+        eq_(ValidatingHandler.not_modified, 1)
+
+    def test_file_without_validators_is_not_kept(self):
+        FILES["/plain.csv"] = (b"7,8\r\n", None, "text/csv")
+        for _ in range(2):
+            eq_(pe.get_array(url=self.url + "plain.csv"), [[7, 8]])
+        eq_(ValidatingHandler.downloads, 2)
+        eq_(os.listdir(self.folder.name), [])
+
+    def test_connection_is_kept_without_validators(self):
+        FILES["/plain.csv"] = (b"7,8\r\n", None, "text/csv")
+        for _ in range(2):
+            eq_(pe.get_array(url=self.url + "plain.csv"), [[7, 8]])
+        eq_(pe.get_array(url=self.url + "data.csv"), [[1, 2], [3, 4]])
+        eq_(ValidatingHandler.connections, 1)
+
+    def test_connection_is_not_shared_while_read(self):
+        FILES["/plain.csv"] = (b"7,8\r\n", None, "text/csv")
+        rows = pe.iget_array(url=self.url + "plain.csv")
+        eq_(pe.get_array(url=self.url + "data.csv"), [[1, 2], [3, 4]])
+        eq_(list(rows), [[7, 8]])
+        pe.free_resources()
+
+    def test_oldest_files_go_beyond_max_bytes(self):
+        pe.enable_http_cache(folder=self.folder.name, max_bytes=20)
+        FILES["/other.csv"] = (b"9,10,11,12\r\n", '"o1"', "text/csv")
+        pe.get_array(url=self.url + "data.csv")
+        pe.get_array(url=self.url + "other.csv")
+        eq_(len(os.listdir(self.folder.name)), 2)
+        pe.get_array(url=self.url + "data.csv")
+        eq_(ValidatingHandler.downloads, 3)
+
+    def test_expired_files_are_downloaded_again(self):
+        pe.enable_http_cache(folder=self.folder.name, ttl=-1)
+        pe.get_array(url=self.url + "data.csv")
+        pe.get_array(url=self.url + "data.csv")
+        eq_(ValidatingHandler.downloads, 2)
+        eq_(ValidatingHandler.not_modified, 0)
+
+    def test_xlsx_is_parsed_from_disk(self):
+        content = pe.Sheet([[1, 2]]).xlsx
+        FILES["/sheet.xlsx"] = (content, '"x1"', "application/octet-stream")
+        for _ in range(2):
+            eq_(pe.get_array(url=self.url + "sheet.xlsx"), [[1, 2]])
+        eq_(ValidatingHandler.not_modified, 1)
+
+    def test_proxy_is_used(self):
+        with mock.patch.dict(os.environ, {"http_proxy": self.url}):
+            for _ in range(2):
+                eq_(
+                    pe.get_array(url="http://data.invalid/data.csv"),
+                    [[1, 2], [3, 4]],
+                )
+        eq_(ValidatingHandler.proxied, 2)
+        eq_(ValidatingHandler.not_modified, 1)
+
+    def test_clear_http_cache(self):
+        pe.get_array(url=self.url + "data.csv")
+        pe.clear_http_cache()
+        eq_(os.listdir(self.folder.name), [])
+
+
+def test_http_cache_is_off_by_default():
+    eq_(http_cache.HTTP_CACHE, None)
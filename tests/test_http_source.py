@@ -1,5 +1,11 @@
+import os
+import tempfile
+import threading
 from textwrap import dedent
+from functools import partial
 from unittest import TestCase
+from itertools import islice
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from unittest.mock import MagicMock, patch
 
 import pyexcel as pe
@@ -51,3 +57,87 @@ class TestHttpBookSource(TestCase):
         +---+---+---+""",
         ).strip("\n")
         self.assertEqual(str(sheet), content)
+
+
+class StreamingHandler(SimpleHTTPRequestHandler):
+    rows_sent = 0
+
+    def log_message(self, *_):
+        pass
+
+    def do_GET(self):
+        if not self.path.startswith("/endless.csv"):
+            return SimpleHTTPRequestHandler.do_GET(self)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.end_headers()
+        try:
+            for row in range(ENDLESS_ROWS):
+                self.wfile.write(f"{row},{row * 2}\r\n".encode("utf-8"))
+                StreamingHandler.rows_sent = row + 1
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+ENDLESS_ROWS = 2000000
+
+
+class TestLocalHttpServer(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = tempfile.TemporaryDirectory()
+        handler = partial(StreamingHandler, directory=cls.folder.name)
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+        cls.url = "http://127.0.0.1:%d/" % cls.server.server_address[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.folder.cleanup()
+
+    def test_csv(self):
+        rows = [[row, "a,b\r\nc", row / 2] for row in range(1000)]
+        pe.save_as(
+            array=rows,
+            dest_file_name=os.path.join(self.folder.name, "some.csv"),
+        )
+        self.assertEqual(pe.get_array(url=self.url + "some.csv"), rows)
+
+    def test_csv_on_demand(self):
+        rows = pe.iget_array(url=self.url + "endless.csv")
+        self.assertEqual(list(islice(rows, 3)), [[0, 0], [1, 2], [2, 4]])
+        pe.free_resources()
+        self.assertLess(StreamingHandler.rows_sent, ENDLESS_ROWS)
+
+    def test_records_on_demand(self):
+        pe.save_as(
+            array=[["name", "age"], ["a", 1], ["b", 2]],
+            dest_file_name=os.path.join(self.folder.name, "records.tsv"),
+        )
+        records = pe.iget_records(url=self.url + "records.tsv")
+        self.assertEqual(
+            list(records), [{"name": "a", "age": 1}, {"name": "b", "age": 2}]
+        )
+        pe.free_resources()
+
+    def test_xlsx_is_spooled_to_disk(self):
+        book = {"first": [[1, 2]], "second": [["a", "b"]]}
+        pe.save_book_as(
+            bookdict=book,
+            dest_file_name=os.path.join(self.folder.name, "book.xlsx"),
+        )
+        result = pe.get_book_dict(url=self.url + "book.xlsx", spool_size=1)
+        self.assertEqual(dict(result), book)
+
+    def test_xlsx_on_demand(self):
+        pe.save_as(
+            array=[[1, 2], [3, 4]],
+            dest_file_name=os.path.join(self.folder.name, "sheet.xlsx"),
+        )
+        rows = pe.iget_array(url=self.url + "sheet.xlsx")
+        self.assertEqual(list(rows), [[1, 2], [3, 4]])
+        pe.free_resources()
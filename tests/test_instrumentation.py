@@ -0,0 +1,149 @@
+import os
+import tempfile
+import tracemalloc
+from unittest import TestCase
+
+import pyexcel as pe
+from pyexcel.internal.instrumentation import stage
+
+from .nose_tools import eq_
+
+
+def measure(function, **keywords):
+    measurements = []
+    pe.add_timing_listener(measurements.append)
+    try:
+        result = function(**keywords)
+    finally:
+        pe.remove_timing_listener(measurements.append)
+    return result, measurements
+
+
+def stages_of(measurements):
+    return [measurement.stage for measurement in measurements]
+
+
+def test_stages_of_get_sheet():
+    with tempfile.TemporaryDirectory() as folder:
+        file_name = os.path.join(folder, "data.csv")
+        pe.save_as(array=[["a", "b"], [1, 2], [3]], dest_file_name=file_name)
+        _, measurements = measure(
+            pe.get_sheet, file_name=file_name, name_columns_by_row=0
+        )
+        size = os.path.getsize(file_name)
+    eq_(
+        stages_of(measurements),
+        ["resolve", "read", "uniform", "naming", "total"],
+    )
+    read = measurements[1]
+    eq_(read.call, "get_sheet")
+    eq_((read.rows, read.cells, read.nbytes), (3, 5, size))
+    uniform = measurements[2]
+    eq_((uniform.rows, uniform.cells), (3, 6))
+
+
+def test_nested_calls_are_named_after_the_outer_one():
+    _, measurements = measure(pe.get_records, array=[["a"], [1]])
+    eq_({measurement.call for measurement in measurements}, {"get_records"})
+    eq_(stages_of(measurements).count("total"), 1)
+
+
+def test_bytes_rendered_to_memory():
+    content, measurements = measure(
+        pe.save_as, array=[[1, 2]], dest_file_type="csv"
+    )
+    render = measurements[stages_of(measurements).index("render")]
+    eq_((render.rows, render.cells), (1, 2))
+    eq_(render.nbytes, len(content.getvalue()))
+
+
+def test_rows_read_on_demand_are_counted_when_pulled():
+    rows, measurements = measure(pe.iget_array, array=[[1, 2], [3, 4]])
+    eq_(stages_of(measurements), ["resolve", "read", "total"])
+    eq_(measurements[1].rows, None)
+    pe.add_timing_listener(measurements.append)
+    try:
+        eq_(list(rows), [[1, 2], [3, 4]])
+    finally:
+        pe.remove_timing_listener(measurements.append)
+    rows_pulled = measurements[-1]
+    eq_((rows_pulled.call, rows_pulled.stage), ("iget_array", "rows"))
+    eq_((rows_pulled.rows, rows_pulled.cells), (2, 4))
+
+
+def test_iget_records_is_measured_until_its_first_record():
+    records, measurements = measure(
+        lambda: list(pe.iget_records(array=[["a"], [1], [2]]))
+    )
+    eq_(records, [{"a": 1}, {"a": 2}])
+    eq_(stages_of(measurements)[-1], "rows")
+    eq_(measurements[-1].call, "iget_records")
+
+
+def test_nothing_is_measured_without_listeners():
+    eq_(stage("read"), None)
+
+
+def test_timing_collector():
+    with pe.TimingCollector() as timings:
+        pe.get_array(array=[[1, 2], [3, 4]])
+        pe.get_array(array=[[5]])
+    eq_(timings.totals[("get_array", "total")]["count"], 2)
+    eq_(timings.totals[("get_array", "rows")]["cells"], 5)
+    lines = timings.breakdown().split("\n")
+    eq_(
+        lines[0].split(),
+        ["call", "stage", "count", "seconds", "rows", "cells", "bytes"],
+    )
+    eq_(len(lines), 1 + len(timings.totals))
+    pe.get_array(array=[[1]])
+    eq_(timings.totals[("get_array", "total")]["count"], 2)
+
+
+class TestMemoryTracking(TestCase):
+    def setUp(self):
+        pe.enable_memory_tracking()
+
+    def tearDown(self):
+        pe.disable_memory_tracking()
+
+    def test_peak_and_cells_returned(self):
+        _, measurements = measure(
+            pe.get_records, array=[["a", "b"], [1, 2], [3, 4]]
+        )
+        memory = measurements[-1]
+        eq_((memory.call, memory.stage), ("get_records", "memory"))
+        eq_((memory.rows, memory.cells), (2, 4))
+        assert memory.nbytes > 0
+
+    def test_on_demand_read_is_traced_until_pulled(self):
+        rows, measurements = measure(pe.iget_array, array=[[1, 2], [3, 4]])
+        eq_(stages_of(measurements), ["resolve", "read", "total"])
+        pe.add_timing_listener(measurements.append)
+        try:
+            list(rows)
+        finally:
+            pe.remove_timing_listener(measurements.append)
+        memory = measurements[-1]
+        eq_((memory.call, memory.stage), ("iget_array", "memory"))
+        eq_((memory.rows, memory.cells), (2, 4))
+
+    def test_records_pulled(self):
+        records, measurements = measure(
+            lambda: list(pe.iget_records(array=[["a"], [1], [2]]))
+        )
+        memory = measurements[-1]
+        eq_((memory.call, memory.stage), ("iget_records", "memory"))
+        eq_(memory.rows, 2)
+
+    def test_books_and_dictionaries(self):
+        _, measurements = measure(
+            pe.get_book_dict, bookdict={"a": [[1, 2]], "b": [[3]]}
+        )
+        eq_(measurements[-1][3:5], (2, 3))
+        _, measurements = measure(pe.get_dict, array=[["a", "b"], [1, 2]])
+        eq_(measurements[-1][3:5], (1, 2))
+
+    def test_tracing_stops_with_tracking(self):
+        pe.disable_memory_tracking()
+        eq_(tracemalloc.is_tracing(), False)
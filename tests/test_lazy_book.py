@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+import pyexcel as pe
+from pyexcel._compact import OrderedDict
+from pyexcel.internal import garbagecollector as gc
+
+from .nose_tools import eq_, raises
+
+
+class TestLazyBook:
+    def setup_method(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.folder.name, "book.xls")
+        self.content = OrderedDict(
+            (f"Sheet{index}", [[index, index * 2], [index * 3, index * 4]])
+            for index in range(4)
+        )
+        pe.save_book_as(bookdict=self.content, dest_file_name=self.file_name)
+
+    def teardown_method(self):
+        self.folder.cleanup()
+
+    def test_sheets_are_read_when_asked_for(self):
+        with pe.LazyBook(file_name=self.file_name) as book:
+            eq_(book.sheet_names(), list(self.content))
+            eq_(book.loaded_sheet_names(), [])
+            eq_(book["Sheet2"].to_array(), self.content["Sheet2"])
+            eq_(book[0].to_array(), self.content["Sheet0"])
+            eq_(book.loaded_sheet_names(), ["Sheet2", "Sheet0"])
+            assert book["Sheet2"] is book.sheet_by_name("Sheet2")
+
+    def test_files_are_the_book_s_own(self):
+        gc.free_resources()
+        book = pe.LazyBook(file_name=self.file_name)
+        eq_(len(gc.GARBAGE), 0)
+        eq_(len(book), 4)
+        eq_([sheet.name for sheet in book], list(self.content))
+        book.close()
+
+    def test_least_recently_used_sheets_are_dropped(self):
+        book = pe.LazyBook(file_name=self.file_name, max_sheets=2)
+        first = book["Sheet0"]
+        book["Sheet1"]
+        book["Sheet0"]
+        book["Sheet3"]
+        eq_(book.loaded_sheet_names(), ["Sheet0", "Sheet3"])
+        first[0, 0] = "changed"
+        book["Sheet1"]
+        book.close()
+        eq_(book.loaded_sheet_names(), ["Sheet3", "Sheet1"])
+        eq_(book["Sheet0"][0, 0], 0)
+
+    def test_save_as(self):
+        output = os.path.join(self.folder.name, "output.xls")
+        book = pe.LazyBook(file_name=self.file_name)
+        book["Sheet1"][0, 0] = "changed"
+        book.save_as(output)
+        expected = OrderedDict(self.content)
+        expected["Sheet1"] = [["changed", 2], [3, 4]]
+        eq_(pe.get_book_dict(file_name=output), expected)
+
+    def test_unread_sheets_are_read_again_after_close(self):
+        book = pe.LazyBook(file_name=self.file_name)
+        book.close()
+        eq_(book.to_book().to_dict(), self.content)
+
+    def test_memory_source(self):
+        content = {"b": [[1, 2], [3]], "a": [[4]]}
+        book = pe.LazyBook(bookdict=content)
+        eq_(book.sheet_names(), ["a", "b"])
+        eq_(book["b"].to_array(), [[1, 2], [3, ""]])
+        eq_(book.csv, pe.get_book(bookdict=content).csv)
+
+    def test_memory_source_is_read_again(self):
+        content = {"a": [[1, 2], [3]], "b": [[4]]}
+        book = pe.LazyBook(bookdict=content, max_sheets=1)
+        book["a"][0, 0] = "changed"
+        book["b"]
+        eq_(book["a"].to_array(), [[1, 2], [3, ""]])
+        eq_(content, {"a": [[1, 2], [3]], "b": [[4]]})
+
+    @raises(IndexError)
+    def test_unknown_sheet_index(self):
+        pe.LazyBook(file_name=self.file_name)[4]
+
+    @raises(KeyError)
+    def test_unknown_sheet(self):
+        pe.LazyBook(file_name=self.file_name)["no such sheet"]
+
+    def test_content_set_later(self):
+        book = pe.LazyBook(file_name=self.file_name, max_sheets=1)
+        book["Sheet0"]
+        book.csv = "1,2\n"
+        eq_(book.sheet_names(), ["csv"])
+        eq_(book["csv"].to_array(), [[1, 2]])
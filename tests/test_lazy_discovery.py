@@ -0,0 +1,105 @@
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+import pyexcel as pe
+
+from .nose_tools import eq_
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json
+import pyexcel
+from pyexcel.internal.plugins import PENDING_DISCOVERY
+
+pending = len(PENDING_DISCOVERY)
+has_attribute = "xlsx" in dir(pyexcel.Sheet)
+sheet = pyexcel.Sheet([[1, 2]])
+content = sheet.csv
+sheet.csv = "3,4"
+print(json.dumps([pending, has_attribute, content, sheet.array]))
+"""
+
+
+def probe(cache_file, lazy="1"):
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [ROOT, environment.get("PYTHONPATH", "")]
+    )
+    environment["PYEXCEL_LAZY_PLUGINS"] = lazy
+    environment["PYEXCEL_PLUGIN_CACHE"] = cache_file
+    output = subprocess.check_output(
+        [sys.executable, "-c", PROBE], env=environment, cwd=ROOT
+    )
+    return json.loads(output)
+
+
+def test_first_lazy_run_finds_plugins_and_keeps_them():
+    with tempfile.TemporaryDirectory() as folder:
+        cache_file = os.path.join(folder, "cache", "plugins.json")
+        eq_(probe(cache_file), [0, True, "1,2\r\n", [[3, 4]]])
+        with open(cache_file) as record_file:
+            record = json.load(record_file)
+        assert "pyexcel_io" in record["modules"]
+        assert "xlsx" in record["attributes"]["sheet"]["read-write"]
+
+
+def test_later_lazy_runs_find_plugins_on_first_use():
+    with tempfile.TemporaryDirectory() as folder:
+        cache_file = os.path.join(folder, "plugins.json")
+        probe(cache_file)
+        eq_(probe(cache_file), [1, True, "1,2\r\n", [[3, 4]]])
+
+
+def test_stale_cache_is_written_again():
+    with tempfile.TemporaryDirectory() as folder:
+        cache_file = os.path.join(folder, "plugins.json")
+        with open(cache_file, "w") as record_file:
+            stale = {"key": "stale", "modules": [], "attributes": {}}
+            json.dump(stale, record_file)
+        eq_(probe(cache_file)[0], 0)
+        with open(cache_file) as record_file:
+            assert json.load(record_file)["key"] != "stale"
+
+
+def test_plugins_are_found_on_import_by_default():
+    with tempfile.TemporaryDirectory() as folder:
+        cache_file = os.path.join(folder, "plugins.json")
+        eq_(probe(cache_file, lazy="0")[0], 0)
+        assert not os.path.exists(cache_file)
+
+
+def test_cookbook_is_imported_on_first_use():
+    from pyexcel.cookbook import merge_csv_to_a_book
+
+    assert pe.merge_csv_to_a_book is merge_csv_to_a_book
+    assert "Reader" in dir(pe)
+
+
+def test_star_import_brings_cookbook_and_deprecated_names():
+    names = {}
+    exec("from pyexcel import *", names)
+    assert "merge_all_to_a_book" in names
+    assert "Reader" in names
+
+
+def test_cookbook_waits_for_first_use_in_lazy_mode():
+    with tempfile.TemporaryDirectory() as folder:
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = ROOT
+        environment["PYEXCEL_LAZY_PLUGINS"] = "1"
+        environment["PYEXCEL_PLUGIN_CACHE"] = os.path.join(folder, "p.json")
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, pyexcel;"
+                "print('pyexcel.cookbook' in sys.modules)",
+            ],
+            env=environment,
+            cwd=ROOT,
+        )
+    eq_(output.strip(), b"False")
@@ -0,0 +1,56 @@
+from pyexcel import Sheet
+from pyexcel.internal.sheets.matrix import Matrix
+
+from .nose_tools import eq_
+
+
+class TestWidthTracking:
+    def test_append_rows_one_by_one(self):
+        sheet = Sheet([[1, 2]])
+        for index in range(100):
+            sheet.row += [[index]]
+        eq_(sheet.number_of_rows(), 101)
+        eq_(sheet.number_of_columns(), 2)
+        eq_(sheet.row[-1], [99, ""])
+
+    def test_wider_row_pads_all_rows(self):
+        sheet = Sheet([[1, 2], [3, 4]])
+        sheet.row += [[5, None, 6]]
+        eq_(sheet.array, [[1, 2, ""], [3, 4, ""], [5, "", 6]])
+
+    def test_set_row_with_none(self):
+        sheet = Sheet([[1, 2], [3, 4]])
+        sheet.row[0] = [None, 7]
+        eq_(sheet.array, [["", 7], [3, 4]])
+        sheet.row[1] = [8, 9, None, 10]
+        eq_(sheet.array, [["", 7, "", ""], [8, 9, "", 10]])
+
+    def test_extend_columns_with_none(self):
+        sheet = Sheet([[1], [2]])
+        sheet.column += [[None, 3, 4]]
+        eq_(sheet.array, [[1, ""], [2, 3], ["", 4]])
+
+    def test_set_column_beyond_rows(self):
+        sheet = Sheet([[1, 2], [3, 4]])
+        sheet.set_column_at(1, ["a", "b", None, "d"])
+        eq_(sheet.array, [[1, "a"], [3, "b"], ["", ""], ["", "d"]])
+
+    def test_paste(self):
+        sheet = Sheet([[1, 2], [3, 4]])
+        sheet.paste((1, 1), rows=[[5, 6, 7], [8]])
+        eq_(
+            sheet.array,
+            [[1, 2, "", ""], [3, 5, 6, 7], ["", 8, "", ""]],
+        )
+
+    def test_cell_out_of_range(self):
+        matrix = Matrix([[1]])
+        matrix[1, 2] = 3
+        eq_(matrix.get_internal_array(), [[1, "", ""], ["", "", 3]])
+        matrix[0, 1] = 2
+        eq_(matrix.number_of_columns(), 3)
+
+    def test_transpose_empty_columns(self):
+        sheet = Sheet([[], []], storage="columnar")
+        sheet.transpose()
+        eq_(sheet.number_of_rows(), 0)
@@ -0,0 +1,61 @@
+import sys
+from array import array
+
+import pyexcel as pe
+
+from .nose_tools import eq_
+
+POINTER = sys.getsizeof([None]) - sys.getsizeof([])
+
+
+def test_packed_columns_take_their_arrays():
+    sheet = pe.Sheet([[1, 1.5], [2, 2.5]], storage="columnar")
+    eq_(
+        list(sheet.memory_usage().values()),
+        [
+            sys.getsizeof(array("q", [1, 2])),
+            sys.getsizeof(array("d", [1.5, 2.5])),
+        ],
+    )
+
+
+def test_row_storage_counts_cells_and_row_lists():
+    text = "a long string"
+    sheet = pe.Sheet([[text, 1.5], [text, 2.5]])
+    usage = sheet.memory_usage()
+    lists = 2 * sys.getsizeof([])
+    eq_(
+        usage[0],
+        2 * POINTER + sys.getsizeof(text) + lists // 2,
+    )
+    eq_(
+        usage[1],
+        2 * POINTER + sys.getsizeof(1.5) + sys.getsizeof(2.5) + lists // 2,
+    )
+
+
+def test_columns_are_keyed_by_names():
+    sheet = pe.Sheet([["a", "b"], [1, 2]], name_columns_by_row=0)
+    eq_(list(sheet.memory_usage().keys()), ["a", "b"])
+    eq_(list(pe.Sheet([[1, 2]]).memory_usage().keys()), [0, 1])
+
+
+def test_transposed_sheet_takes_the_same_bytes():
+    data = [["x%d" % row, row * 0.5] for row in range(10)]
+    sheet = pe.Sheet(data, storage="columnar")
+    total = sum(sheet.memory_usage().values())
+    sheet.transpose()
+    usage = sheet.memory_usage()
+    eq_(len(usage), 10)
+    eq_(sum(usage.values()), total)
+
+
+def test_empty_sheet():
+    eq_(pe.Sheet().memory_usage(), {})
+
+
+def test_book_memory_usage():
+    book = pe.Book({"one": [[1, 2]], "two": [[1.5]]})
+    usage = book.memory_usage()
+    eq_(list(usage.keys()), ["one", "two"])
+    eq_(usage["one"], sum(book["one"].memory_usage().values()))
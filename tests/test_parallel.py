@@ -0,0 +1,125 @@
+import os
+import pickle
+
+import pyexcel as pe
+from pyexcel.internal.parallel import run_in_workers, imap_in_processes
+from pyexcel.internal.generators import SheetStream
+
+from .nose_tools import eq_, raises
+
+
+def double_numbers(value):
+    if isinstance(value, int):
+        return value * 2
+    return None
+
+
+def test_run_in_workers():
+    items = [-3, 2, -1]
+    eq_(run_in_workers(abs, items), [3, 2, 1])
+    eq_(run_in_workers(abs, items, workers=2), [3, 2, 1])
+    eq_(run_in_workers(abs, items, workers=2, processes=True), [3, 2, 1])
+
+
+def test_imap_in_processes_keeps_the_order():
+    results = imap_in_processes(abs, iter(range(-9, 0)), workers=2)
+    eq_(list(results), list(range(9, 0, -1)))
+    eq_(list(imap_in_processes(abs, [-1, -2], workers=1)), [1, 2])
+
+
+def test_pickle_sheet():
+    sheet = pe.Sheet([["a", "b"], [1, 2]], "x", name_columns_by_row=0)
+    copied = pickle.loads(pickle.dumps(sheet))
+    eq_(copied.name, "x")
+    eq_(copied.column["b"], [2])
+
+
+class TestWorkers:
+    def setup_method(self):
+        self.content = {
+            f"Sheet{index}": [["a", "b"], [index, index * 2]]
+            for index in range(4)
+        }
+        self.file_name = "test_parallel.xls"
+        pe.save_book_as(bookdict=self.content, dest_file_name=self.file_name)
+
+    def teardown_method(self):
+        for file_name in (self.file_name, "test_parallel.texttable"):
+            if os.path.exists(file_name):
+                os.unlink(file_name)
+
+    def test_book(self):
+        book = pe.Book(self.content, workers=2)
+        eq_(book.sheet_names(), list(self.content))
+        eq_(book.to_dict(), self.content)
+
+    def test_get_book(self):
+        book = pe.get_book(file_name=self.file_name, workers=2)
+        eq_(book.to_dict(), self.content)
+
+    def test_save_book_as_text(self):
+        expected = pe.get_book(file_name=self.file_name).get_texttable()
+        pe.save_book_as(
+            file_name=self.file_name,
+            workers=2,
+            dest_file_name="test_parallel.texttable",
+            dest_workers=2,
+        )
+        with open("test_parallel.texttable") as text:
+            eq_(text.read(), expected)
+
+    def test_save_book_as_excel(self):
+        pe.save_book_as(
+            bookdict=self.content,
+            dest_file_name=self.file_name,
+            dest_workers=2,
+        )
+        eq_(pe.get_book_dict(file_name=self.file_name), self.content)
+
+
+class TestParallelMap:
+    def setup_method(self):
+        self.array = [["a", "b"]] + [[index, "x"] for index in range(10)]
+        self.expected = [["a", "b"]] + [
+            [index * 2, "x"] for index in range(10)
+        ]
+
+    def test_sheet(self):
+        sheet = pe.Sheet(self.array)
+        sheet.parallel_map(double_numbers, workers=2, chunk_rows=3)
+        eq_(sheet.to_array(), self.expected)
+
+    def test_columnar_sheet(self):
+        sheet = pe.Sheet(self.array, storage="columnar")
+        sheet.parallel_map(double_numbers, workers=2, chunk_rows=4)
+        eq_(sheet.to_array(), self.expected)
+
+    def test_in_this_process(self):
+        sheet = pe.Sheet(self.array)
+        sheet.parallel_map(lambda value: value * 2, workers=1)
+        eq_(sheet.column[1], ["bb"] + ["xx"] * 10)
+
+    def test_clone_is_left_alone(self):
+        sheet = pe.Sheet(self.array)
+        clone = sheet.clone()
+        sheet.parallel_map(double_numbers, workers=2, chunk_rows=5)
+        eq_(clone.to_array(), self.array)
+
+    def test_pickling_is_measured(self):
+        with pe.TimingCollector() as timings:
+            pe.Sheet(self.array).parallel_map(
+                double_numbers, workers=2, chunk_rows=4
+            )
+        pickled = timings.totals[(None, "pickle")]
+        eq_(pickled["count"], 3)
+        assert pickled["nbytes"] > 0
+
+    def test_stream(self):
+        stream = SheetStream("s", iter(self.array)).with_headers()
+        mapped = stream.parallel_map(double_numbers, workers=2, chunk_rows=3)
+        eq_(mapped.colnames, ["a", "b"])
+        eq_(mapped.array, self.expected)
+
+    @raises(ValueError)
+    def test_bad_chunk_rows(self):
+        pe.Sheet(self.array).parallel_map(double_numbers, chunk_rows=0)
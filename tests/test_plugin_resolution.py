@@ -0,0 +1,47 @@
+from pyexcel.plugins import PyexcelPluginChain, find_file_type_from_file_name
+from pyexcel.renderer import Renderer
+from pyexcel.internal import SOURCE
+from pyexcel.exceptions import FileTypeNotSupported
+from pyexcel.internal.plugins import RESOLUTIONS
+
+from .nose_tools import eq_, raises
+
+
+class ResolutionTestRenderer(Renderer):
+    def render_sheet(self, sheet):
+        self._stream.write("rendered")
+
+
+def test_same_looking_keywords_share_a_plugin():
+    RESOLUTIONS.clear()
+    first = SOURCE.get_source(file_name="a.csv")
+    count = len(RESOLUTIONS)
+    second = SOURCE.get_source(file_name="other/B.CSV")
+    eq_(type(first), type(second))
+    eq_(len(RESOLUTIONS), count)
+
+
+def test_longest_file_type_wins():
+    eq_(find_file_type_from_file_name("a.csv", "read"), "csv")
+    eq_(find_file_type_from_file_name("a.csvz", "read"), "csvz")
+    eq_(find_file_type_from_file_name("b.CSVZ", "read"), "csvz")
+
+
+@raises(FileTypeNotSupported)
+def test_unsupported_file_type():
+    find_file_type_from_file_name("a.unknown", "write")
+
+
+def test_registration_drops_resolutions():
+    file_name = "a.resolution-test-type"
+    SOURCE.get_writable_source(file_name="a.csv")
+    assert RESOLUTIONS
+    PyexcelPluginChain(__name__).add_a_renderer(
+        relative_plugin_class_path="ResolutionTestRenderer",
+        file_types=["resolution-test-type"],
+    )
+    file_type = find_file_type_from_file_name(file_name, "write")
+    eq_(file_type, "resolution-test-type")
+    source = SOURCE.get_writable_source(file_type="resolution-test-type")
+    source.write_data(None)
+    eq_(source.get_content().getvalue(), "rendered")
@@ -0,0 +1,153 @@
+import os
+
+import pyexcel as pe
+from pyexcel.internal.projection import project_rows, push_down_columns
+
+from .db import Base, Session, Signature, engine
+from .nose_tools import eq_
+
+
+def test_project_rows():
+    rows = [["a", "b"], [1, 2], [3]]
+    eq_(list(project_rows(rows, ["b", 0])), [["b", "a"], [2, 1], ["", 3]])
+    eq_(
+        list(project_rows(rows, where=lambda row: row[0] != "a")),
+        [[1, 2], [3]],
+    )
+
+
+def test_push_down_columns():
+    keywords = {}
+    eq_(push_down_columns([3, 1, 3], keywords), [1, 0, 1])
+    skip = keywords["skip_column_func"]
+    eq_([skip(index, 0, -1) for index in range(5)], [-1, 0, -1, 0, 1])
+    keywords = {"start_column": 1}
+    eq_(push_down_columns([3, 1], keywords), [3, 1])
+    eq_(push_down_columns([-1, 1], {}), [-1, 1])
+
+
+class TestFileSource:
+    def setup_method(self):
+        self.file_name = "test_projection.csv"
+        self.data = [["a", "b", "c"], [1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        pe.save_as(array=self.data, dest_file_name=self.file_name)
+
+    def teardown_method(self):
+        os.unlink(self.file_name)
+
+    def test_columns_by_name(self):
+        array = pe.get_array(file_name=self.file_name, columns=["c", "a"])
+        eq_(array, [["c", "a"], [3, 1], [6, 4], [9, 7]])
+
+    def test_columns_by_index_and_where(self):
+        array = pe.get_array(
+            file_name=self.file_name,
+            columns=[1],
+            where=lambda row: row[0] != 5,
+        )
+        eq_(array, [["b"], [2], [8]])
+
+    def test_where_skips_named_header(self):
+        records = pe.get_records(
+            file_name=self.file_name,
+            columns=["a", "b"],
+            where=lambda row: row[0] > 1,
+        )
+        eq_(records, [{"a": 4, "b": 5}, {"a": 7, "b": 8}])
+
+    def test_where_skips_header_of_records(self):
+        records = pe.get_records(
+            file_name=self.file_name, where=lambda row: row[1] > 5
+        )
+        eq_(records, [{"a": 7, "b": 8, "c": 9}])
+
+    def test_where_cannot_drop_header_of_records(self):
+        records = pe.get_records(
+            file_name=self.file_name, where=lambda row: row[0] == 4
+        )
+        eq_(records, [{"a": 4, "b": 5, "c": 6}])
+
+    def test_where_skips_header_of_iget_records(self):
+        records = pe.iget_records(
+            file_name=self.file_name, where=lambda row: row[2] < 4
+        )
+        eq_(list(records), [{"a": 1, "b": 2, "c": 3}])
+        pe.free_resources()
+
+    def test_on_demand(self):
+        rows = pe.iget_array(file_name=self.file_name, columns=["b"])
+        eq_(list(rows), [["b"], [2], [5], [8]])
+        pe.free_resources()
+
+    def test_memory(self):
+        with open(self.file_name) as f:
+            content = f.read()
+        array = pe.get_array(
+            file_content=content, file_type="csv", columns=[2, 0]
+        )
+        eq_(array, [["c", "a"], [3, 1], [6, 4], [9, 7]])
+
+
+class TestMemorySources:
+    def test_array(self):
+        array = pe.get_array(
+            array=[["a", "b"], [1, 2], [3, 4]],
+            columns=[1],
+            where=lambda row: row[0] != 2,
+        )
+        eq_(array, [["b"], [4]])
+
+    def test_array_records(self):
+        records = pe.get_records(
+            array=[["a", "b"], [1, 2], [3, 4]], where=lambda row: row[0] > 1
+        )
+        eq_(records, [{"a": 3, "b": 4}])
+
+    def test_dict(self):
+        array = pe.get_array(
+            adict={"a": [1, 3], "b": [2, 4]},
+            columns=["b"],
+            where=lambda row: row[0] > 2,
+        )
+        eq_(array, [["b"], [4]])
+
+    def test_records(self):
+        records = pe.get_records(
+            records=[{"a": 1, "b": 2}, {"a": 3, "b": 4}],
+            columns=["b"],
+            where=lambda row: row[0] < 3,
+        )
+        eq_(records, [{"b": 2}])
+
+    def test_bookdict(self):
+        book = pe.get_book_dict(bookdict={"s": [[1, 2], [3, 4]]}, columns=[1])
+        eq_(book, {"s": [[2], [4]]})
+
+
+class TestDbSources:
+    def setup_method(self):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        session = Session()
+        session.add(Signature(X=1, Y=2, Z=3))
+        session.add(Signature(X=4, Y=5, Z=6))
+        session.commit()
+
+    def test_sql(self):
+        array = pe.get_array(
+            session=Session(),
+            table=Signature,
+            columns=["Z", "X"],
+            where=lambda row: row[1] > 1,
+        )
+        eq_(array, [["Z", "X"], [6, 4]])
+
+    def test_query_sets(self):
+        objects = Session().query(Signature).all()
+        array = pe.get_array(
+            column_names=["X", "Y", "Z"],
+            query_sets=objects,
+            columns=["Y"],
+            where=lambda row: row[0] < 5,
+        )
+        eq_(array, [["Y"], [2]])
@@ -1,6 +1,10 @@
-from pyexcel.internal.sheets.extended_list import PyexcelList
+import copy
+import pickle
 
-from .nose_tools import eq_
+from pyexcel import Sheet
+from pyexcel.internal.sheets.extended_list import IndexedList, PyexcelList
+
+from .nose_tools import eq_, raises
 
 
 def test_pyexcel_list():
@@ -12,3 +16,65 @@ def test_pyexcel_list():
         ["counts", 1, 1, 1, 1],
     ]
     eq_(expected, result)
+
+
+def test_indexed_list():
+    names = IndexedList(["a", "b", "a"])
+    eq_(names.index("a"), 0)
+    eq_(names.index("a", 1), 2)
+    assert "b" in names
+    names.append("c")
+    eq_(names.index("c"), 3)
+    names += ["d"]
+    eq_(names.index("d"), 4)
+    names.pop(0)
+    eq_(names.index("a"), 1)
+    del names[0]
+    eq_(names.index("c"), 1)
+    names[0] = "e"
+    assert "a" not in names
+    eq_(names, ["e", "c", "d"])
+
+
+@raises(ValueError)
+def test_indexed_list_missing_item():
+    IndexedList(["a"]).index("b")
+
+
+def test_indexed_list_unhashable_item():
+    names = IndexedList([["a"], "b"])
+    eq_(names.index(["a"]), 0)
+    assert ["a"] in names
+
+
+def test_copies_of_indexed_list_are_indexed_apart():
+    names = IndexedList(["a", "b"])
+    names.index("a")
+    for copied in (
+        copy.copy(names),
+        copy.deepcopy(names),
+        pickle.loads(pickle.dumps(names)),
+    ):
+        copied.append("z")
+        eq_(copied.index("z"), 2)
+        assert "z" not in names
+    eq_(names.index("b"), 1)
+
+
+def test_sheet_names_stay_indexed():
+    sheet = Sheet(
+        [["", "x", "y", "z"], ["a", 1, 2, 3], ["b", 4, 5, 6]],
+        name_columns_by_row=0,
+        name_rows_by_column=0,
+    )
+    eq_(sheet.row["b"], [4, 5, 6])
+    del sheet.column["x"]
+    eq_(sheet.column["z"], [3, 6])
+    sheet.delete_rows([0])
+    eq_(sheet.rownames, ["b"])
+    eq_(sheet.named_row_at("b"), [5, 6])
+    sheet.transpose()
+    eq_(sheet.column["b"], [5, 6])
+    eq_(sheet.row["z"], [6])
+    sheet.colnames = ["c"]
+    eq_(sheet["z", "c"], 6)
@@ -0,0 +1,200 @@
+import unittest
+
+import pyexcel as pe
+from pyexcel import Sheet
+
+from .nose_tools import eq_, raises
+
+
+class TestColumnarStorage(unittest.TestCase):
+    def setUp(self):
+        self.data = [
+            ["Column 1", "Column 2", "Column 3"],
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 9],
+        ]
+
+    def test_storage_attribute(self):
+        eq_(Sheet(self.data).storage, "row")
+        eq_(Sheet(self.data, storage="columnar").storage, "columnar")
+
+    @raises(ValueError)
+    def test_unknown_storage(self):
+        Sheet(self.data, storage="diagonal")
+
+    def test_same_array(self):
+        s = Sheet(self.data, storage="columnar")
+        eq_(s.array, self.data)
+        eq_(s.number_of_rows(), 4)
+        eq_(s.number_of_columns(), 3)
+
+    def test_column_access(self):
+        s = Sheet(self.data, storage="columnar", name_columns_by_row=0)
+        eq_(s.column["Column 2"], [2, 5, 8])
+        eq_(s.column[-1], [3, 6, 9])
+        eq_(s.row[1], [4, 5, 6])
+
+    def test_column_format(self):
+        s = Sheet(self.data, storage="columnar", name_columns_by_row=0)
+        s.column.format("Column 1", str)
+        eq_(s.column["Column 1"], ["1", "4", "7"])
+        eq_(s.row[0], ["1", 2, 3])
+
+    def test_row_format(self):
+        s = Sheet(self.data, storage="columnar", name_columns_by_row=0)
+        s.row.format(0, str)
+        eq_(s.row[0], ["1", "2", "3"])
+        eq_(s.column["Column 3"], ["3", 6, 9])
+
+    def test_delete_columns(self):
+        s = Sheet(self.data, storage="columnar", name_columns_by_row=0)
+        del s.column["Column 2"]
+        eq_(s.colnames, ["Column 1", "Column 3"])
+        eq_(s.array, [["Column 1", "Column 3"], [1, 3], [4, 6], [7, 9]])
+
+    def test_delete_rows(self):
+        s = Sheet(self.data, storage="columnar")
+        del s.row[1, 3]
+        eq_(s.array, [["Column 1", "Column 2", "Column 3"], [4, 5, 6]])
+
+    def test_paste_after_deleting_all_rows(self):
+        s = Sheet([[1, 2, 3, 4]], storage="columnar")
+        s.delete_rows([0])
+        eq_((s.number_of_rows(), s.number_of_columns()), (0, 0))
+        s.paste((0, 0), rows=[[1, 2], [3, 4]])
+        eq_(s.array, [[1, 2], [3, 4]])
+
+    def test_format_a_sheet_of_no_cells(self):
+        for storage in ("row", "columnar"):
+            s = Sheet([[1, 2]], storage=storage)
+            s.delete_rows([0])
+            s.row.format(0, str)
+            s.column.format(0, str)
+            eq_(s.array, [])
+
+    def test_extend_rows(self):
+        s = Sheet(self.data, storage="columnar")
+        s.row += [[10, 11, 12, 13]]
+        eq_(s.number_of_columns(), 4)
+        eq_(s.column[3], ["", "", "", "", 13])
+
+    def test_extend_columns(self):
+        s = Sheet([[1], [2]], storage="columnar")
+        s.column += [[3, 4, 5]]
+        eq_(s.array, [[1, 3], [2, 4], ["", 5]])
+
+    def test_set_row_and_column(self):
+        s = Sheet(self.data, storage="columnar")
+        s.row[1] = ["a", "b"]
+        eq_(s.row[1], ["a", "b", ""])
+        s.column[0] = ["x", "y", "z", "w", "v"]
+        eq_(s.column[0], ["x", "y", "z", "w", "v"])
+        eq_(s.number_of_rows(), 5)
+
+    def test_out_of_range_cell(self):
+        s = Sheet([[1]], storage="columnar")
+        s[2, 3] = 9
+        eq_(s.array, [[1, "", "", ""], ["", "", "", ""], ["", "", "", 9]])
+
+    def test_transpose(self):
+        s = Sheet(self.data, storage="columnar")
+        s.transpose()
+        eq_(s.row[0], ["Column 1", 1, 4, 7])
+        eq_(s.number_of_columns(), 4)
+
+    def test_map_and_format(self):
+        s = Sheet([[1, 2], [3, 4]], storage="columnar")
+        s.map(lambda value: value * 10)
+        eq_(s.array, [[10, 20], [30, 40]])
+        s.format(str)
+        eq_(s.array, [["10", "20"], ["30", "40"]])
+
+    def test_to_dict_and_records(self):
+        s = Sheet(self.data, storage="columnar", name_columns_by_row=0)
+        eq_(s.to_dict()["Column 2"], [2, 5, 8])
+        eq_(list(s.to_records())[0]["Column 3"], 3)
+
+    def test_clone_keeps_storage(self):
+        s = Sheet(self.data, storage="columnar")
+        s2 = s.clone()
+        eq_(s2.storage, "columnar")
+        eq_(s2.to_array(), s.to_array())
+
+    def test_get_sheet_with_storage(self):
+        s = pe.get_sheet(array=self.data, storage="columnar")
+        eq_(s.storage, "columnar")
+        eq_(s.column[1], ["Column 2", 2, 5, 8])
+
+    def test_empty_rows(self):
+        s = Sheet([[]], storage="columnar")
+        eq_(s.array, [[]])
+        eq_(s.number_of_rows(), 1)
+        eq_(s.number_of_columns(), 0)
+
+
+class TestLazyTranspose(unittest.TestCase):
+    def setUp(self):
+        self.data = [[1, 2, 3], [4, 5, 6]]
+
+    def test_transpose_copies_nothing(self):
+        s = Sheet(self.data)
+        lines = s._Matrix__array
+        s.transpose()
+        assert s._Matrix__array is lines
+        eq_(s.storage, "row")
+        eq_(s.row[0], [1, 4])
+        eq_(s.column[1], [4, 5, 6])
+        eq_(s.number_of_rows(), 3)
+        s.transpose()
+        assert s._Matrix__array is lines
+        eq_(s.array, self.data)
+
+    def test_array_lays_out_rows_again(self):
+        s = Sheet(self.data)
+        s.transpose()
+        eq_(s.get_internal_array(), [[1, 4], [2, 5], [3, 6]])
+        assert s._Matrix__array is s.get_internal_array()
+
+    def test_rows_of_a_transposed_sheet(self):
+        s = Sheet(self.data)
+        s.transpose()
+        eq_(list(s.rows()), [[1, 4], [2, 5], [3, 6]])
+        eq_(list(s.rrows()), [[3, 6], [2, 5], [1, 4]])
+        eq_(list(s.columns()), self.data)
+
+    def test_change_a_transposed_sheet(self):
+        s = Sheet(self.data)
+        s.transpose()
+        s[0, 1] = "x"
+        s.row += [[7, 8, 9]]
+        del s.column[0]
+        eq_(s.array, [["x", ""], [5, ""], [6, ""], [8, 9]])
+
+    def test_transpose_before_and_after(self):
+        s = Sheet(self.data, transpose_before=True, transpose_after=True)
+        eq_(s.array, self.data)
+        s = Sheet(
+            [["a", "b"], [1, 2]],
+            transpose_before=True,
+            name_columns_by_row=0,
+        )
+        eq_(s.colnames, ["a", "1"])
+        eq_(s.column["1"], [2])
+
+    def test_columnar_transpose(self):
+        s = Sheet(self.data, storage="columnar")
+        s.transpose()
+        eq_(s.array, [[1, 4], [2, 5], [3, 6]])
+        eq_(list(s.rows()), [[1, 4], [2, 5], [3, 6]])
+        assert all(type(row) is list for row in s.array)
+        s.transpose()
+        eq_(s.dtypes, [int, int, int])
+        eq_(s.array, self.data)
+
+    def test_transpose_empty(self):
+        s = Sheet([[1]])
+        del s.row[0]
+        s.transpose()
+        eq_(s.number_of_rows(), 0)
+        eq_(s.array, [])
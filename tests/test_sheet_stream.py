@@ -1,5 +1,9 @@
 from textwrap import dedent
 
+import pytest
+
+import pyexcel as pe
+
 from pyexcel.internal.common import get_sheet_headers
 from pyexcel.internal.generators import SheetStream
 from pyexcel.plugins.sources.output_to_memory import WriteSheetToMemory
@@ -34,3 +38,92 @@ def test_get_sheet_headers():
     sheet_stream = SheetStream("test", data)
     colnames_array = get_sheet_headers(sheet_stream)
     eq_(colnames_array, ["a", "b", "c"])
+
+
+class TestStreamOperators:
+    def setup_method(self):
+        self.data = [["a", "b", "c"], [1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+    def stream(self):
+        return SheetStream("test", iter(self.data))
+
+    def test_nothing_is_read_until_consumed(self):
+        def rows():
+            yield from self.data
+            raise AssertionError("read past the head")
+
+        stream = SheetStream("test", rows()).with_headers().head(2)
+        eq_(list(stream.payload), self.data[:3])
+
+    def test_headers_are_read_when_consumed(self):
+        read = []
+
+        def rows():
+            for row in self.data:
+                read.append(row)
+                yield row
+
+        stream = (
+            SheetStream("test", rows())
+            .with_headers()
+            .select_columns(["b"])
+            .map(column_functions={"b": str})
+            .rename({"b": "x"})
+        )
+        eq_(read, [])
+        eq_(stream.array, [["x"], ["2"], ["5"], ["8"]])
+
+    def test_column_names_without_a_header_row(self):
+        stream = SheetStream("test", iter(self.data[1:]))
+        stream.colnames = self.data[0]
+        stream = stream.select_columns(["b"])
+        eq_(stream.colnames, ["b"])
+        eq_(stream.array, [[2], [5], [8]])
+
+    def test_chain(self):
+        stream = (
+            self.stream()
+            .with_headers()
+            .filter(lambda row: row[0] > 1)
+            .select_columns(["c", "a"])
+            .map(lambda value: value * 10, column_functions={"a": str})
+            .rename({"c": "z"})
+        )
+        eq_(stream.colnames, ["z", "a"])
+        eq_(stream.array, [["z", "a"], [60, "4"], [90, "7"]])
+
+    def test_empty_stream_has_no_header_row(self):
+        stream = SheetStream("test", iter([])).with_headers()
+        eq_(stream.colnames, [])
+        eq_(stream.select_columns([0]).array, [])
+        eq_(SheetStream("test", iter([])).with_headers().array, [])
+
+    def test_without_headers(self):
+        stream = self.stream().skip(1).head(2).select_columns([2, 0, 5])
+        eq_(stream.array, [[3, 1, ""], [6, 4, ""]])
+
+    def test_map_none_keeps_cell(self):
+        stream = self.stream().skip(1).map(lambda v: None if v > 4 else -v)
+        eq_(stream.array, [[-1, -2, -3], [-4, 5, 6], [7, 8, 9]])
+
+    def test_rename_needs_headers(self):
+        with pytest.raises(ValueError):
+            self.stream().rename({"a": "x"})
+
+    def test_get_sheet_headers(self):
+        stream = self.stream().with_headers().select_columns(["b"])
+        eq_(get_sheet_headers(stream), ["b"])
+        eq_(list(stream.payload), [[2], [5], [8]])
+
+    def test_isave_as(self):
+        stream = self.stream().with_headers().skip(1).select_columns(["b"])
+        io = pe.isave_as(sheet_stream=stream, dest_file_type="csv")
+        eq_(io.getvalue().splitlines(), ["b", "5", "8"])
+
+    def test_chunks(self):
+        chunks = self.stream().with_headers().chunks(2)
+        eq_(list(chunks), [[[1, 2, 3], [4, 5, 6]], [[7, 8, 9]]])
+
+    def test_chunks_need_a_positive_size(self):
+        with pytest.raises(ValueError):
+            self.stream().chunks(0)
@@ -4,6 +4,7 @@ from types import GeneratorType
 from pathlib import Path
 
 import pyexcel as pe
+from pyexcel.internal.garbagecollector import GARBAGE
 
 from .db import Base, Session, Signature, Signature2, engine
 from ._compact import OrderedDict
@@ -169,6 +170,22 @@ class TestiGetArray(unittest.TestCase):
         result = pe.iget_array(records=records)
         eq_(list(result), self.test_data)
 
+    def test_chunk_size(self):
+        result = pe.iget_array(array=self.test_data, chunk_size=2)
+        eq_(list(result), [self.test_data[:2], self.test_data[2:]])
+
+    def test_bad_chunk_size(self):
+        with self.assertRaises(ValueError):
+            pe.iget_array(array=self.test_data, chunk_size=0)
+
+    def test_bad_chunk_size_opens_no_file(self):
+        testfile = "testfile.csv"
+        pe.save_as(array=self.test_data, dest_file_name=testfile)
+        with self.assertRaises(ValueError):
+            pe.iget_array(file_name=testfile, chunk_size=0)
+        eq_(len(GARBAGE), 0)
+        os.unlink(testfile)
+
 
 class TestGetDict(unittest.TestCase):
     def test_get_dict_from_file(self):
@@ -313,6 +330,61 @@ class TestiGetRecords(unittest.TestCase):
         result = pe.iget_records(records=data)
         eq_(list(result), [{"X": 1, "Y": 2, "Z": 3}, {"X": 4, "Y": 5, "Z": 6}])
 
+    def test_custom_headers(self):
+        data = [["X", "Y", "Z"], [1, 2, 3], [4, 5]]
+        result = pe.iget_records(array=data, custom_headers=["Z", "X"])
+        eq_(
+            [list(record.items()) for record in result],
+            [[("Z", 3), ("X", 1)], [("Z", ""), ("X", 4)]],
+        )
+
+    def test_record_types(self):
+        data = [["X", "Y", "Z"], [1, 2, 3], [4, 5]]
+        eq_(
+            list(pe.iget_records(array=data, record_type=dict)),
+            [{"X": 1, "Y": 2, "Z": 3}, {"X": 4, "Y": 5, "Z": ""}],
+        )
+        eq_(
+            list(pe.iget_records(array=data, record_type=tuple)),
+            [(1, 2, 3), (4, 5, "")],
+        )
+        records = list(pe.iget_records(array=data, record_type="namedtuple"))
+        eq_([record.Z for record in records], [3, ""])
+        eq_(records[0]._fields, ("X", "Y", "Z"))
+
+    def test_slots_records(self):
+        data = [["X", "Y", "class", 1], [1, 2, 3, 4]]
+        record = next(pe.iget_records(array=data, record_type="slots"))
+        eq_((record.X, record.Y, record._2, record._3), (1, 2, 3, 4))
+        eq_(record._asdict(), {"X": 1, "Y": 2, "_2": 3, "_3": 4})
+        eq_(repr(record), "Record(X=1, Y=2, _2=3, _3=4)")
+        eq_(hasattr(record, "__dict__"), False)
+
+    def test_record_type_with_custom_headers(self):
+        data = [["X", "Y", "Z"], [1, 2, 3]]
+        result = pe.iget_records(
+            array=data, custom_headers=["Y"], record_type=tuple
+        )
+        eq_(list(result), [(2,)])
+
+    def test_chunk_size(self):
+        data = [["X"], [1], [2], [3]]
+        result = pe.iget_records(array=data, chunk_size=2, record_type=dict)
+        eq_(list(result), [[{"X": 1}, {"X": 2}], [{"X": 3}]])
+
+    def test_bad_chunk_size_opens_no_file(self):
+        testfile = "testfile.csv"
+        pe.save_as(array=[["X"], [1]], dest_file_name=testfile)
+        with self.assertRaises(ValueError):
+            list(pe.iget_records(file_name=testfile, chunk_size=0))
+        eq_(len(GARBAGE), 0)
+        os.unlink(testfile)
+
+    def test_unknown_record_type(self):
+        data = [["X"], [1]]
+        with self.assertRaises(ValueError):
+            list(pe.iget_records(array=data, record_type=list))
+
 
 class TestSavingToDatabase(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,59 @@
+import pytest
+
+from pyexcel import Sheet
+from pyexcel.internal.sheets.transform import map_positions
+
+from .nose_tools import eq_
+
+
+def test_map_positions():
+    lines = [[1, 2, 3], [4, 5, 6]]
+    map_positions(lines, [None, str, None])
+    eq_(lines, [[1, "2", 3], [4, "5", 6]])
+    map_positions(lines, [str, lambda value: None])
+    eq_(lines, [["1", "2", 3], ["4", "5", 6]])
+
+
+class TestBulkMap:
+    def setup_method(self):
+        self.data = [["a", "b", "c"], [1, 2, 3], [4, 5, 6]]
+
+    @pytest.mark.parametrize("storage", ["row", "columnar"])
+    def test_map(self, storage):
+        sheet = Sheet(self.data, storage=storage, name_columns_by_row=0)
+        sheet.map(lambda value: value * 10)
+        eq_(sheet.array, [["a", "b", "c"], [10, 20, 30], [40, 50, 60]])
+
+    @pytest.mark.parametrize("storage", ["row", "columnar"])
+    def test_none_keeps_cell(self, storage):
+        sheet = Sheet(self.data, storage=storage, name_columns_by_row=0)
+        sheet.map(lambda value: value + 1 if value > 3 else None)
+        eq_(sheet.array, [["a", "b", "c"], [1, 2, 3], [5, 6, 7]])
+
+    @pytest.mark.parametrize("storage", ["row", "columnar"])
+    def test_column_functions(self, storage):
+        sheet = Sheet(self.data, storage=storage, name_columns_by_row=0)
+        sheet.map(
+            lambda value: value * 2,
+            column_functions={"a": str, 2: lambda value: -value},
+        )
+        eq_(sheet.array, [["a", "b", "c"], ["1", 4, -3], ["4", 10, -6]])
+        eq_(sheet.dtypes, [object, int, int])
+
+    def test_column_functions_only(self):
+        sheet = Sheet(self.data, name_columns_by_row=0)
+        sheet.map(column_functions={"b": float})
+        eq_(sheet.array, [["a", "b", "c"], [1, 2.0, 3], [4, 5.0, 6]])
+
+    def test_format_mixed_column(self):
+        sheet = Sheet([[1, "2"], [1.5, ""], [True, "x"]])
+        sheet.format(int)
+        eq_(sheet.array, [[1, 2], [1, 0], [True, "x"]])
+
+
+def test_numpy_ufunc_on_packed_column():
+    numpy = pytest.importorskip("numpy")
+    sheet = Sheet([[1, 2.5], [4, 3.5], [9, 4.5]], storage="columnar")
+    sheet.map(numpy.sqrt, column_functions={1: numpy.negative})
+    eq_(sheet.array, [[1.0, -2.5], [2.0, -3.5], [3.0, -4.5]])
+    eq_(sheet.dtypes, [float, float])
@@ -0,0 +1,124 @@
+import datetime
+import unittest
+
+from pyexcel import Sheet
+from pyexcel.internal.sheets.typed_column import TypedColumn, infer_dtype
+
+from .nose_tools import eq_
+
+
+def test_infer_dtype():
+    eq_(infer_dtype([1, 2, 3]), int)
+    eq_(infer_dtype([1.0, 2.5]), float)
+    eq_(infer_dtype([True, False]), bool)
+    eq_(infer_dtype([datetime.date(2020, 1, 1)]), datetime.date)
+    eq_(infer_dtype([1, 2.5]), object)
+    eq_(infer_dtype([True, 1]), object)
+    eq_(infer_dtype([datetime.datetime(2020, 1, 1)]), object)
+    eq_(infer_dtype(["a", "b"]), object)
+    eq_(infer_dtype([]), object)
+
+
+class TestTypedColumn(unittest.TestCase):
+    def test_packed_int(self):
+        column = TypedColumn([1, 2, 3])
+        eq_(column.dtype, int)
+        assert column.is_packed
+        eq_(column.nbytes, 24)
+        eq_(list(column), [1, 2, 3])
+        eq_(column[-1], 3)
+        eq_(column[0:2], [1, 2])
+
+    def test_packed_dates_and_bools(self):
+        dates = [datetime.date(2020, 1, 1), datetime.date(1999, 12, 31)]
+        column = TypedColumn(dates)
+        eq_(column.dtype, datetime.date)
+        eq_(list(column), dates)
+        eq_(column[1], dates[1])
+        bools = TypedColumn([True, False])
+        eq_(bools.dtype, bool)
+        eq_(list(bools), [True, False])
+        assert bools[0] is True
+
+    def test_fallback_on_other_type(self):
+        column = TypedColumn([1, 2, 3])
+        column[1] = "two"
+        eq_(column.dtype, object)
+        assert column.is_packed is False
+        eq_(column.nbytes, None)
+        eq_(list(column), [1, "two", 3])
+
+    def test_fallback_on_overflow(self):
+        column = TypedColumn([1, 2**70])
+        eq_(column.dtype, object)
+        column = TypedColumn([1, 2])
+        column.append(2**70)
+        eq_(column.dtype, object)
+        eq_(list(column), [1, 2, 2**70])
+
+    def test_mutations(self):
+        column = TypedColumn([1.5, 2.5])
+        column += [3.5]
+        column.insert(0, 0.5)
+        del column[1]
+        eq_(list(column), [0.5, 2.5, 3.5])
+        eq_(column.dtype, float)
+        column += [""]
+        eq_(column.dtype, object)
+        eq_(list(column), [0.5, 2.5, 3.5, ""])
+
+    def test_full_slice_assignment_infers_again(self):
+        column = TypedColumn(["1", "2"])
+        eq_(column.dtype, object)
+        column[:] = [1, 2]
+        eq_(column.dtype, int)
+
+    def test_equality(self):
+        eq_(TypedColumn([1, 2]), [1, 2])
+        eq_(TypedColumn([1, 2]), TypedColumn([1, 2]))
+        assert TypedColumn([1, 2]) != [1, 3]
+
+
+class TestSheetDtypes(unittest.TestCase):
+    def setUp(self):
+        self.data = [
+            ["int", "float", "bool", "date", "mixed"],
+            [1, 1.5, True, datetime.date(2020, 1, 1), "a"],
+            [2, 2.5, False, datetime.date(2020, 1, 2), 1],
+        ]
+
+    def test_columnar_dtypes(self):
+        sheet = Sheet(self.data, storage="columnar", name_columns_by_row=0)
+        eq_(
+            sheet.dtypes,
+            [int, float, bool, datetime.date, object],
+        )
+        eq_(sheet.row[1], self.data[2])
+
+    def test_row_dtypes(self):
+        sheet = Sheet(self.data, name_columns_by_row=0)
+        eq_(
+            sheet.dtypes,
+            [int, float, bool, datetime.date, object],
+        )
+
+    def test_format_typed_column(self):
+        sheet = Sheet(self.data, storage="columnar", name_columns_by_row=0)
+        sheet.column.format("int", float)
+        eq_(sheet.column["int"], [1.0, 2.0])
+        eq_(sheet.dtypes[0], float)
+        sheet.column.format("bool", str)
+        eq_(sheet.column["bool"], ["true", "false"])
+        eq_(sheet.dtypes[2], object)
+
+    def test_format_whole_sheet(self):
+        sheet = Sheet([[1, 2], [3, 4]], storage="columnar")
+        sheet.format(str)
+        eq_(sheet.array, [["1", "2"], ["3", "4"]])
+        eq_(sheet.dtypes, [object, object])
+
+    def test_set_cell_of_packed_column(self):
+        sheet = Sheet([[1, 2], [3, 4]], storage="columnar")
+        sheet[0, 0] = "x"
+        eq_(sheet.array, [["x", 2], [3, 4]])
+        eq_(sheet.dtypes, [object, int])